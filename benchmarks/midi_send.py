@@ -0,0 +1,146 @@
+"""
+MIDI send microbenchmark
+
+Measures messages per second through the MIDIManager send path against null ports, so only
+the Python-side encoding and dispatch cost is measured:
+
+- mido: one mido.Message built and sent per message (the previous send path)
+- raw: MIDIManager encoding into its byte buffer and writing through the rtmidi fast path
+- queued: MIDIManager with async_output, measuring the caller-side cost of handing a message
+  to the writer thread (the queue is drained before the timer stops)
+- metered: the raw path with metrics recording enabled, against raw with metrics disabled
+
+Usage:
+    uv run python benchmarks/midi_send.py [iterations]
+"""
+
+import logging
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import mido
+
+# Import the package from this checkout when run as a script, without installing it
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from moog_sub37_mcp.midi.metrics import Metrics
+from moog_sub37_mcp.midi.midi_manager import MIDIManager
+
+
+class NullRtMidiOut:
+    """Stand-in for rtmidi.MidiOut that discards messages."""
+
+    def send_message(self, message: Any) -> None:
+        pass
+
+    def close_port(self) -> None:
+        pass
+
+
+class NullOutput(mido.ports.BaseOutput):
+    """mido output port that discards messages, exposing a null rtmidi handle like the rtmidi backend."""
+
+    def _open(self, **kwargs: Any) -> None:
+        self._rt = NullRtMidiOut()
+
+    def _send(self, msg: mido.Message) -> None:
+        pass
+
+
+def mido_cc(port: NullOutput, channel: int, cc: int, value: int) -> None:
+    port.send(mido.Message('control_change', channel=channel - 1, control=cc, value=value))
+
+
+def mido_high_res_cc(port: NullOutput, channel: int, cc_msb: int, cc_lsb: int, value: int) -> None:
+    for cc, data in ((cc_msb, 0), (cc_lsb, 0), (cc_lsb, value & 0x7F), (cc_msb, value >> 7)):
+        mido_cc(port, channel, cc, data)
+
+
+def mido_nrpn(port: NullOutput, channel: int, nrpn_msb: int, nrpn_lsb: int, value: int) -> None:
+    for cc, data in ((99, nrpn_msb), (98, nrpn_lsb), (6, value >> 7), (38, value & 0x7F)):
+        mido_cc(port, channel, cc, data)
+
+
+def run(name: str, iterations: int, step: Callable[[int], None], per_step: float, unit: str = 'msg') -> float:
+    start = time.perf_counter()
+    for i in range(iterations):
+        step(i)
+    elapsed = time.perf_counter() - start
+    rate = iterations * per_step / elapsed
+    print(f'{name:<40} {rate:>14,.0f} {unit}/s  {elapsed / iterations * 1e6:>8.2f} us/call')
+    return rate
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    logging.basicConfig(level=logging.ERROR)
+
+    port = NullOutput()
+    original_open_output = mido.open_output  # type: ignore[attr-defined]
+    mido.open_output = lambda name: NullOutput()  # type: ignore[attr-defined]
+    mido.open_input = lambda name, **kwargs: (_ for _ in ()).throw(OSError('no input'))  # type: ignore[attr-defined]
+    try:
+        # Unpaced, to measure the send path itself
+        midi = MIDIManager('null', nrpn_running_status=False, high_res_delta=False, bytes_per_second=None)
+        delta = MIDIManager('null', bytes_per_second=None)
+        queued = MIDIManager('null', async_output=True, queue_size=iterations, bytes_per_second=None)
+        metered = MIDIManager(
+            'null', nrpn_running_status=False, high_res_delta=False, bytes_per_second=None, metrics=Metrics()
+        )
+    finally:
+        mido.open_output = original_open_output  # type: ignore[attr-defined]
+
+    print(f'{iterations:,} calls per case\n')
+    print('Full messages (legacy message counts)')
+    run('mido   send_cc', iterations, lambda i: mido_cc(port, 3, 74, i & 0x7F), 1)
+    run('raw    send_cc', iterations, lambda i: midi.send_cc(3, 74, i & 0x7F), 1)
+    run('mido   send_nrpn', iterations, lambda i: mido_nrpn(port, 3, 3, 64, i & 0x3FFF), 4)
+    run('raw    send_nrpn', iterations, lambda i: midi.send_nrpn(3, 3, 64, i & 0x3FFF), 4)
+
+    def burst(i: int) -> None:
+        with midi.burst():
+            for j in range(50):
+                midi.send_nrpn(3, 3, 64 + (j & 7), (i + j) & 0x3FFF)
+
+    run('raw    50 x send_nrpn in one burst', iterations // 50, burst, 200)
+
+    print('\nCalls per second for a control-rate sweep (delta encoding and NRPN running status)')
+    run(
+        'mido   send_high_res_cc (with reset)',
+        iterations,
+        lambda i: mido_high_res_cc(port, 3, 19, 51, i & 0x3FFF),
+        1,
+        'call',
+    )
+    run('raw    send_high_res_cc', iterations, lambda i: delta.send_high_res_cc(3, 19, 51, i & 0x3FFF), 1, 'call')
+    run('mido   send_nrpn', iterations, lambda i: mido_nrpn(port, 3, 3, 64, i & 0x3FFF), 1, 'call')
+    run('raw    send_nrpn', iterations, lambda i: delta.send_nrpn(3, 3, 64, i & 0x3FFF), 1, 'call')
+
+    def queued_nrpn(i: int) -> None:
+        queued.send_nrpn(3, 3, 64, i & 0x3FFF)
+        if i == iterations - 1:
+            queued.flush()
+
+    run('queued send_nrpn', iterations, queued_nrpn, 1, 'call')
+    queued.close()
+
+    print('\nMetrics recording (full messages)')
+    run('raw     send_cc', iterations, lambda i: midi.send_cc(3, 74, i & 0x7F), 1)
+    run('metered send_cc', iterations, lambda i: metered.send_cc(3, 74, i & 0x7F), 1)
+    run('raw     send_nrpn', iterations, lambda i: midi.send_nrpn(3, 3, 64, i & 0x3FFF), 4)
+    run('metered send_nrpn', iterations, lambda i: metered.send_nrpn(3, 3, 64, i & 0x3FFF), 4)
+
+    def metered_burst(i: int) -> None:
+        with metered.burst():
+            for j in range(50):
+                metered.send_nrpn(3, 3, 64 + (j & 7), (i + j) & 0x3FFF)
+
+    run('raw     50 x send_nrpn in one burst', iterations // 50, burst, 200)
+    run('metered 50 x send_nrpn in one burst', iterations // 50, metered_burst, 200)
+
+
+if __name__ == '__main__':
+    main()
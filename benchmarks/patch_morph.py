@@ -0,0 +1,48 @@
+"""
+Patch morph benchmark
+
+Measures the cost of computing one morph tick between two random presets: interpolating
+every continuous parameter and picking the values that changed. The tick uses numpy when
+it is installed and map() over lists otherwise; pass --no-numpy to force the latter.
+
+Usage:
+    uv run python benchmarks/patch_morph.py [ticks] [--no-numpy]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Import the package from this checkout when run as a script, without installing it
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from moog_sub37_mcp.midi import morph
+from moog_sub37_mcp.midi.morph import Morph, is_continuous
+from moog_sub37_mcp.tools.preset_tool import PRESET_PARAMETERS
+
+
+def main() -> None:
+    args = [arg for arg in sys.argv[1:] if arg != '--no-numpy']
+    if '--no-numpy' in sys.argv:
+        morph.np = None
+    ticks = int(args[0]) if args else 10_000
+    rng = random.Random(37)
+
+    continuous = [(spec, rng.randint(0, spec.max_value), rng.randint(0, spec.max_value)) for spec in PRESET_PARAMETERS]
+    continuous = [entry for entry in continuous if is_continuous(entry[0])]
+    discrete = [(spec, 0, 1) for spec in PRESET_PARAMETERS if not is_continuous(spec)]
+    state = Morph(1, 3, continuous, discrete, 1.0, 0.5, 'linear', 50.0, 0)
+
+    changes = 0
+    start = time.perf_counter()
+    for tick in range(ticks):
+        changes += len(state.changes_at(tick * 1_000_000_000 // ticks))
+    elapsed = (time.perf_counter() - start) / ticks
+
+    print(f'{len(continuous)} interpolated, {len(discrete)} switched parameters, numpy: {morph.np is not None}')
+    print(f'{"morph tick":<40} {elapsed * 1e6:>10.3f} us/tick ({changes / ticks:.1f} changes/tick)')
+
+
+if __name__ == '__main__':
+    main()
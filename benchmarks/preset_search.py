@@ -0,0 +1,63 @@
+"""
+Preset library benchmark
+
+Fills a temporary preset library with random presets and measures saving, loading and
+similarity search against all of them:
+
+- full: search on every patch parameter of a preset (a "sounds like" query)
+- section: search on the filter parameters only
+
+The search uses numpy when it is installed and a pure Python scan otherwise.
+
+Usage:
+    uv run python benchmarks/preset_search.py [presets]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Import the package from this checkout when run as a script, without installing it
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from moog_sub37_mcp.midi import preset_library
+from moog_sub37_mcp.midi.preset_library import PresetLibrary
+from moog_sub37_mcp.tools.preset_tool import PRESET_PARAMETERS
+from moog_sub37_mcp.tools.registry import PARAMETERS
+
+
+def run(name: str, repeats: int, step: Callable[[int], Any]) -> float:
+    start = time.perf_counter()
+    for i in range(repeats):
+        step(i)
+    elapsed = (time.perf_counter() - start) / repeats
+    print(f'{name:<40} {elapsed * 1e3:>10.3f} ms/call')
+    return elapsed
+
+
+def main() -> None:
+    presets = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    specs = PRESET_PARAMETERS
+    rng = random.Random(37)
+
+    with tempfile.TemporaryDirectory() as directory:
+        library = PresetLibrary(Path(directory) / 'presets.s37', specs)
+        patches = [{spec.name: rng.randint(spec.min_value, spec.max_value) for spec in specs} for _ in range(presets)]
+
+        print(f'{presets:,} presets of {len(specs)} parameters, numpy: {preset_library.np is not None}\n')
+        run('save_preset', presets, lambda i: library.save(f'preset {i}', patches[i]))
+        run('load_preset', 1_000, lambda i: library.load(f'preset {i % presets}'))
+
+        filters = {spec.name for spec in PARAMETERS.in_section('filter')}
+        section = [{name: value for name, value in patch.items() if name in filters} for patch in patches]
+        run('find_similar_presets (full)', 20, lambda i: library.nearest(patches[i], 5, exclude=f'preset {i}'))
+        run('find_similar_presets (filter section)', 20, lambda i: library.nearest(section[i], 5))
+        library.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Server startup benchmark
+
+Measures, each in a fresh interpreter:
+
+- import: importing the server module, with the slowest modules reported by `python -X importtime`
+- ready: cold start of the server over stdio until it answers `initialize`, and until its first
+  `tools/list` response, i.e. until it is ready for the first tool call
+
+Both the default tool mode and the compact core mode are measured. Without a synth connected the
+MIDI connection fails, which is logged but does not delay readiness.
+
+Usage:
+    uv run python benchmarks/startup.py [runs]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# The server imports the package from this checkout, without installing it
+ROOT = str(Path(__file__).resolve().parent.parent)
+ENV = {**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, (ROOT, os.environ.get('PYTHONPATH'))))}
+
+SERVER = 'from moog_sub37_mcp.main import main; main()'
+
+
+def import_times(top: int = 8) -> None:
+    """Print the total import time of the server module and its slowest imports."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import moog_sub37_mcp.mcp_server.server'],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=ENV,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:') :].split('|')
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+
+    total = next(cumulative for cumulative, _, name in rows if name.strip() == 'moog_sub37_mcp.mcp_server.server')
+    print(f'{"import moog_sub37_mcp.mcp_server.server":<40} {total / 1e3:>10.1f} ms')
+    for cumulative, self_us, name in sorted(rows, key=lambda row: row[1], reverse=True)[:top]:
+        print(f'  {name.strip():<38} {self_us / 1e3:>10.1f} ms self, {cumulative / 1e3:.1f} ms cumulative')
+
+
+def request(process: subprocess.Popen[str], message: dict[str, Any]) -> dict[str, Any]:
+    """Send a JSON-RPC message and wait for the response with the same id."""
+    process.stdin.write(json.dumps(message) + '\n')  # type: ignore[union-attr]
+    process.stdin.flush()  # type: ignore[union-attr]
+    while True:
+        line = process.stdout.readline()  # type: ignore[union-attr]
+        if not line:
+            raise RuntimeError('Server exited before answering')
+        response = json.loads(line)
+        if response.get('id') == message['id']:
+            return response
+
+
+def ready_time(mode: str) -> tuple[float, float, int]:
+    """Seconds from process start to the initialize and first tools/list responses, and the tool count."""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, '-c', SERVER],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        env={**ENV, 'MOOG_SUB37_TOOLS': mode},
+    )
+    try:
+        request(
+            process,
+            {
+                'jsonrpc': '2.0',
+                'id': 1,
+                'method': 'initialize',
+                'params': {
+                    'protocolVersion': '2025-03-26',
+                    'capabilities': {},
+                    'clientInfo': {'name': 'startup-benchmark', 'version': '1'},
+                },
+            },
+        )
+        initialized = time.perf_counter() - start
+        process.stdin.write(json.dumps({'jsonrpc': '2.0', 'method': 'notifications/initialized'}) + '\n')  # type: ignore[union-attr]
+        tools = request(process, {'jsonrpc': '2.0', 'id': 2, 'method': 'tools/list'})['result']['tools']
+        return initialized, time.perf_counter() - start, len(tools)
+    finally:
+        process.kill()
+        process.wait()
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    import_times()
+    print()
+    for mode in ('all', 'core'):
+        results = sorted(ready_time(mode) for _ in range(runs))
+        initialized, ready, tools = results[len(results) // 2]
+        print(f'{f"ready, {mode} tools ({tools})":<40} {ready * 1e3:>10.1f} ms (initialize {initialized * 1e3:.1f} ms)')
+
+
+if __name__ == '__main__':
+    main()
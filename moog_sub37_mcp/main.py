@@ -1,7 +1,8 @@
 import logging
 import sys
+import threading
 
-from moog_sub37_mcp.mcp_server.server import mcp
+from moog_sub37_mcp.mcp_server.server import METRICS_PORT, devices, mcp, metrics, register_tools, supervisors
 from moog_sub37_mcp.midi.midi_manager import MIDIManager
 
 # Configure logging
@@ -9,13 +10,13 @@ logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(leve
 logger = logging.getLogger(__name__)
 
 
-def check_midi_connection():
-    """Verify MIDI connection before starting the server"""
+def check_midi_connection(midi: MIDIManager):
+    """Connect one of the server's MIDI interfaces, reporting the available ports on failure"""
     try:
-        midi = MIDIManager(port_name='Moog Sub 37')
-        if not midi.connected:
-            logger.error('Could not connect to Moog Sub 37. Please check your USB connection.')
-            logger.info(f'Available MIDI ports: {midi.list_ports()}')
+        if not midi.ensure_connected():
+            logger.error(f'Could not connect to {midi.port_query}. Please check your USB connection.')
+            if midi.resolver is None:  # the resolver has logged the ports it looked through
+                logger.info(f'Available MIDI ports: {midi.list_ports()}')
             return False
         logger.info(f'Successfully connected to MIDI device: {midi.output_port}')
         return True
@@ -24,13 +25,33 @@ def check_midi_connection():
         return False
 
 
+def serve_metrics():
+    """Serve the metrics over HTTP if a port is configured"""
+    if metrics is None or not METRICS_PORT:
+        return
+    try:
+        metrics.serve(METRICS_PORT)
+    except OSError as e:
+        logger.error(f'Could not serve metrics on port {METRICS_PORT}: {str(e)}')
+
+
+def prepare_server():
+    """Register the tools and connect MIDI while the MCP transport starts up"""
+    serve_metrics()
+    register_tools()
+    for midi in devices.interfaces():
+        if not check_midi_connection(midi):
+            logger.warning('MIDI connection failed. The server will connect when the synth becomes available.')
+    for supervisor in supervisors:
+        supervisor.start()
+
+
 def main():
     """Entry point for the sub37-mcp command"""
     logger.info('Starting Moog Sub37 MCP server...')
 
-    # Verify MIDI connection before starting server
-    if not check_midi_connection():
-        logger.warning('MIDI connection failed. Server will start but may not function correctly.')
+    # The first tool listing or call waits for this if it is still running
+    threading.Thread(target=prepare_server, name='server-startup', daemon=True).start()
 
     try:
         logger.info('Starting MCP server...')
@@ -38,6 +59,11 @@ def main():
     except Exception as e:
         logger.error(f'ERROR running MCP server: {str(e)}', exc_info=True)
         sys.exit(1)
+    finally:
+        for supervisor in supervisors:
+            supervisor.close()
+        for midi in devices.interfaces():
+            midi.close()
 
 
 if __name__ == '__main__':
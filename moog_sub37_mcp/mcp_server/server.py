@@ -1,34 +1,192 @@
 """
 MCP server configuration and initialization.
+
+The MOOG_SUB37_TOOLS environment variable selects the tools exposed: 'all' (the default)
+registers every tool, 'core' only a compact set of section-level tools and loads the
+others on request through enable_tools. MOOG_SUB37_PORT names the synth's MIDI port, by its
+full name, part of it or ALSA client:port id (default is 'Moog Sub 37'), and
+MOOG_SUB37_PORT_CACHE the file remembering the port it resolved to (empty for no cache).
+MOOG_SUB37_BYTES_PER_SECOND paces the output of each port (default is 3125, the DIN MIDI
+rate; raise it for USB MIDI, or set 0 for no limit).
+MOOG_SUB37_DEVICES lists several instruments instead, e.g. 'lead=Sub 37@3,bass=20:0@5', as
+id=port@channel entries; the tools address them by id with their `device` argument.
+MOOG_SUB37_METRICS=1 collects MIDI traffic and tool call metrics, readable from the
+metrics://sub37 resource in the Prometheus text format, and MOOG_SUB37_METRICS_PORT also
+serves them over HTTP on that local port. MOOG_SUB37_DEDUPE_TTL skips writing a value the
+synth was sent less than that many seconds ago (off by default; the batch tools take
+`force` to send anyway).
+
+Importing this module is cheap: the MIDI port is opened on first use and the tool
+modules are imported and registered by register_tools(), which the server runs before
+the first request that needs the tools if nothing called it earlier.
 """
 
+import importlib
+import os
+import threading
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import Any, Optional
+
 from mcp.server.fastmcp import FastMCP
+from mcp.types import Tool as MCPTool
 
+from moog_sub37_mcp.midi.device_pool import DEFAULT_CHANNEL, DevicePool, parse_devices
+from moog_sub37_mcp.midi.input_listener import InputListener
+from moog_sub37_mcp.midi.metrics import Metrics
 from moog_sub37_mcp.midi.midi_manager import MIDIManager
-from moog_sub37_mcp.tools.amp_tool import register_amp_tools
-from moog_sub37_mcp.tools.arp_tool import register_arp_tools
-from moog_sub37_mcp.tools.filter_tool import register_filter_tools
-from moog_sub37_mcp.tools.fx_tool import register_fx_tools
-from moog_sub37_mcp.tools.glide_tool import register_glide_tools
-from moog_sub37_mcp.tools.global_tool import register_global_tools
-from moog_sub37_mcp.tools.lfo_tool import register_lfo_tools
-from moog_sub37_mcp.tools.mod_tool import register_mod_tools
-from moog_sub37_mcp.tools.osc_tool import register_osc_tools
-
-# Initialize MCP and MIDI
-mcp = FastMCP('Moog Sub 37')
-midi = MIDIManager('Moog Sub 37')
-
-# Register all tools
-register_arp_tools(mcp, midi)
-register_global_tools(mcp, midi)
-register_mod_tools(mcp, midi)
-register_osc_tools(mcp, midi)
-register_lfo_tools(mcp, midi)
-register_fx_tools(mcp, midi)
-register_amp_tools(mcp, midi)
-register_filter_tools(mcp, midi)
-register_glide_tools(mcp, midi)
-
-# Export the configured MCP server
-__all__ = ['mcp']
+from moog_sub37_mcp.midi.port_resolver import PortResolver, default_cache_path
+from moog_sub37_mcp.midi.rate_limiter import DIN_BYTES_PER_SECOND
+from moog_sub37_mcp.midi.supervisor import PortSupervisor
+from moog_sub37_mcp.midi.synth_state import SynthState
+from moog_sub37_mcp.tools.registry import PARAMETERS
+
+# Tool groups, in registration order. Group `name` is registered by register_<name>_tools
+# in moog_sub37_mcp.tools.<name>_tool.
+TOOL_GROUPS = (
+    'arp',
+    'global',
+    'mod',
+    'osc',
+    'lfo',
+    'fx',
+    'amp',
+    'filter',
+    'glide',
+    'batch',
+    'state',
+    'automation',
+    'clock',
+    'sequencer',
+    'preset',
+)
+
+TOOL_MODE = os.environ.get('MOOG_SUB37_TOOLS', 'all')
+PORT_NAME = os.environ.get('MOOG_SUB37_PORT', 'Moog Sub 37')
+PORT_CACHE = os.environ.get('MOOG_SUB37_PORT_CACHE', str(default_cache_path()))
+METRICS_PORT = int(os.environ.get('MOOG_SUB37_METRICS_PORT') or 0)
+METRICS_ENABLED = os.environ.get('MOOG_SUB37_METRICS', '') not in ('', '0') or bool(METRICS_PORT)
+BYTES_PER_SECOND = float(os.environ.get('MOOG_SUB37_BYTES_PER_SECOND') or DIN_BYTES_PER_SECOND) or None
+DEDUPE_TTL = float(os.environ.get('MOOG_SUB37_DEDUPE_TTL') or 0) or None
+DEVICES = parse_devices(os.environ.get('MOOG_SUB37_DEVICES', '')) or [('sub37', PORT_NAME, DEFAULT_CHANNEL)]
+
+
+class DeferredToolsMCP(FastMCP):
+    """FastMCP server registering its tools on first use rather than at import."""
+
+    def __init__(self, name: str, register: Callable[[], None], metrics: Optional[Metrics] = None):
+        """
+        Initialize the server.
+
+        Args:
+            name: Server name
+            register: Registers the tools; called once, before the first tool listing or call.
+            metrics: Registry to record the duration of each tool call into, None records nothing.
+        """
+        super().__init__(name)
+        self._register_tools = register
+        self._tools_lock = threading.Lock()
+        self._tools_registered = False
+        self._tool_seconds = None
+        if metrics is not None:
+            self._tool_seconds = metrics.histogram(
+                'sub37_tool_call_seconds', 'MCP tool call duration, by tool and outcome', ('tool', 'status')
+            )
+
+    def ensure_tools(self) -> None:
+        """Register the tools unless done already, waiting for a registration in progress in another thread."""
+        if self._tools_registered:
+            return
+        with self._tools_lock:
+            if not self._tools_registered:
+                self._register_tools()
+                self._tools_registered = True
+
+    async def list_tools(self) -> list[MCPTool]:
+        self.ensure_tools()
+        return await super().list_tools()
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        self.ensure_tools()
+        if self._tool_seconds is None:
+            return await super().call_tool(name, arguments)
+        start = time.perf_counter()
+        status = 'error'
+        try:
+            result = await super().call_tool(name, arguments)
+            status = 'ok'
+            return result
+        finally:
+            self._tool_seconds.observe(time.perf_counter() - start, (name, status))
+
+
+def register_tool_group(mcp: FastMCP, devices: DevicePool, group: str) -> None:
+    """
+    Import a tool group's module and register its tools.
+
+    Args:
+        mcp: The MCP server instance
+        devices: The instruments
+        group: Name of the group, one of TOOL_GROUPS
+    """
+    module = importlib.import_module(f'moog_sub37_mcp.tools.{group}_tool')
+    getattr(module, f'register_{group}_tools')(mcp, devices)
+
+
+def _register_tools() -> None:
+    if TOOL_MODE == 'core':
+        from moog_sub37_mcp.tools.core_tool import register_core_tools
+
+        groups = {group: partial(register_tool_group, group=group) for group in TOOL_GROUPS}
+        register_core_tools(mcp, devices, groups)
+    else:
+        for group in TOOL_GROUPS:
+            register_tool_group(mcp, devices, group)
+
+
+resolver = PortResolver(Path(PORT_CACHE) if PORT_CACHE else None)
+metrics = Metrics() if METRICS_ENABLED else None
+
+
+def _create_midi(port_name: str) -> MIDIManager:
+    return MIDIManager(
+        port_name,
+        async_output=True,
+        state=SynthState(PARAMETERS),
+        listener=InputListener(PARAMETERS),
+        bytes_per_second=BYTES_PER_SECOND,
+        dedupe_ttl=DEDUPE_TTL,
+        lazy_connect=True,
+        resolver=resolver,
+        metrics=metrics,
+    )
+
+
+# Initialize MCP and MIDI, one interface per port. Ports open on the first message sent, or when
+# main connects them.
+mcp = DeferredToolsMCP('Moog Sub 37', _register_tools, metrics)
+devices = DevicePool.build(DEVICES, _create_midi)
+midi = devices.default.midi
+# Reconnect the ports when a synth is unplugged or power-cycled, once started by main
+supervisors = [PortSupervisor(interface) for interface in devices.interfaces()]
+
+if metrics is not None:
+
+    @mcp.resource(
+        'metrics://sub37',
+        name='metrics',
+        description='MIDI traffic, output queue and tool call metrics in the Prometheus text format',
+        mime_type='text/plain',
+    )
+    def read_metrics() -> str:
+        return metrics.render()  # type: ignore[union-attr]
+
+
+# Register the tools now rather than on the first request
+register_tools = mcp.ensure_tools
+
+# Export the configured MCP server, its instruments with the default one's MIDI interface, the port
+# supervisors and the metrics registry (None unless enabled)
+__all__ = ['devices', 'mcp', 'metrics', 'midi', 'register_tools', 'supervisors']
@@ -0,0 +1,199 @@
+"""
+Parameter Automation
+
+This module ramps parameters from one value to another over time, streaming the
+interpolated values on a fixed-rate time grid through the MIDI event scheduler.
+"""
+
+import itertools
+import math
+import threading
+from collections.abc import Callable
+from typing import Any, Optional
+
+from moog_sub37_mcp.midi.midi_manager import MIDIManager
+from moog_sub37_mcp.midi.parameters import ParameterSpec
+from moog_sub37_mcp.midi.scheduler import ScheduledEvent
+
+# Ramp curves, mapping progress in [0, 1] to a position in [0, 1]
+CURVES: dict[str, Callable[[float], float]] = {
+    'linear': lambda t: t,
+    'exponential': lambda t: math.expm1(4 * t) / math.expm1(4),
+    'logarithmic': lambda t: math.log1p(math.expm1(4) * t) / 4,
+    's_curve': lambda t: t * t * (3 - 2 * t),
+}
+
+DEFAULT_RATE = 50.0
+MAX_RATE = 1000.0
+
+
+class Ramp:
+    """A parameter moving from a start to an end value."""
+
+    def __init__(
+        self,
+        ramp_id: int,
+        spec: ParameterSpec,
+        channel: int,
+        start: int,
+        end: int,
+        duration: float,
+        curve: str,
+        rate: float,
+        started_ns: int,
+    ):
+        self.id = ramp_id
+        self.spec = spec
+        self.channel = channel
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.curve = curve
+        self.period_ns = round(1e9 / rate)
+        self.duration_ns = round(duration * 1e9)
+        self.started_ns = started_ns
+        self.tick = 0  # index of the next update on the ramp's time grid
+        self.value: Optional[int] = None  # last value sent
+        self.sent = 0
+        self.event: Optional[ScheduledEvent] = None  # next scheduled update
+
+    @property
+    def next_ns(self) -> int:
+        """Time of the next update: the next tick of the grid, or the end of the ramp."""
+        return self.started_ns + min(self.tick * self.period_ns, self.duration_ns)
+
+    def value_at(self, elapsed: float) -> int:
+        """Interpolated value `elapsed` seconds after the start."""
+        progress = min(1.0, max(0.0, elapsed / self.duration))
+        return round(self.start + (self.end - self.start) * CURVES[self.curve](progress))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Ramp as a JSON-friendly dict."""
+        return {
+            'id': self.id,
+            'parameter': self.spec.name,
+            'channel': self.channel,
+            'start': self.start,
+            'end': self.end,
+            'duration': self.duration,
+            'curve': self.curve,
+            'rate': round(1e9 / self.period_ns, 3),
+            'value': self.value,
+            'sent': self.sent,
+        }
+
+
+class AutomationEngine:
+    """Runner of any number of simultaneous ramps on the MIDI interface's scheduler."""
+
+    def __init__(self, midi: MIDIManager):
+        """
+        Initialize the engine.
+
+        Args:
+            midi: The MIDI interface the ramps write to.
+        """
+        self.midi = midi
+        self._ramps: dict[tuple[int, str], Ramp] = {}  # by (channel, parameter name)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def start(
+        self,
+        spec: ParameterSpec,
+        channel: int,
+        start: int,
+        end: int,
+        duration: float,
+        curve: str = 'linear',
+        rate: float = DEFAULT_RATE,
+    ) -> Ramp:
+        """
+        Start ramping a parameter, replacing any ramp already running on it.
+
+        Args:
+            spec: The parameter to ramp.
+            channel: MIDI channel (1-16)
+            start: Value at the start of the ramp.
+            end: Value at the end of the ramp.
+            duration: Length of the ramp in seconds.
+            curve: 'linear', 'exponential', 'logarithmic' or 's_curve'.
+            rate: Updates per second.
+
+        Returns:
+            Ramp: The started ramp.
+
+        Raises:
+            ValueError: If an argument is out of range.
+        """
+        for value in (start, end):
+            error = spec.validate(value)
+            if error:
+                raise ValueError(error)
+        if curve not in CURVES:
+            raise ValueError(f'Invalid curve: {curve}. Must be one of {", ".join(CURVES)}.')
+        if duration <= 0:
+            raise ValueError(f'Invalid duration: {duration}. Must be positive.')
+        if not 0 < rate <= MAX_RATE:
+            raise ValueError(f'Invalid rate: {rate}. Must be between 0-{MAX_RATE:g} updates per second.')
+
+        scheduler = self.midi.scheduler
+        ramp = Ramp(next(self._ids), spec, channel, start, end, duration, curve, rate, scheduler.now_ns())
+        with self._lock:
+            replaced = self._ramps.get((channel, spec.name))
+            if replaced is not None and replaced.event is not None:
+                replaced.event.cancel()
+            self._ramps[(channel, spec.name)] = ramp
+            ramp.event = scheduler.schedule_at(ramp.next_ns, self._update, ramp)
+        return ramp
+
+    def stop(self, name: Optional[str] = None, channel: Optional[int] = None) -> list[Ramp]:
+        """
+        Stop ramps, leaving their parameters at their current value.
+
+        Args:
+            name: Only stop ramps of this parameter.
+            channel: Only stop ramps on this MIDI channel (1-16).
+
+        Returns:
+            list: The stopped ramps.
+        """
+        with self._lock:
+            stopped = [
+                ramp
+                for key, ramp in self._ramps.items()
+                if (name is None or key[1] == name) and (channel is None or key[0] == channel)
+            ]
+            for ramp in stopped:
+                del self._ramps[(ramp.channel, ramp.spec.name)]
+                if ramp.event is not None:
+                    ramp.event.cancel()
+        return stopped
+
+    def active(self) -> list[Ramp]:
+        """List the running ramps."""
+        with self._lock:
+            return list(self._ramps.values())
+
+    def _update(self, ramp: Ramp) -> None:
+        """Send the value of the current tick and schedule the next one. Runs on the scheduler thread."""
+        # Values follow the tick's nominal time, so timing jitter does not distort the curve
+        elapsed_ns = ramp.next_ns - ramp.started_ns
+        finished = elapsed_ns >= ramp.duration_ns
+        value = ramp.end if finished else ramp.value_at(elapsed_ns / 1e9)
+        if value != ramp.value:
+            # The last update is forced so the ramp always lands on its end value
+            if ramp.spec.send(self.midi, ramp.channel, value, force=finished):
+                ramp.sent += 1
+            ramp.value = value
+
+        with self._lock:
+            if self._ramps.get((ramp.channel, ramp.spec.name)) is not ramp:
+                return  # stopped or replaced meanwhile
+            if finished:
+                del self._ramps[(ramp.channel, ramp.spec.name)]
+                return
+            # Stay on the time grid, skipping the ticks missed while late
+            late_ticks = (self.midi.scheduler.now_ns() - ramp.started_ns) // ramp.period_ns
+            ramp.tick = max(ramp.tick + 1, late_ticks + 1)
+            ramp.event = self.midi.scheduler.schedule_at(ramp.next_ns, self._update, ramp)
@@ -0,0 +1,249 @@
+"""
+MIDI Clock
+
+This module generates MIDI beat clock (24 pulses per quarter note) to drive the
+tempo-synced LFOs and arpeggiator of the synth. Pulses are scheduled at absolute
+times on a grid anchored where the clock started or last changed tempo, so the
+lateness of one pulse never accumulates into tempo drift.
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Any, Optional
+
+from moog_sub37_mcp.midi.midi_manager import MIDIManager
+from moog_sub37_mcp.midi.scheduler import ScheduledEvent, Scheduler
+
+# Pulses per quarter note of MIDI beat clock
+PPQN = 24
+
+DEFAULT_BPM = 120.0
+MIN_BPM = 20.0
+MAX_BPM = 300.0
+
+# System Real-Time status bytes
+TIMING_CLOCK = 0xF8
+START = 0xFA
+CONTINUE = 0xFB
+STOP = 0xFC
+
+# Pulses over which the tempo and jitter are measured (one 4/4 bar)
+_MEASURED_PULSES = 4 * PPQN
+
+# Falling further behind than this re-anchors the grid instead of sending the missed pulses in a rush
+_MAX_BACKLOG_PULSES = PPQN
+
+
+class MIDIClock:
+    """MIDI clock master running on its own high-priority scheduler thread."""
+
+    def __init__(self, midi: MIDIManager, bpm: float = DEFAULT_BPM, scheduler: Optional[Scheduler] = None):
+        """
+        Initialize the clock, stopped.
+
+        Args:
+            midi: The MIDI interface the clock writes to.
+            bpm: Initial tempo in beats per minute.
+            scheduler: Timeline running the pulses (default is a dedicated real-time priority thread).
+        """
+        error = _validate_bpm(bpm)
+        if error:
+            raise ValueError(error)
+
+        self.midi = midi
+        self.bpm = bpm
+        self.running = False
+        self.pulses = 0  # pulses sent since the last Start
+        self.missed = 0  # pulses skipped after falling too far behind
+        self.errors = 0  # pulses the MIDI interface failed to send
+        self._scheduler = scheduler if scheduler is not None else Scheduler(name='midi-clock', realtime=True)
+
+        # Pulse n is due at anchor_ns + (n - anchor_pulse) * period
+        self._anchor_ns = 0
+        self._anchor_pulse = 0
+        self._run = 0  # incremented on every start/stop, so pulses of an earlier run are ignored
+        self._event: Optional[ScheduledEvent] = None
+        self._lock = threading.Lock()
+
+        # Send times of the recent pulses and their lateness against the grid
+        self._sent_ns: deque[int] = deque(maxlen=_MEASURED_PULSES + 1)
+        self._lateness_ns: deque[int] = deque(maxlen=_MEASURED_PULSES)
+
+    @property
+    def period_ns(self) -> float:
+        """Nominal time between pulses at the current tempo."""
+        return 60e9 / (self.bpm * PPQN)
+
+    def start(self, bpm: Optional[float] = None) -> bool:
+        """
+        Send Start and run the clock from the beginning of the song.
+
+        Args:
+            bpm: Tempo in beats per minute (default is the current tempo).
+
+        Returns:
+            bool: True if the clock started, False if Start could not be sent.
+
+        Raises:
+            ValueError: If the tempo is out of range.
+        """
+        return self._begin(START, bpm, from_start=True)
+
+    def resume(self, bpm: Optional[float] = None) -> bool:
+        """
+        Send Continue and run the clock from where it stopped.
+
+        Args:
+            bpm: Tempo in beats per minute (default is the current tempo).
+
+        Returns:
+            bool: True if the clock resumed, False if Continue could not be sent.
+
+        Raises:
+            ValueError: If the tempo is out of range.
+        """
+        return self._begin(CONTINUE, bpm, from_start=False)
+
+    def stop(self) -> bool:
+        """
+        Stop the pulses and send Stop. The song position is kept for resume().
+
+        Returns:
+            bool: True if Stop was sent, False otherwise.
+        """
+        with self._lock:
+            self._halt()
+            return self.midi.send_realtime(STOP)
+
+    def set_tempo(self, bpm: float) -> None:
+        """
+        Change the tempo, from the next pulse on if the clock is running.
+
+        Args:
+            bpm: Tempo in beats per minute.
+
+        Raises:
+            ValueError: If the tempo is out of range.
+        """
+        error = _validate_bpm(bpm)
+        if error:
+            raise ValueError(error)
+
+        with self._lock:
+            if self.running:
+                # The pending pulse keeps its time; the grid continues from it at the new period
+                self._anchor_ns = self._due_ns(self.pulses)
+                self._anchor_pulse = self.pulses
+                # Measure the new tempo alone
+                self._sent_ns.clear()
+                self._lateness_ns.clear()
+            self.bpm = bpm
+
+    def status(self) -> dict[str, Any]:
+        """
+        Get the clock state and timing metrics.
+
+        Returns:
+            dict: Whether the clock runs, the set tempo, the tempo measured from the pulses sent over the
+                last bar, the song position in pulses and beats, the pulse interval jitter (standard
+                deviation) and lateness against the grid in microseconds, and missed and failed pulses.
+        """
+        with self._lock:
+            sent = list(self._sent_ns)
+            lateness = list(self._lateness_ns)
+            result: dict[str, Any] = {
+                'running': self.running,
+                'bpm': self.bpm,
+                'measured_bpm': None,
+                'pulses': self.pulses,
+                'beats': self.pulses / PPQN,
+                'jitter_us': None,
+                'lateness_mean_us': None,
+                'lateness_max_us': None,
+                'missed': self.missed,
+                'errors': self.errors,
+            }
+
+        if len(sent) > 2:
+            intervals = [b - a for a, b in zip(sent, sent[1:])]
+            mean = sum(intervals) / len(intervals)
+            variance = sum((interval - mean) ** 2 for interval in intervals) / (len(intervals) - 1)
+            result['measured_bpm'] = round(60e9 / (mean * PPQN), 3)
+            result['jitter_us'] = round(math.sqrt(variance) / 1000, 1)
+        if lateness:
+            result['lateness_mean_us'] = round(sum(lateness) / len(lateness) / 1000, 1)
+            result['lateness_max_us'] = round(max(lateness) / 1000, 1)
+        return result
+
+    def close(self) -> None:
+        """Stop the pulses without sending Stop and end the clock thread."""
+        with self._lock:
+            self._halt()
+        self._scheduler.close()
+
+    def _begin(self, status: int, bpm: Optional[float], from_start: bool) -> bool:
+        if bpm is not None:
+            error = _validate_bpm(bpm)
+            if error:
+                raise ValueError(error)
+
+        with self._lock:
+            self._halt()
+            if bpm is not None:
+                self.bpm = bpm
+            if not self.midi.send_realtime(status):
+                return False
+            if from_start:
+                self.pulses = 0
+            self._sent_ns.clear()
+            self._lateness_ns.clear()
+            self.running = True
+            # The first pulse goes out right after Start/Continue and begins the beat
+            self._anchor_ns = self._scheduler.now_ns()
+            self._anchor_pulse = self.pulses
+            self._event = self._scheduler.schedule_at(self._anchor_ns, self._pulse, self._run)
+        return True
+
+    def _halt(self) -> None:
+        """Cancel the pending pulse. Called with the lock held."""
+        self._run += 1
+        self.running = False
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def _due_ns(self, pulse: int) -> int:
+        return self._anchor_ns + round((pulse - self._anchor_pulse) * self.period_ns)
+
+    def _pulse(self, run: int) -> None:
+        """Send one Timing Clock and schedule the next on the grid. Runs on the clock thread."""
+        with self._lock:
+            if run != self._run:
+                return  # stopped or restarted meanwhile
+
+            due_ns = self._due_ns(self.pulses)
+            if self.midi.send_realtime(TIMING_CLOCK):
+                now_ns = self._scheduler.now_ns()
+                self._sent_ns.append(now_ns)
+                self._lateness_ns.append(now_ns - due_ns)
+            else:
+                now_ns = self._scheduler.now_ns()
+                self.errors += 1
+            self.pulses += 1
+
+            # Late pulses are caught up to keep the song position; after a long stall the grid restarts
+            backlog = int((now_ns - self._due_ns(self.pulses)) // self.period_ns)
+            if backlog > _MAX_BACKLOG_PULSES:
+                self.missed += backlog
+                self._anchor_ns = now_ns
+                self._anchor_pulse = self.pulses
+                self._sent_ns.clear()
+            self._event = self._scheduler.schedule_at(self._due_ns(self.pulses), self._pulse, run)
+
+
+def _validate_bpm(bpm: float) -> Optional[str]:
+    """Error message for a tempo out of range, None if valid."""
+    if not MIN_BPM <= bpm <= MAX_BPM:
+        return f'Invalid tempo: {bpm}. Must be between {MIN_BPM:g}-{MAX_BPM:g} BPM.'
+    return None
@@ -0,0 +1,225 @@
+"""
+Device Pool
+
+This module keeps the instruments controlled by one server, each a MIDI interface and
+the channel the instrument listens on, by instrument id. Instruments on different ports
+have their own MIDIManager, and so their own output queue, writer thread and pacing: a
+slow or unplugged unit does not hold up the others. Instruments sharing a port (e.g.
+daisy-chained over MIDI Thru) share its MIDIManager and are told apart by channel.
+"""
+
+import re
+from collections.abc import Callable, Iterator
+from typing import Any, Optional
+
+from moog_sub37_mcp.midi.midi_manager import MIDIManager
+
+DEFAULT_CHANNEL = 3
+
+_DEVICE_ID = re.compile(r'[A-Za-z0-9_-]+')
+
+
+def parse_devices(text: str) -> list[tuple[str, str, int]]:
+    """
+    Parse a device list such as 'lead=Moog Sub 37@3, bass=20:0@5'.
+
+    Each comma-separated entry is `id=port`, optionally followed by `@channel`. The port is matched
+    like MIDIManager port names (with a resolver, part of the name or ALSA client:port id).
+
+    Args:
+        text: The device list.
+
+    Returns:
+        list: One (id, port, channel) entry per device, in order. Empty for an empty list.
+
+    Raises:
+        ValueError: If an entry is malformed, an id is repeated or a channel is out of range.
+    """
+    devices: list[tuple[str, str, int]] = []
+    for entry in text.split(','):
+        if not entry.strip():
+            continue
+        name, separator, port = entry.partition('=')
+        name = name.strip()
+        channel = DEFAULT_CHANNEL
+        port, at, channel_text = port.rpartition('@')
+        if not at:
+            port, channel_text = channel_text, ''
+        port = port.strip()
+        if not separator or not _DEVICE_ID.fullmatch(name) or not port:
+            raise ValueError(f'Invalid device: {entry.strip()!r}. Must be id=port or id=port@channel.')
+        if channel_text.strip():
+            try:
+                channel = int(channel_text)
+            except ValueError:
+                raise ValueError(f'Invalid channel for device {name}: {channel_text.strip()}') from None
+        if not 1 <= channel <= 16:
+            raise ValueError(f'Invalid channel for device {name}: {channel}. Must be between 1-16.')
+        if any(existing == name for existing, _, _ in devices):
+            raise ValueError(f'Duplicate device: {name}')
+        devices.append((name, port, channel))
+    return devices
+
+
+class Device:
+    """An instrument: the MIDI interface it is connected to and the channel it listens on."""
+
+    __slots__ = ('channel', 'midi', 'name')
+
+    def __init__(self, name: str, midi: MIDIManager, channel: int = DEFAULT_CHANNEL):
+        self.name = name
+        self.midi = midi
+        self.channel = channel
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'device': self.name,
+            'port': self.midi.port_name,
+            'channel': self.channel,
+            'connected': self.midi.connected,
+        }
+
+
+class DevicePool:
+    """Instruments by id. The first one added is the default for tools called without a device."""
+
+    def __init__(self):
+        self._devices: dict[str, Device] = {}
+
+    @classmethod
+    def build(cls, devices: list[tuple[str, str, int]], create: Callable[[str], MIDIManager]) -> 'DevicePool':
+        """
+        Create a pool with one MIDI interface per distinct port.
+
+        Args:
+            devices: (id, port, channel) entries, as returned by parse_devices.
+            create: Creates the MIDI interface of a port.
+
+        Returns:
+            DevicePool: The pool, holding the devices in the given order.
+        """
+        pool = cls()
+        interfaces: dict[str, MIDIManager] = {}
+        for name, port, channel in devices:
+            if port not in interfaces:
+                interfaces[port] = create(port)
+            pool.add(name, interfaces[port], channel)
+        return pool
+
+    def add(self, name: str, midi: MIDIManager, channel: int = DEFAULT_CHANNEL) -> Device:
+        """
+        Add an instrument.
+
+        Args:
+            name: Instrument id, used as the tools' `device` argument.
+            midi: The MIDI interface of the port the instrument is connected to.
+            channel: MIDI channel the instrument listens on (1-16).
+
+        Returns:
+            Device: The added instrument.
+
+        Raises:
+            ValueError: If the id is taken or the channel is out of range.
+        """
+        if name in self._devices:
+            raise ValueError(f'Duplicate device: {name}')
+        if not 1 <= channel <= 16:
+            raise ValueError(f'Invalid channel for device {name}: {channel}. Must be between 1-16.')
+        device = Device(name, midi, channel)
+        self._devices[name] = device
+        return device
+
+    @property
+    def default(self) -> Device:
+        """The instrument used when no device is given."""
+        if not self._devices:
+            raise LookupError('No devices configured')
+        return next(iter(self._devices.values()))
+
+    def get(self, name: Optional[str] = None) -> Device:
+        """
+        Get an instrument by id.
+
+        Args:
+            name: Instrument id, None for the default instrument.
+
+        Returns:
+            Device: The instrument.
+
+        Raises:
+            KeyError: If there is no instrument with this id.
+        """
+        if name is None:
+            return self.default
+        device = self._devices.get(name)
+        if device is None:
+            raise KeyError(f'Unknown device: {name}. Must be one of {", ".join(self._devices)}.')
+        return device
+
+    def select(self, name: Optional[str], channel: Optional[int]) -> tuple[MIDIManager, int]:
+        """
+        Get the MIDI interface and channel a tool call addresses.
+
+        Args:
+            name: Instrument id, None for the default instrument.
+            channel: MIDI channel, None for the instrument's channel.
+
+        Returns:
+            tuple: The instrument's MIDI interface and the channel to use.
+
+        Raises:
+            KeyError: If there is no instrument with this id.
+        """
+        device = self.get(name)
+        return device.midi, channel if channel is not None else device.channel
+
+    def name_of(self, midi: MIDIManager, channel: int) -> Optional[str]:
+        """
+        Get the id of the instrument a MIDI interface and channel address.
+
+        Args:
+            midi: The MIDI interface.
+            channel: MIDI channel (1-16).
+
+        Returns:
+            Optional[str]: The instrument id, or None if no instrument listens there.
+        """
+        for device in self._devices.values():
+            if device.midi is midi and device.channel == channel:
+                return device.name
+        return None
+
+    def tag(self, midi: MIDIManager, entry: dict[str, Any]) -> dict[str, Any]:
+        """
+        Add the id of the instrument addressed by an entry's 'channel' on a MIDI interface.
+
+        Nothing is added with a single instrument, keeping tool results as they were.
+
+        Args:
+            midi: The MIDI interface the entry belongs to.
+            entry: A tool result entry with a 'channel' item; updated in place.
+
+        Returns:
+            dict: The entry.
+        """
+        if len(self._devices) > 1:
+            entry['device'] = self.name_of(midi, entry['channel'])
+        return entry
+
+    def interfaces(self) -> list[MIDIManager]:
+        """Get the distinct MIDI interfaces of the instruments, in order."""
+        interfaces: list[MIDIManager] = []
+        for device in self._devices.values():
+            if not any(midi is device.midi for midi in interfaces):
+                interfaces.append(device.midi)
+        return interfaces
+
+    def names(self) -> list[str]:
+        """Get the instrument ids, in order."""
+        return list(self._devices)
+
+    def __iter__(self) -> Iterator[Device]:
+        return iter(list(self._devices.values()))
+
+    def __len__(self) -> int:
+        return len(self._devices)
@@ -0,0 +1,215 @@
+"""
+MIDI Input Listener
+
+This module decodes the messages received from the synth into parameter events
+and fans them out to subscribers. It is driven by the input port callback, so
+incoming messages are consumed as they arrive instead of being polled.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any, NamedTuple, Optional
+
+from moog_sub37_mcp.midi.parameters import CC, CC14, NRPN, PROGRAM_CHANGE, ParameterRegistry
+
+logger = logging.getLogger(__name__)
+
+# Number of recent events kept for get_recent_changes()
+RECENT_EVENTS = 256
+
+# Seconds a 14-bit LSB waits for its MSB before it is taken for a plain CC
+LSB_TIMEOUT = 0.02
+
+
+class ParameterEvent(NamedTuple):
+    """A parameter change received from the synth."""
+
+    id: int  # increasing sequence number
+    time: float  # time.time() of arrival
+    channel: int  # MIDI channel (1-16)
+    kind: str  # 'cc', 'cc14', 'nrpn' or 'program_change'
+    number: int  # CC number, CC MSB number of a 14-bit pair, or 14-bit NRPN number
+    lsb_number: int  # CC LSB number of a 14-bit pair, -1 otherwise
+    value: int
+    name: Optional[str]  # registered parameter name, None if unknown
+
+    def to_dict(self) -> dict[str, Any]:
+        """Event as a JSON-friendly dict."""
+        result = self._asdict()
+        if self.lsb_number < 0:
+            del result['lsb_number']
+        return result
+
+
+class _ChannelDecoder:
+    """Decoding state of one channel."""
+
+    __slots__ = ('data_msb', 'lsb', 'lsb_time', 'nrpn')
+
+    def __init__(self):
+        self.nrpn = [-1, -1]  # selected NRPN (CC 98 LSB, CC 99 MSB)
+        self.data_msb = -1  # Data Entry MSB for the selected NRPN
+        self.lsb: Optional[tuple[int, int]] = None  # (CC, value) of a 14-bit LSB waiting for its MSB
+        self.lsb_time = 0.0  # time.monotonic() of the LSB's arrival
+
+
+class InputListener:
+    """Decoder of incoming CC, 14-bit CC and NRPN messages into parameter events."""
+
+    def __init__(self, registry: ParameterRegistry, recent: int = RECENT_EVENTS):
+        """
+        Initialize the listener.
+
+        Args:
+            registry: Parameters used to pair 14-bit CCs and to name events.
+            recent: Number of recent events kept for recent().
+        """
+        self.received = 0
+        self.ignored = 0
+
+        self._decoders = [_ChannelDecoder() for _ in range(16)]
+        self._ids = itertools.count(1)
+        self._recent: deque[ParameterEvent] = deque(maxlen=recent)
+        self._callbacks: list[Callable[[ParameterEvent], None]] = []
+
+        # Parameter names by address; 14-bit pairs are keyed by both controllers
+        # Decoding happens on the input thread, and on a timer flushing LSBs whose MSB never came
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+        self._names: dict[tuple[str, int, int], str] = {}
+        self._pairs: set[tuple[int, int]] = set()
+        for spec in registry:
+            self._names.setdefault((spec.kind, spec.number, spec.lsb_number), spec.name)
+            if spec.kind == CC14:
+                self._pairs.add((spec.number, spec.lsb_number))
+        self._lsb_controllers = frozenset(lsb for _, lsb in self._pairs)
+
+    def subscribe(self, callback: Callable[[ParameterEvent], None]) -> None:
+        """
+        Call a function for every event, on the input thread.
+
+        Args:
+            callback: Called with each ParameterEvent. It must not block.
+        """
+        self._callbacks = [*self._callbacks, callback]
+
+    def recent(self, since: int = 0, channel: Optional[int] = None) -> list[ParameterEvent]:
+        """
+        Get the recent events.
+
+        Args:
+            since: Only return events with a greater id.
+            channel: Only return events of this MIDI channel (1-16).
+
+        Returns:
+            list: Events in arrival order.
+        """
+        return [
+            event for event in tuple(self._recent) if event.id > since and (channel is None or event.channel == channel)
+        ]
+
+    def reset(self) -> None:
+        """Forget partially received sequences, e.g. after the input port was reopened."""
+        # Swapped without the lock, which callbacks into the MIDI manager may be waiting under
+        self._decoders = [_ChannelDecoder() for _ in range(16)]
+
+    def handle(self, message: Any) -> None:
+        """
+        Decode a received message. Used as the input port callback.
+
+        Args:
+            message: The received mido message
+        """
+        with self._lock:
+            self.received += 1
+            if message.type == 'control_change':
+                self._control_change(message.channel, message.control, message.value)
+            elif message.type == 'program_change':
+                self._flush_lsb(message.channel)
+                self._emit(message.channel, PROGRAM_CHANGE, -1, -1, message.program)
+            else:
+                self.ignored += 1
+
+    def _control_change(self, channel: int, cc: int, value: int) -> None:
+        decoder = self._decoders[channel]
+        if decoder.lsb is not None:
+            lsb_cc, lsb = decoder.lsb
+            if (cc, lsb_cc) in self._pairs:
+                # The Sub 37 sends the LSB first, the MSB completes the 14-bit value
+                decoder.lsb = None
+                self._emit(channel, CC14, cc, lsb_cc, value << 7 | lsb)
+                return
+            self._flush_lsb(channel)
+
+        if cc in (98, 99):
+            decoder.nrpn[cc - 98] = value
+            decoder.data_msb = -1
+        elif cc in (100, 101):
+            # An RPN selection deselects the NRPN
+            decoder.nrpn[:] = -1, -1
+        elif cc in (6, 38) and -1 not in decoder.nrpn:
+            # The NRPN value is complete with its Data Entry LSB
+            if cc == 6:
+                decoder.data_msb = value
+            elif decoder.data_msb >= 0:
+                self._emit(channel, NRPN, decoder.nrpn[1] << 7 | decoder.nrpn[0], -1, decoder.data_msb << 7 | value)
+        elif cc in self._lsb_controllers:
+            decoder.lsb = (cc, value)
+            decoder.lsb_time = time.monotonic()
+            self._schedule_flush()
+        else:
+            self._emit(channel, CC, cc, -1, value)
+
+    def _flush_lsb(self, channel: int) -> None:
+        """Emit a 14-bit LSB that was not followed by its MSB as a plain CC."""
+        decoder = self._decoders[channel]
+        if decoder.lsb is not None:
+            cc, value = decoder.lsb
+            decoder.lsb = None
+            self._emit(channel, CC, cc, -1, value)
+
+    def _schedule_flush(self) -> None:
+        """Flush the LSBs still waiting for their MSB once they time out. Called with the lock held."""
+        if self._timer is None:
+            self._timer = threading.Timer(LSB_TIMEOUT, self._flush_expired)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_expired(self) -> None:
+        """Emit the LSBs that waited LSB_TIMEOUT for their MSB as plain CCs, on the timer thread."""
+        with self._lock:
+            self._timer = None
+            now = time.monotonic()
+            pending = False
+            for channel, decoder in enumerate(self._decoders):
+                if decoder.lsb is None:
+                    continue
+                if now - decoder.lsb_time >= LSB_TIMEOUT:
+                    self._flush_lsb(channel)
+                else:
+                    pending = True
+            if pending:
+                self._schedule_flush()
+
+    def _emit(self, channel: int, kind: str, number: int, lsb_number: int, value: int) -> None:
+        event = ParameterEvent(
+            next(self._ids),
+            time.time(),
+            channel + 1,
+            kind,
+            number,
+            lsb_number,
+            value,
+            self._names.get((kind, number, lsb_number)),
+        )
+        self._recent.append(event)
+        for callback in self._callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f'Error in MIDI input subscriber: {e}')
@@ -0,0 +1,230 @@
+"""
+Metrics
+
+This module collects histograms, and the counters and gauges reported by collectors, and
+renders them in the Prometheus text exposition format, without depending on a metrics client
+library. Components record into a shared Metrics instance only when given one, so disabled
+metrics cost a None check. Values that components already count (e.g. the output queue
+statistics) are read by collectors when the metrics are rendered rather than recorded on
+every update.
+"""
+
+import logging
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in seconds, from a single USB write to a long paced burst
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+Labels = tuple[str, ...]
+
+# A sample reported by a collector: metric name, type, help text, label names and values, value
+Sample = tuple[str, str, str, dict[str, str], float]
+
+
+class Histogram:
+    """Distribution of observed values in cumulative buckets, with their sum and count, per label set."""
+
+    def __init__(self, name: str, help: str, labelnames: Labels = (), buckets: Iterable[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        self._children: dict[Labels, HistogramChild] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        """
+        Record a value.
+
+        Args:
+            value: The observed value, e.g. a duration in seconds.
+            labels: Label values, in the order of the label names.
+        """
+        self.labels(*labels).observe(value)
+
+    def labels(self, *values: str) -> 'HistogramChild':
+        """
+        Get the histogram of one label set, to observe values without looking the labels up each time.
+
+        Args:
+            values: Label values, in the order of the label names.
+
+        Returns:
+            HistogramChild: The histogram of the label set, created on first use.
+        """
+        with self._lock:
+            child = self._children.get(values)
+            if child is None:
+                child = self._children[values] = HistogramChild(self.buckets, self._lock)
+            return child
+
+    def samples(self) -> list[tuple[str, Labels, float]]:
+        samples: list[tuple[str, Labels, float]] = []
+        with self._lock:
+            entries = [(labels, list(child.counts), child.total) for labels, child in self._children.items()]
+        for labels, counts, total in entries:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float('inf')), counts):
+                cumulative += count
+                samples.append((f'{self.name}_bucket', (*labels, _format_value(bound)), cumulative))
+            samples.append((f'{self.name}_sum', labels, total))
+            samples.append((f'{self.name}_count', labels, cumulative))
+        return samples
+
+
+class HistogramChild:
+    """The values observed by a histogram for one label set."""
+
+    __slots__ = ('_buckets', '_lock', 'counts', 'total')
+
+    def __init__(self, buckets: tuple[float, ...], lock: threading.Lock):
+        self._buckets = buckets
+        # Shared with the parent histogram, which reads every label set under it
+        self._lock = lock
+        # Count per bucket, the last one for values above every bound
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a value, e.g. a duration in seconds."""
+        index = bisect_left(self._buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.total += value
+
+
+class Metrics:
+    """Registry of the metrics of one server, rendered together in the Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: dict[str, Histogram] = {}
+        self._collectors: list[Callable[[], Iterable[Sample]]] = []
+        self._lock = threading.Lock()
+
+    def histogram(
+        self, name: str, help: str, labelnames: Labels = (), buckets: Iterable[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        """
+        Get the histogram with this name, creating it on first use.
+
+        Args:
+            name: Metric name, with its unit as suffix (e.g. `_seconds`).
+            help: Description shown in the HELP line.
+            labelnames: Names of the labels the histogram is broken down by.
+            buckets: Upper bounds of the buckets.
+
+        Returns:
+            Histogram: The histogram, shared by every caller using the name.
+        """
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = Histogram(name, help, labelnames, buckets)
+            return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[Sample]]) -> None:
+        """
+        Add a function reporting samples when the metrics are rendered.
+
+        Args:
+            collector: Returns (name, type, help, labels, value) samples, type being 'counter' or 'gauge'.
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: One HELP and TYPE line per metric followed by its samples.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+
+        lines: list[str] = []
+        for metric in metrics:
+            lines += (f'# HELP {metric.name} {metric.help}', f'# TYPE {metric.name} histogram')
+            names = metric.labelnames
+            for name, labels, value in metric.samples():
+                label_names = (*names, 'le') if name.endswith('_bucket') else names
+                lines.append(f'{name}{_format_labels(dict(zip(label_names, labels)))} {_format_value(value)}')
+
+        # Collected samples, grouped by metric name
+        collected: dict[str, tuple[str, str, list[str]]] = {}
+        for collector in collectors:
+            try:
+                samples = list(collector())
+            except Exception as e:
+                logger.debug(f'Metrics collector failed: {str(e)}')
+                continue
+            for name, kind, help, labels, value in samples:
+                entry = collected.setdefault(name, (kind, help, []))
+                entry[2].append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+        for name, (kind, help, samples) in collected.items():
+            lines += (f'# HELP {name} {help}', f'# TYPE {name} {kind}', *samples)
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port: int, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+        """
+        Serve the rendered metrics over HTTP from a background thread, for a Prometheus scraper.
+
+        Args:
+            port: TCP port to listen on, 0 for any free port.
+            host: Address to listen on (default is the local host only).
+
+        Returns:
+            ThreadingHTTPServer: The running server; call its shutdown() to stop it.
+
+        Raises:
+            OSError: If the address cannot be bound.
+        """
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug(f'Metrics request: {format % args}')
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True).start()
+        logger.info(f'Serving metrics on http://{host}:{server.server_address[1]}/metrics')
+        return server
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + '}'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
@@ -7,28 +7,308 @@ selecting channels, and sending control change (CC) messages
 """
 
 import logging
-from typing import Optional
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Optional
 
 import mido
 
+from moog_sub37_mcp.midi.input_listener import InputListener, ParameterEvent
+from moog_sub37_mcp.midi.metrics import Metrics, Sample
+from moog_sub37_mcp.midi.output_queue import BLOCK, OutputQueue
+from moog_sub37_mcp.midi.parameters import CC, CC14, NOTE_OFF, NOTE_ON, NRPN, PROGRAM_CHANGE, ParameterRegistry
+from moog_sub37_mcp.midi.port_resolver import PortResolver, match_port
+from moog_sub37_mcp.midi.rate_limiter import DIN_BYTES_PER_SECOND, RateLimiter
+from moog_sub37_mcp.midi.scheduler import Scheduler
+from moog_sub37_mcp.midi.synth_state import SynthState
+
 logger = logging.getLogger(__name__)
 
+# NRPN/RPN select controllers (NRPN LSB/MSB, RPN LSB/MSB)
+_PARAMETER_NUMBER_CCS = frozenset((98, 99, 100, 101))
+
+# Controllers whose every write matters (select and Data Entry/Increment/Decrement), never coalesced
+_UNCOALESCED_CCS = _PARAMETER_NUMBER_CCS | {6, 38, 96, 97}
+
+# Operation kinds that are messages rather than parameter writes: never coalesced, deduplicated or mirrored
+_MESSAGE_KINDS = frozenset((PROGRAM_CHANGE, NOTE_ON, NOTE_OFF))
+
+# Operations taken per writer batch when output is paced
+_PACED_BATCH_SIZE = 16
+
+# Precomputed Control Change, Program Change and Note On/Off status bytes per 0-indexed channel
+_CC_STATUS = tuple(0xB0 | channel for channel in range(16))
+_PROGRAM_CHANGE_STATUS = tuple(0xC0 | channel for channel in range(16))
+_NOTE_STATUS = {
+    NOTE_ON: tuple(0x90 | channel for channel in range(16)),
+    NOTE_OFF: tuple(0x80 | channel for channel in range(16)),
+}
+
+# Length in bytes of a MIDI message by status byte
+_MESSAGE_LENGTHS = tuple(
+    2 if 0xC0 <= status <= 0xDF or status in (0xF1, 0xF3) else 3 if status < 0xF0 or status == 0xF2 else 1
+    for status in range(256)
+)
+
+# System Real-Time status bytes: Timing Clock, Start, Continue, Stop, Active Sensing and Reset
+_REALTIME_STATUSES = frozenset((0xF8, 0xFA, 0xFB, 0xFC, 0xFE, 0xFF))
+
+# Output statistics reported as metrics: (output_stats key, metric name, type, help)
+_STAT_METRICS = (
+    ('suppressed', 'sub37_midi_suppressed_total', 'counter', 'Redundant writes not sent'),
+    ('depth', 'sub37_midi_queue_depth', 'gauge', 'Operations waiting in the output queue'),
+    ('enqueued', 'sub37_midi_queue_enqueued_total', 'counter', 'Operations added to the output queue'),
+    ('coalesced', 'sub37_midi_queue_coalesced_total', 'counter', 'Queued updates merged into a pending one'),
+    ('dropped', 'sub37_midi_queue_dropped_total', 'counter', 'Queued updates dropped by back-pressure'),
+    ('paced', 'sub37_midi_paced_total', 'counter', 'Message groups delayed by the rate limit'),
+    ('total_delay', 'sub37_midi_pacing_delay_seconds_total', 'counter', 'Time spent waiting for the rate limit'),
+    ('offline_buffered', 'sub37_midi_offline_buffered', 'gauge', 'Writes buffered while the port is lost'),
+    (
+        'offline_dropped',
+        'sub37_midi_offline_dropped_total',
+        'counter',
+        'Buffered writes dropped while the port was lost',
+    ),
+)
+
+# An output operation: (kind, 0-indexed channel, number, LSB number or -1, value)
+Operation = tuple[str, int, int, int, int]
+
+# Encoded operations waiting for their turn to be written: (buffer, ticket, group end offsets)
+_Batch = tuple[bytes, int, list[int]]
+
+
+class _OutputMetrics:
+    """Traffic counters of one MIDI interface, reported to a Metrics registry when rendered."""
+
+    def __init__(self, metrics: Metrics, port: str):
+        # Bound to the port once, so recording a write looks no labels up
+        self.write_seconds = metrics.histogram(
+            'sub37_midi_write_seconds', 'Time to write a batch of messages to the port, pacing included', ('port',)
+        ).labels(port)
+        # [messages, bytes] per operation or message kind
+        self.sent: dict[str, list[int]] = {}
+        # Writes per (kind, 0-indexed channel, number, LSB number), named when rendered
+        self.writes: dict[tuple[str, int, int, int], int] = {}
+        self.write_errors = 0
+        self._lock = threading.Lock()
+
+    def record(self, operations: list[Operation], groups: list[int], seconds: float, written: bool) -> None:
+        """Count a write of encoded operations, whose encodings end at the given buffer offsets."""
+        self.write_seconds.observe(seconds)
+        with self._lock:
+            if not written:
+                self.write_errors += 1
+                return
+            sent, writes = self.sent, self.writes
+            start = 0
+            for operation, end in zip(operations, groups):
+                size = end - start
+                start = end
+                if not size:
+                    continue  # nothing left to send after running status or 14-bit deltas
+                kind = operation[0]
+                counts = sent.get(kind)
+                if counts is None:
+                    counts = sent[kind] = [0, 0]
+                # Channel messages are 3 bytes long, except the 2-byte Program Change
+                counts[0] += (size + 2) // 3
+                counts[1] += size
+                if kind not in _MESSAGE_KINDS:
+                    key = operation[:4]
+                    writes[key] = writes.get(key, 0) + 1  # type: ignore[index]
+
+    def record_message(self, kind: str, size: int) -> None:
+        """Count a message written outside the operation path (real-time)."""
+        with self._lock:
+            counts = self.sent.setdefault(kind, [0, 0])
+            counts[0] += 1
+            counts[1] += size
+
+    def samples(self, labels: dict[str, str], registry: Optional[ParameterRegistry]) -> list[Sample]:
+        """Get the counters as metric samples, naming the parameters written from the registry if given."""
+        with self._lock:
+            sent = [(kind, *counts) for kind, counts in self.sent.items()]
+            writes = list(self.writes.items())
+            write_errors = self.write_errors
+
+        samples: list[Sample] = []
+        for kind, messages, size in sent:
+            samples.append(
+                ('sub37_midi_messages_total', 'counter', 'MIDI messages sent', {**labels, 'kind': kind}, messages)
+            )
+        for kind, messages, size in sent:
+            samples.append(('sub37_midi_bytes_total', 'counter', 'MIDI bytes sent', {**labels, 'kind': kind}, size))
+        samples.append(('sub37_midi_write_errors_total', 'counter', 'Failed port writes', labels, write_errors))
+        for (kind, channel, number, lsb_number), count in writes:
+            address = number << 7 | lsb_number if kind == NRPN else number
+            spec = registry.lookup(kind, address) if registry is not None else None
+            parameter = spec.name if spec is not None else f'{kind} {address}'
+            samples.append(
+                (
+                    'sub37_midi_parameter_writes_total',
+                    'counter',
+                    'Parameter values sent, by parameter',
+                    {**labels, 'channel': str(channel + 1), 'parameter': parameter},
+                    count,
+                )
+            )
+        return samples
+
+
+class Burst:
+    """Messages collected by MIDIManager.burst(), transmitted together when the block exits."""
+
+    __slots__ = ('operations', 'sent')
+
+    def __init__(self):
+        self.operations: list[Operation] = []
+        self.sent = False
+
 
 class MIDIManager:
     """Interface for MIDI communication."""
 
-    def __init__(self, port_name: str):
+    def __init__(
+        self,
+        port_name: str,
+        nrpn_running_status: bool = True,
+        high_res_delta: bool = True,
+        async_output: bool = False,
+        queue_size: int = 1024,
+        backpressure: str = BLOCK,
+        coalesce: bool = True,
+        bytes_per_second: Optional[float] = DIN_BYTES_PER_SECOND,
+        messages_per_second: Optional[float] = None,
+        state: Optional[SynthState] = None,
+        listener: Optional[InputListener] = None,
+        dedupe_ttl: Optional[float] = None,
+        lazy_connect: bool = False,
+        offline_buffer_size: int = 1024,
+        resolver: Optional[PortResolver] = None,
+        metrics: Optional[Metrics] = None,
+    ):
         """
         Initialize the MIDI interface.
 
         Args:
-            port_name: Name of the MIDI port to use.
+            port_name: Name of the MIDI port to use. With a resolver, part of the name or its ALSA
+                client:port id is enough.
+            nrpn_running_status: Skip the NRPN select pair (CC 99/98) when the same NRPN is
+                already selected on the channel. Disable to always send all four messages.
+            high_res_delta: Send only the LSB of a 14-bit CC pair when its MSB is unchanged since
+                the last write. Disable to always send both MSB and LSB.
+            async_output: Hand messages to a writer thread instead of writing them in the caller.
+                The send_* methods then return as soon as the message is queued.
+            queue_size: Maximum number of queued messages with async_output.
+            backpressure: Policy when the queue is full: 'block', 'drop_oldest' or 'coalesce'.
+            coalesce: With async_output, merge queued updates to the same controller (channel and
+                CC, 14-bit CC pair or NRPN) so only the latest value is written. Updates keep the
+                queue position of the first pending one, preserving order between parameters.
+            bytes_per_second: Pace output to this many bytes per second, None for no limit. Defaults
+                to the DIN MIDI rate (31.25 kbaud); raise it or pass None for USB MIDI.
+            messages_per_second: Pace output to this many messages per second, None for no limit.
+                Each CC, 14-bit CC pair or NRPN is paced as one group, so an NRPN's four messages
+                always go out back to back.
+            state: Mirror recording every value written to the port, and every change received with a
+                listener.
+            listener: Decoder of the messages received on the input port, fed by its callback.
+            dedupe_ttl: Skip sending a value the state mirror already holds if the same controller
+                was sent less than this many seconds ago. None disables redundant-write suppression.
+                The send_* methods take `force=True` to send anyway.
+            lazy_connect: Open the port on the first message sent (or ensure_connected()) instead of
+                here, so creating the interface is free until MIDI is actually used.
+            offline_buffer_size: Maximum number of writes kept after port_lost() until reconnect()
+                replays them; older writes are dropped first.
+            resolver: Resolves port_name to the port to open, matching partial names and caching
+                the result on disk. None opens the port named exactly port_name.
+            metrics: Registry to record the messages, bytes and write times of this interface into,
+                labelled with port_name, and to report its output statistics to. None records nothing.
         """
+        # The port as requested, and as opened once connected
+        self.port_query = port_name
+        self.port_name = port_name
+        self.resolver = resolver
+        self.state = state
+        self.listener = listener
+        if listener is not None:
+            if state is not None:
+                listener.subscribe(state.apply)
+            listener.subscribe(self._on_input_event)
+        self.dedupe_ttl = dedupe_ttl
+        self.suppressed = 0
+
+        # Writes made while the port is lost, replayed on reconnect, by controller (or sequence
+        # number for messages that are not coalesced). None unless the port was lost.
+        self._offline: Optional[dict[Any, Operation]] = None
+        self._offline_sequence = 0
+        self.offline_buffer_size = offline_buffer_size
+        self.offline_dropped = 0
+        self.reconnects = 0
+        # Set when a write to the port fails, so a supervisor can check the port right away
+        self.port_error = threading.Event()
+
+        # Last send time per controller (operation kind, 0-indexed channel, number, LSB number),
+        # shared by the callers, the writer thread and the input callback
+        self._sent_at: dict[tuple[str, int, int, int], float] = {}
+        self._sent_lock = threading.Lock()
         self.input_port: Optional[mido.ports.BaseInput] = None
         self.output_port: Optional[mido.ports.BaseOutput] = None
         self.connected = False
+        self.nrpn_running_status = nrpn_running_status
+
+        # Currently selected (NRPN MSB, NRPN LSB) per 0-indexed channel, None when unknown
+        self._selected_nrpn: list[Optional[tuple[int, int]]] = [None] * 16
+        self.high_res_delta = high_res_delta
+
+        # Last (MSB, LSB) sent per (0-indexed channel, CC MSB, CC LSB)
+        self._high_res_values: dict[tuple[int, int, int], tuple[int, int]] = {}
+
+        # Encoded messages waiting for the next write, and the burst open in each thread (if any)
+        self._out = bytearray()
+        self._local = threading.local()
+
+        # rtmidi output handle for the raw write path, None for other backends
+        self._raw_output: Optional[Any] = None
+
+        # Serializes encoding between callers, the writer thread and bursts
+        self._lock = threading.RLock()
+        # Guards the port alone, so real-time messages go out while a paced write waits
+        self._port_lock = threading.Lock()
+        # Encoded batches are written in encoding order without holding _lock: each takes a ticket
+        # under _lock and waits for its turn, so pacing never holds up encoding or input handling
+        self._next_ticket = 0
+        self._serving = 0
+        # Tickets given up before their turn (e.g. a waiting writer interrupted), skipped when reached
+        self._abandoned: set[int] = set()
+        self._turn_waiters = 0
+        self._turn_lock = threading.Lock()
+        self._turn = threading.Condition(self._turn_lock)
+        self._rate_limiter: Optional[RateLimiter] = None
+        if bytes_per_second or messages_per_second:
+            self._rate_limiter = RateLimiter(bytes_per_second, messages_per_second)
+        self._scheduler: Optional[Scheduler] = None
+        self._queue: Optional[OutputQueue] = None
+        if async_output:
+            self._queue = OutputQueue(
+                self._write_operations,
+                maxsize=queue_size,
+                policy=backpressure,
+                coalesce=coalesce,
+                # Paced writes take small batches so later updates can still be coalesced
+                max_batch=_PACED_BATCH_SIZE if self._rate_limiter else None,
+            )
 
-        if port_name:
+        self._metrics: Optional[_OutputMetrics] = None
+        if metrics is not None:
+            self._metrics = _OutputMetrics(metrics, port_name)
+            metrics.add_collector(self._collect_metrics)
+
+        # Whether the port is still to be opened by ensure_connected()
+        self._connect_pending = bool(port_name) and lazy_connect
+        if port_name and not lazy_connect:
             self.connect(port_name)
 
     def list_ports(self) -> list[str]:
@@ -37,10 +317,27 @@ class MIDIManager:
         outputs = mido.get_output_names()  # type: ignore[attr-defined]
         return list(set(inputs + outputs))  # type: ignore[arg-type]
 
+    def find_port(self, names: list[str]) -> Optional[str]:
+        """
+        Find the port connect() would open among the given port names.
+
+        Args:
+            names: Available output port names.
+
+        Returns:
+            str: The matching port name, or None if the port is not available.
+        """
+        if self.resolver is not None:
+            return match_port(self.port_query, names)
+        return self.port_query if self.port_query in names else None
+
     def connect(self, port_name: str) -> bool:
         """
         Connect to the specified MIDI port.
 
+        With a resolver, port_name may be part of the name or its ALSA client:port id. The port it
+        last resolved to is tried first, and the ports are only enumerated if that fails.
+
         Args:
             port_name: Name of the MIDI port to connect to
 
@@ -50,35 +347,627 @@ class MIDIManager:
         try:
             # Close existing connections if any
             self.disconnect()
+            self._open_ports(port_name)
+            return True
+        except (OSError, ValueError, ImportError) as e:
+            # ImportError: the MIDI backend (e.g. python-rtmidi or its system library) is unavailable
+            logger.error(f'Failed to connect to MIDI port {port_name}: {e}')
+            self.disconnect()
+            return False
+
+    def _open_ports(self, port_name: str) -> None:
+        """Open the output and input ports port_name resolves to. Raises OSError, ValueError or ImportError."""
+        # Not under the lock: enumerating the ports may take a while
+        output, opened = self._open_output(port_name)
+        with self._port_lock:
+            self.output_port = output
+            # mido's rtmidi backend keeps its rtmidi.MidiOut as `_rt`
+            self._raw_output = getattr(output, '_rt', None)
+        try:
+            callback = self.listener.handle if self.listener is not None else None
+            self.input_port = mido.open_input(opened, callback=callback)  # type: ignore[attr-defined]
+        except (OSError, ValueError) as e:
+            logger.warning(f'Could not open input port {opened}: {e}')
 
-            # Open new connections
-            self.output_port = mido.open_output(port_name)  # type: ignore[attr-defined]
+        self.port_query = port_name
+        self.port_name = opened
+        self.connected = True
+        logger.info(f'Connected to MIDI port: {opened}')
+
+    def _open_output(self, port_name: str) -> tuple[Any, str]:
+        """Open the output port port_name resolves to, returning the port and its name."""
+        if self.resolver is None:
+            return mido.open_output(port_name), port_name  # type: ignore[attr-defined]
+
+        # The port open before, unless a different one is requested now
+        hint = self.port_name if port_name == self.port_query and self.port_name != port_name else None
+        error: Optional[Exception] = None
+        for candidate in self.resolver.candidates(port_name, hint):
             try:
-                self.input_port = mido.open_input(port_name)  # type: ignore[attr-defined]
+                output = mido.open_output(candidate)  # type: ignore[attr-defined]
             except (OSError, ValueError) as e:
-                logger.warning(f'Could not open input port {port_name}: {e}')
+                error = e
+                continue
+            self.resolver.remember(port_name, candidate)
+            return output, candidate
+        raise error or OSError(f'No MIDI port matches {port_name!r}')
+
+    def ensure_connected(self) -> bool:
+        """
+        Open the port now if its connection was deferred with lazy_connect.
 
-            self.connected = True
-            logger.info(f'Connected to MIDI port: {port_name}')
+        Returns:
+            bool: True if connected, False otherwise. A failed deferred connection is not retried;
+                call connect() to try again.
+        """
+        if self.connected:
             return True
-        except (OSError, ValueError) as e:
-            logger.error(f'Failed to connect to MIDI port {port_name}: {e}')
-            self.disconnect()
-            return False
+        with self._lock:
+            if not self._connect_pending:
+                return self.connected
+            self._connect_pending = False
+            return self.connect(self.port_query)
 
     def disconnect(self) -> None:
         """Close all MIDI connections."""
+        self._connect_pending = False
+        if self._queue is not None and self.connected and not self._queue.flush(timeout=1.0):
+            logger.warning(f'Discarding {self._queue.clear()} queued MIDI messages on disconnect')
+        with self._lock:
+            self._offline = None
+        self._close_ports()
+
+    def port_lost(self) -> None:
+        """
+        Close the ports of a device that went away, e.g. unplugged or power-cycled.
+
+        Unlike disconnect(), nothing is flushed to the dead port: from now on the send_* methods keep
+        succeeding and their writes (except notes) are buffered, coalesced per controller, until
+        reconnect() replays them.
+        """
+        with self._lock:
+            if self._offline is None:
+                self._offline = {}
+        self._connect_pending = False
+        self._close_ports()
+        logger.warning(f'MIDI port lost: {self.port_name}')
+
+    def reconnect(self) -> bool:
+        """
+        Reopen the port after port_lost() and bring the synth back to the sound it should have.
+
+        Every value known to the state mirror is sent first, so a power-cycled synth gets its edits
+        back, then the writes buffered while the port was down. Both go out before any newer write.
+        The ports are opened without the lock, so senders are not held up meanwhile: their writes
+        keep being buffered until the replay is encoded.
+
+        Returns:
+            bool: True if the port was reopened, False otherwise (writes stay buffered).
+        """
+        with self._lock:
+            if self._offline is None:
+                self._offline = {}
+        self._connect_pending = False
+        self._close_ports()
+        try:
+            self._open_ports(self.port_query)
+        except (OSError, ValueError, ImportError) as e:
+            logger.error(f'Failed to reconnect to MIDI port {self.port_query}: {e}')
+            self._close_ports()
+            return False
+        with self._lock:
+            offline, self._offline = self._offline, None
+            # The buffered writes are newer than the mirror, which only holds values written out
+            operations = self._state_operations()
+            operations += offline.values() if offline else ()
+            # Encoded under the lock, so the replay is written before any newer write
+            batch = self._encode_batch(operations) if operations else None
+            self.reconnects += 1
+        if batch is not None:
+            self._write_operations(operations, batch)
+        logger.info(f'Reconnected to MIDI port {self.port_name}, replayed {len(operations)} writes')
+        return True
+
+    def _state_operations(self) -> list[Operation]:
+        """Writes restoring every value of the state mirror, once per MIDI address."""
+        if self.state is None:
+            return []
+        registry = self.state.registry
+        specs = [spec for spec in registry if registry.lookup(*spec.address) is spec]
+        operations: list[Operation] = []
+        for channel in self.state.channels():
+            for spec in specs:
+                value = self.state.get(channel, spec.name)
+                if value is None:
+                    continue
+                if spec.kind == NRPN:
+                    operations.append((NRPN, channel - 1, spec.number >> 7, spec.number & 0x7F, value))
+                else:
+                    operations.append((spec.kind, channel - 1, spec.number, spec.lsb_number, value))
+        return operations
+
+    def _buffer_offline(self, operations: list[Operation]) -> None:
+        """Keep writes made while the port is lost. Called with the lock held."""
+        offline = self._offline
+        for operation in operations:
+            if operation[0] in (NOTE_ON, NOTE_OFF):
+                continue  # a late note is worse than a missing one
+            key = _coalescing_key(operation)
+            if key is None:
+                self._offline_sequence += 1
+                key = self._offline_sequence
+            offline[key] = operation  # type: ignore[index]
+            if len(offline) > self.offline_buffer_size:  # type: ignore[arg-type]
+                del offline[next(iter(offline))]  # type: ignore[arg-type]
+                self.offline_dropped += 1
+
+    def _close_ports(self) -> None:
+        """Close the input and output ports and forget the per-connection output state."""
         if self.input_port:
             self.input_port.close()
             self.input_port = None
+        if self.listener is not None:
+            self.listener.reset()
 
-        if self.output_port:
-            self.output_port.close()
-            self.output_port = None
+        with self._lock:
+            with self._port_lock:
+                if self.output_port:
+                    self.output_port.close()
+                    self.output_port = None
+                self._raw_output = None
+            self._out.clear()
 
-        self.connected = False
+            self.connected = False
+            self.invalidate_nrpn_selection()
+            self.invalidate_high_res_values()
+            # The synth may change while disconnected, so the next writes must go out
+            self.invalidate_sent()
+
+    def close(self) -> None:
+        """Disconnect and stop the scheduler and writer threads, if any."""
+        if self._scheduler is not None:
+            self._scheduler.close()
+        self.disconnect()
+        if self._queue is not None:
+            self._queue.close()
+
+    @property
+    def scheduler(self) -> Scheduler:
+        """Shared timeline for timed output (ramps, notes, clock), created on first use."""
+        if self._scheduler is None:
+            with self._lock:
+                if self._scheduler is None:
+                    self._scheduler = Scheduler()
+        return self._scheduler
+
+    def invalidate_nrpn_selection(self, channel: Optional[int] = None) -> None:
+        """
+        Forget the currently selected NRPN so the next send_nrpn re-sends CC 99/98.
+
+        Args:
+            channel: MIDI channel (1-16) to invalidate, or None for all channels.
+        """
+        with self._lock:
+            if channel is None:
+                self._selected_nrpn = [None] * 16
+            elif 1 <= channel <= 16:
+                self._selected_nrpn[channel - 1] = None
+
+    def invalidate_high_res_values(self, channel: Optional[int] = None) -> None:
+        """
+        Forget the last 14-bit CC values so the next send_high_res_cc sends both MSB and LSB.
+
+        Args:
+            channel: MIDI channel (1-16) to invalidate, or None for all channels.
+        """
+        with self._lock:
+            if channel is None:
+                self._high_res_values.clear()
+            else:
+                for key in [key for key in self._high_res_values if key[0] == channel - 1]:
+                    del self._high_res_values[key]
+
+    def invalidate_sent(self, channel: Optional[int] = None) -> None:
+        """
+        Forget which values were sent so the next writes are not suppressed as redundant.
+
+        Args:
+            channel: MIDI channel (1-16) to invalidate, or None for all channels.
+        """
+        with self._sent_lock:
+            if channel is None:
+                self._sent_at.clear()
+            else:
+                for key in [key for key in self._sent_at if key[1] == channel - 1]:
+                    del self._sent_at[key]
+
+    def _forget_high_res_controller(self, channel: int, cc: int) -> None:
+        """Drop the delta state of any 14-bit pair using `cc` on the 0-indexed channel."""
+        for key in [key for key in self._high_res_values if key[0] == channel and cc in key[1:]]:
+            del self._high_res_values[key]
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued message has been written (immediate without async_output).
+
+        Args:
+            timeout: Seconds to wait (None waits forever).
+
+        Returns:
+            bool: True if the queue drained in time, False otherwise.
+        """
+        if self._queue is None:
+            return True
+        return self._queue.flush(timeout)
+
+    async def flush_async(self, timeout: Optional[float] = None) -> bool:
+        """Await flush() without blocking the event loop."""
+        if self._queue is None:
+            return True
+        return await self._queue.flush_async(timeout)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of messages waiting for the writer thread."""
+        return len(self._queue) if self._queue is not None else 0
+
+    def output_stats(self) -> dict[str, Any]:
+        """
+        Get the output queue, pacing and scheduling counters.
+
+        Returns:
+            dict: The number of reconnects and, while the port is lost, the number of writes buffered
+                and dropped for replay. With async_output, the queue depth, size, back-pressure policy and the enqueued,
+                coalesced and dropped update counts. With redundant-write suppression, the number of
+                writes suppressed. With rate limiting, the configured rates, the number of groups
+                sent and paced, and the pacing delays in seconds. Once timed output was used, the
+                scheduler's pending and executed events and its lateness and jitter.
+        """
+        stats: dict[str, Any] = {'reconnects': self.reconnects}
+        if self._offline is not None:
+            stats['offline_buffered'] = len(self._offline)
+            stats['offline_dropped'] = self.offline_dropped
+        if self.dedupe_ttl is not None:
+            stats['suppressed'] = self.suppressed
+        if self._queue is not None:
+            stats.update(self._queue.stats())
+        if self._rate_limiter is not None:
+            stats.update(self._rate_limiter.stats())
+        if self._scheduler is not None:
+            stats.update(self._scheduler.stats())
+        return stats
+
+    def _collect_metrics(self) -> list[Sample]:
+        """Report the connection state, output statistics and writes per parameter to the metrics registry."""
+        labels = {'port': self.port_query}
+        stats = self.output_stats()
+        samples: list[Sample] = [
+            ('sub37_midi_connected', 'gauge', 'Whether the MIDI port is open', labels, int(self.connected)),
+            (
+                'sub37_midi_reconnects_total',
+                'counter',
+                'Reconnections after the port was lost',
+                labels,
+                self.reconnects,
+            ),
+        ]
+        for stat, name, kind, help in _STAT_METRICS:
+            if stat in stats:
+                samples.append((name, kind, help, labels, stats[stat]))
+
+        registry = self.state.registry if self.state is not None else None
+        return samples + self._metrics.samples(labels, registry)  # type: ignore[union-attr]
+
+    def _take_output(self) -> tuple[bytes, int]:
+        """Take the encoded output buffer and its ticket in the write order. Called with the lock held."""
+        out = bytes(self._out)
+        self._out.clear()
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        return out, ticket
+
+    def _write(self, out: bytes, ticket: int, groups: Optional[list[int]] = None) -> bool:
+        """
+        Transmit an encoded buffer taken by _take_output(), after every buffer taken before it.
+
+        This is the single write path of the manager. It must be called once per ticket, without the
+        lock held, as it waits for the earlier tickets. With the rtmidi backend the encoded bytes go
+        straight to rtmidi, one slice per message, without building mido.Message objects. Other
+        backends receive messages parsed back from the buffer.
+
+        Args:
+            out: The encoded messages.
+            ticket: The buffer's place in the write order.
+            groups: End offsets of the message groups in the buffer, paced as units by the rate
+                limiter. None treats the whole buffer as one group.
+
+        Returns:
+            bool: True if the buffer was written, False otherwise.
+        """
+        try:
+            if self._serving != ticket:
+                with self._turn_lock:
+                    self._turn_waiters += 1
+                    try:
+                        while self._serving != ticket:
+                            self._turn.wait()
+                    finally:
+                        self._turn_waiters -= 1
+            if not out:
+                return True
+            if not self.connected or not self.output_port:
+                logger.error('Not connected to any MIDI port')
+                return False
+
+            with memoryview(out) as view:
+                if self._rate_limiter is None:
+                    self._send_group(view)
+                else:
+                    start = 0
+                    for end in groups or (len(out),):
+                        if end > start:
+                            self._send_group(view[start:end], self._rate_limiter)
+                        start = end
+            return True
+        except Exception as e:
+            # Running status, 14-bit deltas and suppression assumed the whole buffer went out
+            self.invalidate_nrpn_selection()
+            self.invalidate_high_res_values()
+            self.invalidate_sent()
+            self.port_error.set()
+            logger.error(f'Error writing MIDI output: {e}')
+            return False
+        finally:
+            self._complete_ticket(ticket)
+
+    def _complete_ticket(self, ticket: int) -> None:
+        """Let the writes after a ticket go out. Must be reached once per ticket, whether it was written or not."""
+        with self._turn_lock:
+            if ticket != self._serving:
+                self._abandoned.add(ticket)
+                return
+            self._serving += 1
+            while self._serving in self._abandoned:
+                self._abandoned.remove(self._serving)
+                self._serving += 1
+            if self._turn_waiters:
+                self._turn.notify_all()
 
-    def send_cc(self, channel: int, cc: int, value: int) -> bool:
+    def _send_group(self, view: memoryview, rate_limiter: Optional[RateLimiter] = None) -> None:
+        """Send the messages in a slice of the output buffer back to back, after pacing if given."""
+        bounds = list(_message_bounds(view))
+        if rate_limiter is not None:
+            rate_limiter.acquire(len(view), len(bounds))
+        with self._port_lock:
+            if self._raw_output is not None:
+                send_message = self._raw_output.send_message
+                for start, end in bounds:
+                    send_message(view[start:end])
+            elif self.output_port is not None:
+                for msg in mido.parse_all(view):  # type: ignore[attr-defined]
+                    self.output_port.send(msg)
+            else:
+                raise OSError('MIDI port closed')
+
+    def _write_operations(self, operations: list[Operation], batch: Optional[_Batch] = None) -> bool:
+        """
+        Encode operations and write them out in one pass, or buffer them while the port is lost.
+
+        Args:
+            operations: The operations to write.
+            batch: The operations as already encoded by _encode_batch(), None to encode them here.
+
+        Returns:
+            bool: True if the operations were written or buffered, False otherwise.
+        """
+        if batch is None:
+            with self._lock:
+                if self._offline is not None:
+                    self._buffer_offline(operations)
+                    return True
+                batch = self._encode_batch(operations)
+        out, ticket, groups = batch
+        if self._metrics is None:
+            written = self._write(out, ticket, groups)
+        else:
+            start = time.perf_counter()
+            written = self._write(out, ticket, groups)
+            self._metrics.record(operations, groups, time.perf_counter() - start, written)
+        # Only values that reached the port are known to the synth
+        if written and self.state is not None:
+            self._record_written(operations)
+        return written
+
+    def _encode_batch(self, operations: list[Operation]) -> _Batch:
+        """Encode operations for _write_operations() and take their turn to be written. Called with the lock held."""
+        groups: list[int] = []
+        try:
+            for operation in operations:
+                self._encode(operation)
+                groups.append(len(self._out))
+        except Exception:
+            # No ticket is taken, and nothing half-encoded is left for the next batch
+            self._out.clear()
+            self.invalidate_nrpn_selection()
+            self.invalidate_high_res_values()
+            raise
+        out, ticket = self._take_output()
+        return out, ticket, groups
+
+    def _output_ready(self) -> bool:
+        """Check that messages can be sent now, or buffered until a lost port is back."""
+        if self._offline is not None:
+            return True
+        if self.ensure_connected() and self.output_port:
+            return True
+        logger.error('Not connected to any MIDI port')
+        return False
+
+    def _submit(self, operation: Operation, force: bool = False) -> bool:
+        """Send an operation now, queue it for the writer thread, or add it to the open burst."""
+        if self.dedupe_ttl is not None and self.state is not None and self._is_redundant(operation, force):
+            self.suppressed += 1
+            return True
+        burst = getattr(self._local, 'burst', None)
+        if burst is not None:
+            burst.operations.append(operation)
+            return True
+        if self._queue is not None:
+            return self._queue.put(_coalescing_key(operation), operation)
+        return self._write_operations([operation])
+
+    def _is_redundant(self, operation: Operation, force: bool) -> bool:
+        """Check whether an operation writes the value the synth already has, as sent recently."""
+        key = _coalescing_key(operation)
+        if force or key is None:
+            return False
+        with self._sent_lock:
+            sent_at = self._sent_at.get(key)
+        if sent_at is None or time.monotonic() - sent_at >= self.dedupe_ttl:  # type: ignore[operator]
+            return False
+        kind, channel, number, lsb_number, value = operation
+        if kind == NRPN:
+            number, lsb_number = number << 7 | lsb_number, -1
+        # Panel edits merged into the mirror make the value differ, so it is sent again
+        return self.state.value_at(channel + 1, kind, number, lsb_number) == value  # type: ignore[union-attr]
+
+    def _record_written(self, operations: list[Operation]) -> None:
+        """Record the values of written operations in the state mirror and note when they were sent."""
+        now = time.monotonic()
+        for operation in operations:
+            self._record(operation)
+            key = _coalescing_key(operation) if self.dedupe_ttl is not None else None
+            if key is not None:
+                with self._sent_lock:
+                    self._sent_at[key] = now
+
+    def _record(self, operation: Operation) -> None:
+        """Record the value written by an operation in the state mirror."""
+        kind, channel, number, lsb_number, value = operation
+        if kind == PROGRAM_CHANGE:
+            # A new program replaces every value of the channel
+            self.state.clear(channel + 1)  # type: ignore[union-attr]
+            self.invalidate_sent(channel + 1)
+        elif kind in (NOTE_ON, NOTE_OFF):
+            return
+        elif kind == NRPN:
+            self.state.record_nrpn(channel + 1, number << 7 | lsb_number, value)  # type: ignore[union-attr]
+        elif kind == CC14:
+            self.state.record_high_res_cc(channel + 1, number, lsb_number, value)  # type: ignore[union-attr]
+        else:
+            self.state.record_cc(channel + 1, number, value)  # type: ignore[union-attr]
+
+    def _on_input_event(self, event: ParameterEvent) -> None:
+        """Keep the output caches consistent with changes made on the synth."""
+        channel = event.channel - 1
+        if event.kind == PROGRAM_CHANGE:
+            # Patch loaded on the panel: nothing we sent on the channel is current anymore
+            self.invalidate_sent(event.channel)
+            self.invalidate_high_res_values(event.channel)
+        elif event.kind != NRPN:
+            # A 14-bit delta would pair the changed half with a stale one
+            with self._lock:
+                self._forget_high_res_controller(channel, event.number)
+                if event.lsb_number >= 0:
+                    self._forget_high_res_controller(channel, event.lsb_number)
+
+    @contextmanager
+    def burst(self) -> Iterator[Burst]:
+        """
+        Collect the messages sent inside the block and transmit them back to back when it exits.
+
+        The send_* methods only validate and collect while a burst is open, and the collected
+        messages go out (or into the output queue) as one unit. Bursts are per thread; nested
+        bursts join the outermost one.
+
+        Yields:
+            Burst: The open burst. Its `sent` flag tells whether transmission (or queueing) succeeded.
+        """
+        burst = getattr(self._local, 'burst', None)
+        if burst is not None:
+            yield burst
+            return
+
+        burst = self._local.burst = Burst()
+        try:
+            yield burst
+        finally:
+            self._local.burst = None
+            if self._queue is not None:
+                burst.sent = self._queue.put_many((_coalescing_key(op), op) for op in burst.operations)
+            else:
+                burst.sent = self._write_operations(burst.operations)
+
+    def _encode(self, operation: Operation) -> None:
+        """Encode an operation into the output buffer, applying running status and delta encoding."""
+        kind, channel, number, lsb_number, value = operation
+        if kind == NRPN:
+            self._encode_nrpn(channel, number, lsb_number, value)
+        elif kind == CC14:
+            self._encode_high_res_cc(channel, number, lsb_number, value)
+        elif kind == PROGRAM_CHANGE:
+            self._out += bytes((_PROGRAM_CHANGE_STATUS[channel], value))
+            # The new program's values are unknown, so 14-bit deltas no longer apply
+            self.invalidate_high_res_values(channel + 1)
+        elif kind in _NOTE_STATUS:
+            self._out += bytes((_NOTE_STATUS[kind][channel], number, value))
+        else:
+            self._encode_cc(channel, number, value)
+
+    def _encode_cc(self, channel: int, cc: int, value: int) -> None:
+        """Append a CC message for the 0-indexed channel to the output buffer."""
+        self._out += bytes((_CC_STATUS[channel], cc, value))
+        if cc in _PARAMETER_NUMBER_CCS:
+            # Raw (N)RPN select traffic changes the selection behind our back
+            self._selected_nrpn[channel] = None
+        if self._high_res_values:
+            self._forget_high_res_controller(channel, cc)
+
+    def _encode_high_res_cc(self, channel: int, cc_msb: int, cc_lsb: int, value: int) -> None:
+        # Split value into MSB and LSB
+        msb = (value >> 7) & 0x7F  # Most significant 7 bits
+        lsb = value & 0x7F  # Least significant 7 bits
+
+        # In delta mode the LSB goes out alone when the MSB is unchanged since the last write.
+        # Otherwise both halves are sent, MSB first: a receiver resets the LSB to 0 on a new
+        # MSB (MIDI 1.0), so the LSB must follow it. An unchanged value is re-sent in full so
+        # explicit re-writes still reach the synth.
+        key = (channel, cc_msb, cc_lsb)
+        previous = self._high_res_values.get(key) if self.high_res_delta else None
+        status = _CC_STATUS[channel]
+        if previous is not None and previous[0] == msb and previous[1] != lsb:
+            self._out += bytes((status, cc_lsb, lsb))
+        else:
+            self._out += bytes((status, cc_msb, msb, status, cc_lsb, lsb))
+
+        if cc_msb in _PARAMETER_NUMBER_CCS or cc_lsb in _PARAMETER_NUMBER_CCS:
+            self._selected_nrpn[channel] = None
+        # Drop cached pairs sharing either controller; a failed write invalidates ours again
+        self._forget_high_res_controller(channel, cc_msb)
+        self._forget_high_res_controller(channel, cc_lsb)
+        self._high_res_values[key] = (msb, lsb)
+
+    def _encode_nrpn(self, channel: int, nrpn_msb: int, nrpn_lsb: int, value: int) -> None:
+        # Split value into MSB and LSB
+        value_msb = (value >> 7) & 0x7F  # Most significant 7 bits
+        value_lsb = value & 0x7F  # Least significant 7 bits
+
+        # Send NRPN messages in the correct order:
+        # 1. NRPN MSB (CC 99)
+        # 2. NRPN LSB (CC 98)
+        # 3. Data Entry MSB (CC 6)
+        # 4. Data Entry LSB (CC 38)
+        # The select pair is skipped when this NRPN is still selected on the channel.
+        status = _CC_STATUS[channel]
+        if self.nrpn_running_status and self._selected_nrpn[channel] == (nrpn_msb, nrpn_lsb):
+            self._out += bytes((status, 6, value_msb, status, 38, value_lsb))
+        else:
+            self._out += bytes(
+                (status, 99, nrpn_msb, status, 98, nrpn_lsb, status, 6, value_msb, status, 38, value_lsb)
+            )
+            self._selected_nrpn[channel] = (nrpn_msb, nrpn_lsb)
+
+    def send_cc(self, channel: int, cc: int, value: int, force: bool = False) -> bool:
         """
         Send a Control Change (CC) message.
 
@@ -86,12 +975,12 @@ class MIDIManager:
             channel: MIDI channel (1-16)
             cc: Control Change number (0-127)
             value: Control Change value (0-127)
+            force: Send even if the synth already has this value
 
         Returns:
             bool: True if message sent successfully, False otherwise.
         """
-        if not self.connected or not self.output_port:
-            logger.error('Not connected to any MIDI port')
+        if not self._output_ready():
             return False
 
         # Convert 1-indexed channel to 0-indexed
@@ -101,17 +990,16 @@ class MIDIManager:
             logger.error(f'Invalid channel: {channel}. Must be between 1-16.')
             return False
 
-        try:
-            # Create and send the CC message
-            msg = mido.Message('control_change', channel=channel, control=cc, value=value)
-            self.output_port.send(msg)  # type: ignore[attr-defined]
-            logger.debug(f'Sent CC: channel={channel + 1}, cc={cc}, value={value}')
-            return True
-        except Exception as e:
-            logger.error(f'Error sending CC message: {e}')
+        if not (0 <= cc <= 127 and 0 <= value <= 127):
+            logger.error(f'Invalid CC message: cc={cc}, value={value}. Both must be between 0-127.')
+            return False
+
+        if not self._submit((CC, channel, cc, -1, value), force):
             return False
+        logger.debug(f'Sent CC: channel={channel + 1}, cc={cc}, value={value}')
+        return True
 
-    def send_high_res_cc(self, channel: int, cc_msb: int, cc_lsb: int, value: int) -> bool:
+    def send_high_res_cc(self, channel: int, cc_msb: int, cc_lsb: int, value: int, force: bool = False) -> bool:
         """
         Send a high-resolution Control Change (CC) message using MSB and LSB.
 
@@ -120,12 +1008,12 @@ class MIDIManager:
             cc_msb: Control Change number for MSB (0-127)
             cc_lsb: Control Change number for LSB (0-127)
             value: High-resolution value (0-16383)
+            force: Send even if the synth already has this value
 
         Returns:
             bool: True if message sent successfully, False otherwise.
         """
-        if not self.connected or not self.output_port:
-            logger.error('Not connected to any MIDI port')
+        if not self._output_ready():
             return False
 
         # Convert 1-indexed channel to 0-indexed
@@ -140,34 +1028,16 @@ class MIDIManager:
             logger.error(f'Invalid high-res value: {value}. Must be between 0-16383.')
             return False
 
-        try:
-            # Split value into MSB and LSB
-            msb = (value >> 7) & 0x7F  # Most significant 7 bits
-            lsb = value & 0x7F  # Least significant 7 bits
-
-            # First reset both controllers to 0 to ensure proper initialization
-            msg_msb_reset = mido.Message('control_change', channel=channel, control=cc_msb, value=0)
-            msg_lsb_reset = mido.Message('control_change', channel=channel, control=cc_lsb, value=0)
-
-            # Then send the actual values - LSB must be sent before MSB for proper operation
-            msg_lsb = mido.Message('control_change', channel=channel, control=cc_lsb, value=lsb)
-            msg_msb = mido.Message('control_change', channel=channel, control=cc_msb, value=msb)
-
-            # Send messages in the correct order with proper timing
-            self.output_port.send(msg_msb_reset)  # type: ignore[attr-defined]
-            self.output_port.send(msg_lsb_reset)  # type: ignore[attr-defined]
-            self.output_port.send(msg_lsb)  # type: ignore[attr-defined]
-            self.output_port.send(msg_msb)  # type: ignore[attr-defined]
-
-            logger.debug(
-                f'Sent high-res CC: channel={channel + 1}, cc_msb={cc_msb}, cc_lsb={cc_lsb}, value={value} (msb={msb}, lsb={lsb})'
-            )
-            return True
-        except Exception as e:
-            logger.error(f'Error sending high-res CC message: {e}')
+        if not (0 <= cc_msb <= 127 and 0 <= cc_lsb <= 127):
+            logger.error(f'Invalid high-res CC pair: cc_msb={cc_msb}, cc_lsb={cc_lsb}. Must be between 0-127.')
+            return False
+
+        if not self._submit((CC14, channel, cc_msb, cc_lsb, value), force):
             return False
+        logger.debug(f'Sent high-res CC: channel={channel + 1}, cc_msb={cc_msb}, cc_lsb={cc_lsb}, value={value}')
+        return True
 
-    def send_nrpn(self, channel: int, nrpn_msb: int, nrpn_lsb: int, value: int) -> bool:
+    def send_nrpn(self, channel: int, nrpn_msb: int, nrpn_lsb: int, value: int, force: bool = False) -> bool:
         """
         Send a Non-Registered Parameter Number (NRPN) message with high resolution value.
 
@@ -176,12 +1046,12 @@ class MIDIManager:
             nrpn_msb: NRPN Most Significant Byte (CC 99 value, 0-127)
             nrpn_lsb: NRPN Least Significant Byte (CC 98 value, 0-127)
             value: High-resolution value for the parameter (0-16383)
+            force: Send even if the synth already has this value
 
         Returns:
             bool: True if message sent successfully, False otherwise.
         """
-        if not self.connected or not self.output_port:
-            logger.error('Not connected to any MIDI port')
+        if not self._output_ready():
             return False
 
         # Convert 1-indexed channel to 0-indexed
@@ -196,28 +1066,146 @@ class MIDIManager:
             logger.error(f'Invalid NRPN value: {value}. Must be between 0-16383.')
             return False
 
+        if not (0 <= nrpn_msb <= 127 and 0 <= nrpn_lsb <= 127):
+            logger.error(f'Invalid NRPN number: nrpn_msb={nrpn_msb}, nrpn_lsb={nrpn_lsb}. Must be between 0-127.')
+            return False
+
+        if not self._submit((NRPN, channel, nrpn_msb, nrpn_lsb, value), force):
+            return False
+        logger.debug(f'Sent NRPN: channel={channel + 1}, nrpn_msb={nrpn_msb}, nrpn_lsb={nrpn_lsb}, value={value}')
+        return True
+
+    def send_program_change(self, channel: int, program: int) -> bool:
+        """
+        Send a Program Change message.
+
+        Args:
+            channel: MIDI channel (1-16)
+            program: Program number (0-127)
+
+        Returns:
+            bool: True if message sent successfully, False otherwise.
+        """
+        if not self._output_ready():
+            return False
+
+        # Convert 1-indexed channel to 0-indexed
+        if 1 <= channel <= 16:
+            channel = channel - 1
+        else:
+            logger.error(f'Invalid channel: {channel}. Must be between 1-16.')
+            return False
+
+        if not 0 <= program <= 127:
+            logger.error(f'Invalid program: {program}. Must be between 0-127.')
+            return False
+
+        if not self._submit((PROGRAM_CHANGE, channel, -1, -1, program)):
+            return False
+        logger.debug(f'Sent program change: channel={channel + 1}, program={program}')
+        return True
+
+    def send_note_on(self, channel: int, note: int, velocity: int = 100) -> bool:
+        """
+        Send a Note On message.
+
+        Args:
+            channel: MIDI channel (1-16)
+            note: Note number (0-127, 60 is middle C)
+            velocity: Velocity (1-127; 0 is sent as Note Off)
+
+        Returns:
+            bool: True if message sent successfully, False otherwise.
+        """
+        return self._send_note(NOTE_ON if velocity else NOTE_OFF, channel, note, velocity)
+
+    def send_note_off(self, channel: int, note: int, velocity: int = 64) -> bool:
+        """
+        Send a Note Off message.
+
+        Args:
+            channel: MIDI channel (1-16)
+            note: Note number (0-127, 60 is middle C)
+            velocity: Release velocity (0-127)
+
+        Returns:
+            bool: True if message sent successfully, False otherwise.
+        """
+        return self._send_note(NOTE_OFF, channel, note, velocity)
+
+    def _send_note(self, kind: str, channel: int, note: int, velocity: int) -> bool:
+        if not self._output_ready():
+            return False
+
+        # Convert 1-indexed channel to 0-indexed
+        if 1 <= channel <= 16:
+            channel = channel - 1
+        else:
+            logger.error(f'Invalid channel: {channel}. Must be between 1-16.')
+            return False
+
+        if not 0 <= note <= 127:
+            logger.error(f'Invalid note: {note}. Must be between 0-127.')
+            return False
+
+        if not 0 <= velocity <= 127:
+            logger.error(f'Invalid velocity: {velocity}. Must be between 0-127.')
+            return False
+
+        if not self._submit((kind, channel, note, -1, velocity)):
+            return False
+        logger.debug(f'Sent {kind}: channel={channel + 1}, note={note}, velocity={velocity}')
+        return True
+
+    def send_realtime(self, status: int) -> bool:
+        """
+        Send a System Real-Time message (Timing Clock, Start, Continue, Stop, ...) immediately.
+
+        Real-time messages bypass the output queue, coalescing and pacing, and may go out between
+        the messages of a paced group, as MIDI allows, so clock pulses are never held back.
+
+        Args:
+            status: Status byte (0xF8, 0xFA, 0xFB, 0xFC, 0xFE or 0xFF)
+
+        Returns:
+            bool: True if message sent successfully, False otherwise.
+        """
+        if status not in _REALTIME_STATUSES:
+            logger.error(f'Invalid real-time status: {status:#04x}')
+            return False
+
+        if self._offline is not None:
+            return False  # not buffered: a late clock pulse or transport message is wrong
+        self.ensure_connected()
         try:
-            # Split value into MSB and LSB
-            value_msb = (value >> 7) & 0x7F  # Most significant 7 bits
-            value_lsb = value & 0x7F  # Least significant 7 bits
-
-            # Send NRPN messages in the correct order:
-            # 1. NRPN MSB (CC 99)
-            # 2. NRPN LSB (CC 98)
-            # 3. Data Entry MSB (CC 6)
-            # 4. Data Entry LSB (CC 38)
-            msg_nrpn_msb = mido.Message('control_change', channel=channel, control=99, value=nrpn_msb)
-            msg_nrpn_lsb = mido.Message('control_change', channel=channel, control=98, value=nrpn_lsb)
-            msg_data_msb = mido.Message('control_change', channel=channel, control=6, value=value_msb)
-            msg_data_lsb = mido.Message('control_change', channel=channel, control=38, value=value_lsb)
-
-            self.output_port.send(msg_nrpn_msb)  # type: ignore[attr-defined]
-            self.output_port.send(msg_nrpn_lsb)  # type: ignore[attr-defined]
-            self.output_port.send(msg_data_msb)  # type: ignore[attr-defined]
-            self.output_port.send(msg_data_lsb)  # type: ignore[attr-defined]
-
-            logger.debug(f'Sent NRPN: channel={channel + 1}, nrpn_msb={nrpn_msb}, nrpn_lsb={nrpn_lsb}, value={value}')
+            with self._port_lock:
+                if not self.connected or not self.output_port:
+                    logger.error('Not connected to any MIDI port')
+                    return False
+                if self._raw_output is not None:
+                    self._raw_output.send_message((status,))
+                else:
+                    self.output_port.send(mido.Message.from_bytes((status,)))  # type: ignore[attr-defined]
+            if self._metrics is not None:
+                self._metrics.record_message('realtime', 1)
             return True
         except Exception as e:
-            logger.error(f'Error sending NRPN message: {e}')
+            logger.error(f'Error writing MIDI output: {e}')
             return False
+
+
+def _coalescing_key(operation: Operation) -> Optional[tuple[str, int, int, int]]:
+    """Identify the controller an operation writes, or None if the operation must not be merged."""
+    if operation[0] in _MESSAGE_KINDS or (operation[0] == CC and operation[2] in _UNCOALESCED_CCS):
+        return None
+    return operation[:4]
+
+
+def _message_bounds(data: memoryview) -> Iterator[tuple[int, int]]:
+    """Yield the (start, end) offsets of each complete MIDI message in an encoded buffer."""
+    size = len(data)
+    start = 0
+    while start < size:
+        end = start + _MESSAGE_LENGTHS[data[start]]
+        yield start, end
+        start = end
@@ -0,0 +1,297 @@
+"""
+Patch Morphing
+
+This module morphs the sound on a channel from one patch to another over time.
+On every tick of a fixed-rate time grid, the continuous parameters are computed
+together as one vector interpolation, the discrete ones (selectors and switches)
+change over at a crossover point, and the values that changed go out as one burst.
+The output queue coalesces writes still pending from the previous tick and the
+rate limiter paces the rest, and the tick rate is capped so a full tick fits the
+output bandwidth.
+"""
+
+import itertools
+import operator
+import threading
+from itertools import compress, repeat
+from typing import Any, Optional
+
+from moog_sub37_mcp.midi.automation import CURVES, DEFAULT_RATE, MAX_RATE
+from moog_sub37_mcp.midi.midi_manager import MIDIManager
+from moog_sub37_mcp.midi.parameters import CC, CC14, NRPN, ParameterRegistry, ParameterSpec
+from moog_sub37_mcp.midi.scheduler import ScheduledEvent
+
+try:
+    import numpy as np
+except ImportError:  # ticks fall back to interpolating with map()
+    np = None
+
+# Largest number of bytes a write takes on the wire, by transport kind (an NRPN with its select pair)
+MESSAGE_BYTES = {CC: 3, CC14: 6, NRPN: 12}
+
+# Share of the output byte rate a morph plans to use, leaving room for other messages
+BANDWIDTH_SHARE = 0.8
+
+
+def is_continuous(spec: ParameterSpec) -> bool:
+    """Whether a parameter is a continuous control, interpolated while morphing, rather than a selector or switch."""
+    return not spec.labels and spec.max_value - spec.min_value >= 127
+
+
+class Morph:
+    """A channel moving from one patch to another."""
+
+    def __init__(
+        self,
+        morph_id: int,
+        channel: int,
+        continuous: list[tuple[ParameterSpec, int, int]],
+        discrete: list[tuple[ParameterSpec, Optional[int], Optional[int]]],
+        duration: float,
+        crossover: float,
+        curve: str,
+        rate: float,
+        started_ns: int,
+        source_name: Optional[str] = None,
+        target_name: Optional[str] = None,
+    ):
+        self.id = morph_id
+        self.channel = channel
+        self.duration = duration
+        self.crossover = crossover
+        self.curve = curve
+        self.source_name = source_name
+        self.target_name = target_name
+        self.period_ns = round(1e9 / rate)
+        self.duration_ns = round(duration * 1e9)
+        self.started_ns = started_ns
+        self.tick = 0  # index of the next update on the morph's time grid
+        self.progress = 0.0
+        self.sent = 0
+        self.event: Optional[ScheduledEvent] = None  # next scheduled update
+
+        # Interpolated parameters as parallel vectors: value = start + delta * position
+        self.specs = [spec for spec, _, _ in continuous]
+        starts = [float(start) for _, start, _ in continuous]
+        deltas = [float(end - start) for _, start, end in continuous]
+        if np is not None:
+            self._starts: Any = np.array(starts)
+            self._deltas: Any = np.array(deltas)
+            self._values: Any = np.full(len(starts), -1)
+        else:
+            self._starts, self._deltas, self._values = starts, deltas, [-1] * len(starts)
+
+        # Switched parameters: (spec, value before the crossover, value after), None for no value
+        self.discrete = discrete
+        self._after_crossover: Optional[bool] = None
+
+    @property
+    def next_ns(self) -> int:
+        """Time of the next update: the next tick of the grid, or the end of the morph."""
+        return self.started_ns + min(self.tick * self.period_ns, self.duration_ns)
+
+    def changes_at(self, elapsed_ns: int) -> list[tuple[ParameterSpec, int]]:
+        """
+        Compute the values `elapsed_ns` after the start and return those that changed since the last call.
+
+        Args:
+            elapsed_ns: Time since the start of the morph in nanoseconds.
+
+        Returns:
+            list: (parameter, value) pairs to send.
+        """
+        progress = min(1.0, max(0.0, elapsed_ns / self.duration_ns))
+        self.progress = progress
+        position = CURVES[self.curve](progress)
+
+        if np is not None:
+            values = np.rint(self._starts + self._deltas * position).astype(self._values.dtype)
+            changed = np.flatnonzero(values != self._values).tolist()
+            self._values = values
+            values = values.tolist()
+        else:
+            values = list(
+                map(round, map(operator.add, self._starts, map(operator.mul, self._deltas, repeat(position))))
+            )
+            changed = list(compress(range(len(values)), map(operator.ne, values, self._values)))
+            self._values = values
+        changes = [(self.specs[index], values[index]) for index in changed]
+
+        after_crossover = progress >= self.crossover
+        if after_crossover != self._after_crossover:
+            self._after_crossover = after_crossover
+            side = 2 if after_crossover else 1
+            changes.extend((entry[0], entry[side]) for entry in self.discrete if entry[side] is not None)
+        return changes
+
+    def to_dict(self) -> dict[str, Any]:
+        """Morph as a JSON-friendly dict."""
+        return {
+            'id': self.id,
+            'channel': self.channel,
+            'from': self.source_name,
+            'to': self.target_name,
+            'duration': self.duration,
+            'crossover': self.crossover,
+            'curve': self.curve,
+            'rate': round(1e9 / self.period_ns, 3),
+            'interpolated': len(self.specs),
+            'switched': len(self.discrete),
+            'progress': round(self.progress, 4),
+            'sent': self.sent,
+        }
+
+
+class PatchMorpher:
+    """Runner of patch morphs, at most one per channel, on the MIDI interface's scheduler."""
+
+    def __init__(self, midi: MIDIManager, registry: ParameterRegistry):
+        """
+        Initialize the morpher.
+
+        Args:
+            midi: The MIDI interface the morphs write to.
+            registry: The parameters patches are named after.
+        """
+        self.midi = midi
+        self.registry = registry
+        self._morphs: dict[int, Morph] = {}  # by channel
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def start(
+        self,
+        channel: int,
+        source: dict[str, int],
+        target: dict[str, int],
+        duration: float,
+        crossover: float = 0.5,
+        curve: str = 'linear',
+        rate: float = DEFAULT_RATE,
+        source_name: Optional[str] = None,
+        target_name: Optional[str] = None,
+    ) -> Morph:
+        """
+        Start morphing a channel, replacing any morph already running on it.
+
+        Continuous parameters set in both patches are interpolated. Selectors and switches, and
+        parameters set in the target only, change at the crossover point; parameters set in the
+        source only are sent at the start and left there.
+
+        Args:
+            channel: MIDI channel (1-16)
+            source: Parameter name to value at the start.
+            target: Parameter name to value at the end.
+            duration: Length of the morph in seconds.
+            crossover: Progress from 0 to 1 at which discrete parameters switch to the target.
+            curve: 'linear', 'exponential', 'logarithmic' or 's_curve'.
+            rate: Updates per second, lowered if a full update would not fit the output byte rate.
+            source_name: Name of the source patch, for display.
+            target_name: Name of the target patch, for display.
+
+        Returns:
+            Morph: The started morph.
+
+        Raises:
+            KeyError: If a parameter does not exist.
+            ValueError: If an argument is out of range.
+        """
+        if curve not in CURVES:
+            raise ValueError(f'Invalid curve: {curve}. Must be one of {", ".join(CURVES)}.')
+        if duration <= 0:
+            raise ValueError(f'Invalid duration: {duration}. Must be positive.')
+        if not 0 <= crossover <= 1:
+            raise ValueError(f'Invalid crossover: {crossover}. Must be between 0-1.')
+        if not 0 < rate <= MAX_RATE:
+            raise ValueError(f'Invalid rate: {rate}. Must be between 0-{MAX_RATE:g} updates per second.')
+
+        continuous: list[tuple[ParameterSpec, int, int]] = []
+        discrete: list[tuple[ParameterSpec, Optional[int], Optional[int]]] = []
+        for name in {**source, **target}:
+            spec = self.registry.get(name)
+            if spec is None:
+                raise KeyError(name)
+            start, end = source.get(name), target.get(name)
+            for value in (start, end):
+                error = spec.validate(value) if value is not None else None
+                if error:
+                    raise ValueError(error)
+            if start is not None and end is not None and start != end and is_continuous(spec):
+                continuous.append((spec, start, end))
+            else:
+                discrete.append((spec, start, end))
+
+        bytes_per_second = self.midi.output_stats().get('bytes_per_second')
+        tick_bytes = sum(MESSAGE_BYTES[spec.kind] for spec, _, _ in continuous)
+        if bytes_per_second and tick_bytes:
+            rate = min(rate, BANDWIDTH_SHARE * bytes_per_second / tick_bytes)
+
+        scheduler = self.midi.scheduler
+        morph = Morph(
+            next(self._ids),
+            channel,
+            continuous,
+            discrete,
+            duration,
+            crossover,
+            curve,
+            rate,
+            scheduler.now_ns(),
+            source_name,
+            target_name,
+        )
+        with self._lock:
+            replaced = self._morphs.get(channel)
+            if replaced is not None and replaced.event is not None:
+                replaced.event.cancel()
+            self._morphs[channel] = morph
+            morph.event = scheduler.schedule_at(morph.next_ns, self._update, morph)
+        return morph
+
+    def stop(self, channel: Optional[int] = None) -> list[Morph]:
+        """
+        Stop morphs, leaving their parameters at their current value.
+
+        Args:
+            channel: Only stop the morph on this MIDI channel (1-16).
+
+        Returns:
+            list: The stopped morphs.
+        """
+        with self._lock:
+            stopped = [morph for key, morph in self._morphs.items() if channel is None or key == channel]
+            for morph in stopped:
+                del self._morphs[morph.channel]
+                if morph.event is not None:
+                    morph.event.cancel()
+        return stopped
+
+    def active(self) -> list[Morph]:
+        """List the running morphs."""
+        with self._lock:
+            return list(self._morphs.values())
+
+    def _update(self, morph: Morph) -> None:
+        """Send the values of the current tick and schedule the next one. Runs on the scheduler thread."""
+        # Values follow the tick's nominal time, so timing jitter does not distort the curves
+        elapsed_ns = morph.next_ns - morph.started_ns
+        finished = elapsed_ns >= morph.duration_ns
+        changes = morph.changes_at(elapsed_ns)
+        if changes:
+            with self.midi.burst() as burst:
+                for spec, value in changes:
+                    # The last update is forced so the morph always lands on the target
+                    spec.send(self.midi, morph.channel, value, force=finished)
+            if burst.sent:
+                morph.sent += len(changes)
+
+        with self._lock:
+            if self._morphs.get(morph.channel) is not morph:
+                return  # stopped or replaced meanwhile
+            if finished:
+                del self._morphs[morph.channel]
+                return
+            # Stay on the time grid, skipping the ticks missed while late
+            late_ticks = (self.midi.scheduler.now_ns() - morph.started_ns) // morph.period_ns
+            morph.tick = max(morph.tick + 1, late_ticks + 1)
+            morph.event = self.midi.scheduler.schedule_at(morph.next_ns, self._update, morph)
@@ -0,0 +1,246 @@
+"""
+MIDI Output Queue
+
+This module provides a bounded queue of pending MIDI operations drained by a
+dedicated writer thread, so callers never block on a slow or stalled MIDI port.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Back-pressure policies applied when the queue is full
+BLOCK = 'block'
+DROP_OLDEST = 'drop_oldest'
+COALESCE = 'coalesce'
+POLICIES = (BLOCK, DROP_OLDEST, COALESCE)
+
+
+class OutputQueue:
+    """Bounded queue of MIDI operations with a writer thread."""
+
+    def __init__(
+        self,
+        write_batch: Callable[[list[Any]], object],
+        maxsize: int = 1024,
+        policy: str = BLOCK,
+        coalesce: bool = False,
+        max_batch: Optional[int] = None,
+        name: str = 'midi-writer',
+    ):
+        """
+        Initialize the queue and start its writer thread.
+
+        Args:
+            write_batch: Called from the writer thread with every operation pending at once, in order.
+                Its return value is ignored.
+            maxsize: Maximum number of pending operations.
+            policy: What to do when the queue is full: 'block' the caller until there is room,
+                'drop_oldest' pending operation, or 'coalesce' into the pending operation with the
+                same key (falling back to dropping the oldest one).
+            coalesce: Always merge an operation into the pending operation with the same key, keeping
+                the pending operation's place in the queue, so only the latest value is written.
+            max_batch: Maximum number of operations handed to write_batch at once, None for all pending.
+            name: Name of the writer thread.
+
+        Raises:
+            ValueError: If the policy is unknown or maxsize is not positive.
+        """
+        if policy not in POLICIES:
+            raise ValueError(f'Invalid back-pressure policy: {policy}. Must be one of {", ".join(POLICIES)}.')
+        if maxsize < 1:
+            raise ValueError(f'Invalid queue size: {maxsize}. Must be at least 1.')
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.coalesce = coalesce
+        self.max_batch = max_batch
+        self.enqueued = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+        self._write_batch = write_batch
+        # Pending entries are [key, operation] lists so coalescing can replace an operation in place
+        self._pending: deque[list[Any]] = deque()
+        self._by_key: dict[Hashable, list[Any]] = {}
+        self._writing = False
+        self._closed = False
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def put(self, key: Optional[Hashable], operation: Any, timeout: Optional[float] = None) -> bool:
+        """
+        Enqueue an operation.
+
+        Args:
+            key: Identity of the controller the operation writes, used for coalescing. None never coalesces.
+            operation: The operation passed to the writer.
+            timeout: With the 'block' policy, seconds to wait for room (None waits forever).
+
+        Returns:
+            bool: True if the operation was enqueued or merged, False if it was dropped.
+        """
+        return self.put_many(((key, operation),), timeout)
+
+    def put_many(self, entries: Iterable[tuple[Optional[Hashable], Any]], timeout: Optional[float] = None) -> bool:
+        """
+        Enqueue several operations back to back, without interleaving other callers.
+
+        Args:
+            entries: (key, operation) pairs, in order.
+            timeout: With the 'block' policy, seconds to wait for room (None waits forever).
+
+        Returns:
+            bool: True if every operation was enqueued or merged, False if any was dropped.
+        """
+        ok = True
+        with self._lock:
+            if self._closed:
+                logger.error('MIDI output queue is closed')
+                return False
+            for key, operation in entries:
+                ok = self._put_locked(key, operation, timeout) and ok
+            self._not_empty.notify()
+        return ok
+
+    def _put_locked(self, key: Optional[Hashable], operation: Any, timeout: Optional[float]) -> bool:
+        if key is not None and (self.coalesce or (self.policy == COALESCE and len(self._pending) >= self.maxsize)):
+            pending = self._by_key.get(key)
+            if pending is not None:
+                pending[1] = operation
+                self.coalesced += 1
+                return True
+
+        if len(self._pending) >= self.maxsize:
+            if self.policy == BLOCK:
+                self._not_empty.notify()
+                if not self._not_full.wait_for(lambda: len(self._pending) < self.maxsize, timeout):
+                    self.dropped += 1
+                    logger.warning('MIDI output queue full, dropping operation')
+                    return False
+            else:
+                self._drop_oldest()
+
+        entry = [key, operation]
+        self._pending.append(entry)
+        if key is not None:
+            self._by_key[key] = entry
+        self.enqueued += 1
+        return True
+
+    def _drop_oldest(self) -> None:
+        key, _ = oldest = self._pending.popleft()
+        if key is not None and self._by_key.get(key) is oldest:
+            del self._by_key[key]
+        self.dropped += 1
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the queue counters.
+
+        Returns:
+            dict: Pending operation count, maximum size, policy, and the number of operations
+                enqueued, coalesced into a pending one and dropped since the queue was created.
+        """
+        with self._lock:
+            return {
+                'depth': len(self._pending),
+                'maxsize': self.maxsize,
+                'policy': self.policy,
+                'enqueued': self.enqueued,
+                'coalesced': self.coalesced,
+                'dropped': self.dropped,
+            }
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every pending operation has been written.
+
+        Args:
+            timeout: Seconds to wait (None waits forever).
+
+        Returns:
+            bool: True if the queue drained in time, False otherwise.
+        """
+        if threading.current_thread() is self._thread:
+            return True
+        with self._lock:
+            return self._idle.wait_for(lambda: not self._pending and not self._writing, timeout)
+
+    async def flush_async(self, timeout: Optional[float] = None) -> bool:
+        """Await flush() without blocking the event loop."""
+        return await asyncio.to_thread(self.flush, timeout)
+
+    def clear(self) -> int:
+        """
+        Discard every pending operation.
+
+        Returns:
+            int: Number of operations discarded.
+        """
+        with self._lock:
+            count = len(self._pending)
+            self._pending.clear()
+            self._by_key.clear()
+            self._not_full.notify_all()
+            self._idle.notify_all()
+            return count
+
+    def close(self, timeout: Optional[float] = 1.0) -> None:
+        """
+        Write what is pending and stop the writer thread.
+
+        Args:
+            timeout: Seconds to wait for the writer thread to finish.
+        """
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify()
+        self._thread.join(timeout)
+
+    def _take_batch(self) -> Optional[list[Any]]:
+        with self._lock:
+            self._not_empty.wait_for(lambda: self._pending or self._closed)
+            if not self._pending:
+                return None
+            if self.max_batch is None or len(self._pending) <= self.max_batch:
+                batch = [operation for _, operation in self._pending]
+                self._pending.clear()
+                self._by_key.clear()
+            else:
+                batch = []
+                for _ in range(self.max_batch):
+                    key, operation = entry = self._pending.popleft()
+                    if key is not None and self._by_key.get(key) is entry:
+                        del self._by_key[key]
+                    batch.append(operation)
+            self._writing = True
+            self._not_full.notify_all()
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if batch is None:
+                return
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                logger.error(f'Error in MIDI writer thread: {e}')
+            finally:
+                with self._lock:
+                    self._writing = False
+                    self._idle.notify_all()
@@ -0,0 +1,188 @@
+"""
+Parameter Registry
+
+This module describes every Sub 37 parameter reachable over MIDI.
+Each parameter is a compact, tuple-backed ParameterSpec holding its transport
+(CC, 14-bit CC pair or NRPN), its MIDI address and its value range, and a
+ParameterRegistry indexes them for O(1) lookup by name or by MIDI address.
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from moog_sub37_mcp.midi.midi_manager import MIDIManager
+
+# Transport kinds
+CC = 'cc'
+CC14 = 'cc14'
+NRPN = 'nrpn'
+
+# Message kind of a Program Change, carrying the program as its value (not a parameter kind)
+PROGRAM_CHANGE = 'program_change'
+
+# Message kinds of Note On and Note Off, carrying the note as number and the velocity as value
+NOTE_ON = 'note_on'
+NOTE_OFF = 'note_off'
+
+# Value labels shared by several switch-like CC parameters
+ON_OFF = ((0, 'OFF'), (64, 'ON'))
+OSC_SELECT = ((0, 'OSC1 + OSC2'), (43, 'OSC1'), (85, 'OSC2'))
+
+
+class ParameterSpec(NamedTuple):
+    """Static description of one MIDI-controllable parameter."""
+
+    name: str
+    section: str
+    kind: str
+    number: int  # CC number, CC MSB number of a 14-bit pair, or NRPN number
+    lsb_number: int  # CC LSB number of a 14-bit pair, -1 otherwise
+    label: str
+    min_value: int
+    max_value: int
+    labels: tuple[tuple[int, str], ...] = ()
+    note: str = ''
+
+    @property
+    def tool_name(self) -> str:
+        """Name of the MCP tool setting this parameter."""
+        return f'set_{self.name}'
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Transport kind and (MSB) number, unique per physical control."""
+        return self.kind, self.number
+
+    @property
+    def address_text(self) -> str:
+        """Human-readable MIDI address, as used in the tool descriptions."""
+        if self.kind == CC14:
+            return f'CC #{self.number} [MSB], CC #{self.lsb_number} [LSB]'
+        if self.kind == NRPN:
+            return f'NRPN {self.number}, MSB {self.number >> 7}, LSB {self.number & 0x7F}'
+        return f'CC #{self.number}'
+
+    def validate(self, value: int) -> Optional[str]:
+        """
+        Check a value against the parameter range.
+
+        Args:
+            value: Value to check
+
+        Returns:
+            Optional[str]: An error message, or None if the value is valid.
+        """
+        if not self.min_value <= value <= self.max_value:
+            return f'Invalid value for {self.name}: {value}. Must be between {self.min_value}-{self.max_value}.'
+        return None
+
+    def send(self, midi: 'MIDIManager', channel: int, value: int, force: bool = False) -> bool:
+        """
+        Send a value for this parameter.
+
+        Args:
+            midi: The MIDI interface
+            channel: MIDI channel (1-16)
+            value: Parameter value
+            force: Send even if the synth already has this value
+
+        Returns:
+            bool: True if message sent successfully, False otherwise.
+        """
+        if self.kind == NRPN:
+            return midi.send_nrpn(channel, self.number >> 7, self.number & 0x7F, value, force)
+        if self.kind == CC14:
+            return midi.send_high_res_cc(channel, self.number, self.lsb_number, value, force)
+        return midi.send_cc(channel, self.number, value, force)
+
+
+def cc(
+    name: str,
+    number: int,
+    label: str,
+    max_value: int = 127,
+    labels: tuple[tuple[int, str], ...] = (),
+    note: str = '',
+    min_value: int = 0,
+) -> ParameterSpec:
+    """Describe a 7-bit Control Change parameter."""
+    return ParameterSpec(name, '', CC, number, -1, label, min_value, max_value, labels, note)
+
+
+def cc14(name: str, msb: int, lsb: int, label: str, max_value: int = 16383, note: str = '') -> ParameterSpec:
+    """Describe a 14-bit Control Change parameter sent as an MSB/LSB pair."""
+    return ParameterSpec(name, '', CC14, msb, lsb, label, 0, max_value, (), note)
+
+
+def nrpn(
+    name: str, number: int, label: str, max_value: int = 16383, labels: tuple[tuple[int, str], ...] = (), note: str = ''
+) -> ParameterSpec:
+    """Describe a Non-Registered Parameter Number parameter."""
+    return ParameterSpec(name, '', NRPN, number, -1, label, 0, max_value, labels, note)
+
+
+def section_parameters(section: str, *specs: ParameterSpec) -> tuple[ParameterSpec, ...]:
+    """Assign a section to a table of parameter specs."""
+    return tuple(spec._replace(section=section) for spec in specs)
+
+
+class ParameterRegistry:
+    """Index of parameter specs by name and by MIDI address."""
+
+    __slots__ = ('_by_address', '_by_name', '_ids', '_specs')
+
+    def __init__(self, specs: Iterable[ParameterSpec]):
+        """
+        Build the registry.
+
+        Args:
+            specs: Parameter specs. When several specs share a MIDI address the first one
+                is the canonical parameter for reverse lookups.
+
+        Raises:
+            ValueError: If two specs share the same name.
+        """
+        self._specs = tuple(specs)
+        self._by_name: dict[str, ParameterSpec] = {}
+        self._ids: dict[str, int] = {}
+        self._by_address: dict[tuple[str, int], ParameterSpec] = {}
+
+        for parameter_id, spec in enumerate(self._specs):
+            if spec.name in self._by_name:
+                raise ValueError(f'Duplicate parameter name: {spec.name}')
+            self._by_name[spec.name] = spec
+            self._ids[spec.name] = parameter_id
+            self._by_address.setdefault(spec.address, spec)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def __iter__(self) -> Iterator[ParameterSpec]:
+        return iter(self._specs)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
+
+    def get(self, name: str) -> Optional[ParameterSpec]:
+        """Look up a parameter by name, with or without the `set_` tool prefix."""
+        spec = self._by_name.get(name)
+        if spec is None and name.startswith('set_'):
+            spec = self._by_name.get(name[4:])
+        return spec
+
+    def parameter_id(self, name: str) -> int:
+        """Stable integer id of a parameter, usable as an array index."""
+        return self._ids[name]
+
+    def lookup(self, kind: str, number: int) -> Optional[ParameterSpec]:
+        """Look up the canonical parameter at a MIDI address (CC14 pairs by their MSB number)."""
+        return self._by_address.get((kind, number))
+
+    def sections(self) -> list[str]:
+        """List section names in registration order."""
+        return list(dict.fromkeys(spec.section for spec in self._specs))
+
+    def in_section(self, section: str) -> list[ParameterSpec]:
+        """List the parameters of one section."""
+        return [spec for spec in self._specs if spec.section == section]
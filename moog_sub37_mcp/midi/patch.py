@@ -0,0 +1,122 @@
+"""
+Patch Diff
+
+This module works out the writes that turn the sound on a channel into a target
+patch: only the parameters whose value differs from the state mirror, ordered so
+the switch does not glitch audibly, and sent as a single burst.
+"""
+
+from typing import Any, NamedTuple, Optional
+
+from moog_sub37_mcp.midi.midi_manager import MIDIManager
+from moog_sub37_mcp.midi.parameters import ParameterRegistry, ParameterSpec
+from moog_sub37_mcp.midi.synth_state import SynthState
+
+# Parameters setting the output level: the mixer levels and the master volume. Lowering a
+# level is written before the rest of the patch and raising it after, so the sound never
+# plays louder mid-switch than at either end.
+LEVEL_PARAMETERS = frozenset(
+    (
+        'osc1_level',
+        'osc1_sub_level',
+        'osc2_level',
+        'sub_osc_level',
+        'noise_level',
+        'feedback_ext_level',
+        'master_volume',
+        'master_volume_high_res',
+    )
+)
+
+
+class PatchChange(NamedTuple):
+    """One write of a patch switch."""
+
+    spec: ParameterSpec
+    old: Optional[int]  # value in the state mirror, None if unknown
+    new: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Change as a JSON-friendly dict."""
+        return {'parameter': self.spec.name, 'old': self.old, 'new': self.new}
+
+
+def diff_patch(
+    registry: ParameterRegistry,
+    state: Optional[SynthState],
+    channel: int,
+    target: dict[str, int],
+) -> list[PatchChange]:
+    """
+    List the writes needed to reach a patch, in the order to send them.
+
+    Args:
+        registry: The parameters the target is named after.
+        state: Mirror of the current values; without it every value is written.
+        channel: MIDI channel (1-16)
+        target: Parameter name to value. Names must exist in the registry.
+
+    Returns:
+        list: The parameters whose value differs or is unknown: level decreases first, then the
+            other parameters in registry order, then level increases and levels of unknown value.
+
+    Raises:
+        KeyError: If a parameter does not exist.
+        ValueError: If a value is out of range.
+    """
+    lowered: list[PatchChange] = []
+    changes: list[PatchChange] = []
+    raised: list[PatchChange] = []
+    for name, value in target.items():
+        spec = registry.get(name)
+        if spec is None:
+            raise KeyError(name)
+        error = spec.validate(value)
+        if error:
+            raise ValueError(error)
+
+        old = state.get(channel, spec.name) if state is not None else None
+        if old == value:
+            continue
+        change = PatchChange(spec, old, value)
+        if spec.name not in LEVEL_PARAMETERS:
+            changes.append(change)
+        elif old is not None and value < old:
+            lowered.append(change)
+        else:
+            raised.append(change)
+
+    order = registry.parameter_id
+    changes.sort(key=lambda change: order(change.spec.name))
+    return lowered + changes + raised
+
+
+def apply_patch(
+    midi: MIDIManager,
+    registry: ParameterRegistry,
+    channel: int,
+    target: dict[str, int],
+) -> tuple[list[PatchChange], bool]:
+    """
+    Send the writes needed to reach a patch as one burst, paced by the MIDI interface.
+
+    Args:
+        midi: The MIDI interface, whose state mirror gives the current values.
+        registry: The parameters the target is named after.
+        channel: MIDI channel (1-16)
+        target: Parameter name to value.
+
+    Returns:
+        tuple: The changes sent, and whether the burst was sent (or queued) successfully.
+
+    Raises:
+        KeyError: If a parameter does not exist.
+        ValueError: If a value is out of range.
+    """
+    changes = diff_patch(registry, midi.state, channel, target)
+    if not changes:
+        return changes, True
+    with midi.burst() as burst:
+        for change in changes:
+            change.spec.send(midi, channel, change.new)
+    return changes, burst.sent
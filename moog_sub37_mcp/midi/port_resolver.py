@@ -0,0 +1,201 @@
+"""
+MIDI Port Resolver
+
+This module finds the MIDI port of a device from a partial name. Port names depend on the
+platform and backend: 'Moog Sub 37' on macOS is 'Moog Sub 37:Moog Sub 37 MIDI 1 20:0' with
+ALSA on Linux, where the trailing client:port id also changes when the device is replugged.
+
+A name is matched, in order of preference, exactly, case-insensitively, by ALSA client:port
+id ('20:0') and by case-insensitive substring. The port each name resolved to is cached on
+disk, so later startups open it directly instead of enumerating the ports first.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Optional, cast
+
+import mido
+
+logger = logging.getLogger(__name__)
+
+# ALSA client:port id, as it ends ALSA port names
+_CLIENT_PORT = re.compile(r'\d+:\d+')
+
+
+def default_cache_path() -> Path:
+    """Get the port cache file in the user cache directory ($XDG_CACHE_HOME or ~/.cache)."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_home) / 'moog-sub37-mcp' / 'ports.json'
+
+
+def _normalize(name: str) -> str:
+    return ' '.join(name.split()).casefold()
+
+
+def match_port(query: str, names: list[str]) -> Optional[str]:
+    """
+    Find the port a possibly partial name refers to.
+
+    Args:
+        query: Port name, part of it (e.g. 'sub 37'), or ALSA client:port id (e.g. '20:0').
+        names: Available port names.
+
+    Returns:
+        str: The best match, the first listed among equally good ones, or None if no port matches.
+    """
+    if query in names:
+        return query
+    wanted = _normalize(query)
+    if not wanted:
+        return None
+    normalized = [_normalize(name) for name in names]
+
+    for name, candidate in zip(names, normalized):
+        if candidate == wanted:
+            return name
+    if _CLIENT_PORT.fullmatch(wanted):
+        for name, candidate in zip(names, normalized):
+            if candidate.endswith(f' {wanted}'):
+                return name
+
+    matches = [name for name, candidate in zip(names, normalized) if wanted in candidate]
+    if len(matches) > 1:
+        logger.debug(f'MIDI port name {query!r} matches {matches}, using {matches[0]!r}')
+    return matches[0] if matches else None
+
+
+class PortResolver:
+    """Resolves partial MIDI port names, remembering each resolution on disk."""
+
+    def __init__(
+        self,
+        cache_path: Optional[os.PathLike[str]] = None,
+        list_ports: Optional[Callable[[], list[str]]] = None,
+    ):
+        """
+        Initialize the resolver.
+
+        Args:
+            cache_path: JSON file remembering the port each name resolved to, None for no cache.
+                The file is created on the first resolution.
+            list_ports: Returns the available output port names (default is mido.get_output_names).
+        """
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self._list_ports: Callable[[], list[str]] = list_ports or mido.get_output_names  # type: ignore[attr-defined]
+        self._cache: Optional[dict[str, str]] = None
+        self._lock = threading.Lock()
+        self.scans = 0
+
+    def cached(self, query: str) -> Optional[str]:
+        """
+        Get the port a name last resolved to.
+
+        Args:
+            query: Port name as given to resolve().
+
+        Returns:
+            str: The cached port name, or None if the name was never resolved.
+        """
+        with self._lock:
+            return self._load().get(self._key(query))
+
+    def resolve(self, query: str) -> Optional[str]:
+        """
+        Enumerate the output ports and find the one a name refers to, see match_port().
+
+        Args:
+            query: Port name, part of it or ALSA client:port id.
+
+        Returns:
+            str: The matching port name, or None if no port matches.
+        """
+        try:
+            names = self._list_ports()
+        except Exception as e:
+            logger.warning(f'Could not list MIDI ports: {str(e)}')
+            return None
+        self.scans += 1
+        match = match_port(query, names)
+        if match is None:
+            logger.error(f'No MIDI port matches {query!r}. Available output ports: {names}')
+        elif match != query:
+            logger.info(f'MIDI port name {query!r} resolved to {match!r}')
+        return match
+
+    def candidates(self, query: str, hint: Optional[str] = None) -> Iterator[str]:
+        """
+        Generate the port names to try opening for a name, best guess first.
+
+        The ports are only enumerated if the caller asks for more than the hint and cached port,
+        i.e. when these could not be opened.
+
+        Args:
+            query: Port name, part of it or ALSA client:port id.
+            hint: Port the name resolved to before, e.g. the one open until the device went away.
+
+        Yields:
+            str: Port names, each at most once.
+        """
+        tried: set[str] = set()
+        for name in (hint, self.cached(query)):
+            if name is not None and name not in tried:
+                tried.add(name)
+                yield name
+        match = self.resolve(query)
+        if match is not None and match not in tried:
+            yield match
+
+    def remember(self, query: str, port_name: str) -> None:
+        """
+        Record the port a name resolved to, so the next candidates() tries it first.
+
+        Args:
+            query: Port name as given to candidates().
+            port_name: Port opened for it.
+        """
+        key = self._key(query)
+        with self._lock:
+            cache = self._load()
+            if cache.get(key) == port_name:
+                return
+            cache[key] = port_name
+            if self.cache_path is None:
+                return
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                temporary = self.cache_path.with_suffix('.tmp')
+                temporary.write_text(json.dumps(cache, indent=2, sort_keys=True))
+                os.replace(temporary, self.cache_path)
+            except OSError as e:
+                logger.debug(f'Could not write MIDI port cache {self.cache_path}: {str(e)}')
+
+    def _key(self, query: str) -> str:
+        # Port names differ between backends (e.g. rtmidi and portmidi) for the same device
+        backend = getattr(mido.backend, 'name', '')  # type: ignore[attr-defined]
+        return f'{backend}|{query}'
+
+    def _load(self) -> dict[str, str]:
+        """Read the cache file once, treating a missing or unreadable file as empty."""
+        if self._cache is None:
+            self._cache = {}
+            if self.cache_path is not None:
+                try:
+                    cache: object = json.loads(self.cache_path.read_text())
+                    if isinstance(cache, dict):
+                        # Entries map a backend and port name to the port opened; others are skipped
+                        entries = cast('dict[object, object]', cache)
+                        self._cache = {
+                            key: value
+                            for key, value in entries.items()
+                            if isinstance(key, str) and isinstance(value, str)
+                        }
+                except FileNotFoundError:
+                    pass
+                except (OSError, ValueError) as e:
+                    logger.debug(f'Ignoring MIDI port cache {self.cache_path}: {str(e)}')
+        return self._cache
@@ -0,0 +1,294 @@
+"""
+Preset Library
+
+This module stores presets in one compact binary file: a header followed by
+fixed-width records, each a preset name and an array of 16-bit parameter values.
+The file is memory-mapped, so presets are read and compared in place. With numpy
+installed, a similarity search compares thousands of presets in milliseconds as
+one array operation over the mapping.
+
+File layout (little-endian):
+    header: magic 'S37L', version (u16), parameters per record (u16),
+            record count (u32), CRC-32 of the parameter names (u32)
+    record: name (32 bytes UTF-8, NUL-padded), one u16 value per parameter
+            (0xFFFF when unknown)
+"""
+
+import heapq
+import math
+import mmap
+import operator
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from moog_sub37_mcp.midi.parameters import ParameterRegistry, ParameterSpec
+
+try:
+    import numpy as np
+except ImportError:  # searches fall back to a slower pure Python scan
+    np = None
+
+_MAGIC = b'S37L'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHHII')
+
+# Length in bytes of a stored preset name
+NAME_SIZE = 32
+
+# Stored value of a parameter whose value was not known when the preset was saved
+_UNKNOWN = 0xFFFF
+
+# Sections of settings that belong to the instrument, not to presets
+_GLOBAL_SECTIONS = frozenset(('global',))
+
+
+def preset_parameters(registry: ParameterRegistry) -> tuple[ParameterSpec, ...]:
+    """
+    Get the parameters a preset record stores: every patch control of a registry, once per MIDI address.
+
+    Aliases sharing an address (e.g. the clock divider views of an LFO rate) are represented by the
+    canonical parameter, and instrument-wide settings are left out.
+
+    Args:
+        registry: The parameter registry.
+
+    Returns:
+        tuple: The parameters, in registry order.
+    """
+    return tuple(
+        spec for spec in registry if spec.section not in _GLOBAL_SECTIONS and registry.lookup(*spec.address) is spec
+    )
+
+
+class PresetLibrary:
+    """Memory-mapped store of named presets with nearest-neighbour search."""
+
+    def __init__(self, path: Union[str, os.PathLike[str]], specs: Iterable[ParameterSpec]):
+        """
+        Open a library file, creating it if needed.
+
+        Args:
+            path: Path of the library file.
+            specs: The parameters of a record, in order. A file only opens with the parameters it was created with.
+
+        Raises:
+            OSError: If the file cannot be created or read.
+            ValueError: If the file is not a library of these parameters.
+        """
+        self.path = Path(path)
+        self.specs = tuple(specs)
+        self._ids = {spec.name: index for index, spec in enumerate(self.specs)}
+        self._record_size = NAME_SIZE + 2 * len(self.specs)
+        self._layout_crc = zlib.crc32('\n'.join(spec.name for spec in self.specs).encode())
+        # Weight turning each value into a fraction of its range
+        self._scales = tuple(1.0 / spec.max_value if spec.max_value else 0.0 for spec in self.specs)
+
+        self._lock = threading.Lock()
+        self._map: Optional[mmap.mmap] = None
+        self._names: dict[str, int] = {}  # record index by name
+        self._count = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            with open(self.path, 'wb') as file:
+                file.write(self._header(0))
+        self._remap()
+        for index in range(self._count):
+            offset = _HEADER.size + index * self._record_size
+            self._names[self._map[offset : offset + NAME_SIZE].rstrip(b'\0').decode()] = index  # type: ignore[index]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def names(self) -> list[str]:
+        """List the preset names in the order they were first saved."""
+        with self._lock:
+            return list(self._names)
+
+    def save(self, name: str, values: dict[str, Any]) -> bool:
+        """
+        Store a preset, replacing any preset with the same name.
+
+        Args:
+            name: Preset name (up to 32 bytes of UTF-8).
+            values: Parameter name to value. Parameters not given are stored as unknown and
+                unknown names are ignored.
+
+        Returns:
+            bool: True if the preset is new, False if it replaced one.
+
+        Raises:
+            ValueError: If the name is empty or too long, or a value is out of range.
+        """
+        encoded = name.encode()
+        if not encoded or len(encoded) > NAME_SIZE or b'\0' in encoded:
+            raise ValueError(f'Invalid preset name: {name!r}. Must be 1-{NAME_SIZE} bytes long.')
+
+        record = array('H', [_UNKNOWN]) * len(self.specs)
+        for parameter, value in values.items():
+            index = self._ids.get(parameter)
+            if index is None:
+                continue
+            error = self.specs[index].validate(value)
+            if error:
+                raise ValueError(error)
+            record[index] = value
+        if sys.byteorder != 'little':
+            record.byteswap()
+
+        with self._lock:
+            index = self._names.get(name)
+            new = index is None
+            with open(self.path, 'r+b') as file:
+                if new:
+                    index = self._count
+                file.seek(_HEADER.size + index * self._record_size)  # type: ignore[operator]
+                file.write(encoded.ljust(NAME_SIZE, b'\0'))
+                file.write(record.tobytes())
+                if new:
+                    file.seek(0)
+                    file.write(self._header(self._count + 1))
+            self._remap()
+            self._names[name] = index  # type: ignore[assignment]
+        return new
+
+    def load(self, name: str) -> Optional[dict[str, int]]:
+        """
+        Get the values of a preset.
+
+        Args:
+            name: Preset name
+
+        Returns:
+            Optional[dict]: Parameter name to value for the known values, or None if there is no such preset.
+        """
+        with self._lock:
+            index = self._names.get(name)
+            if index is None:
+                return None
+            # Copied out, as the mapping is replaced on the next save
+            row = self._row(index).tolist()
+        return {spec.name: value for spec, value in zip(self.specs, row) if value != _UNKNOWN}
+
+    def nearest(
+        self,
+        target: dict[str, int],
+        limit: int = 5,
+        exclude: Optional[str] = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Find the presets closest to a set of parameter values.
+
+        The distance is the mean difference over the target's parameters, each as a fraction of
+        its range; a parameter unknown in a preset counts as the largest difference.
+
+        Args:
+            target: Parameter name to value. Only these parameters are compared.
+            limit: Number of presets to return.
+            exclude: Name of a preset to leave out (e.g. the one the target was taken from).
+
+        Returns:
+            list: (name, similarity) pairs, most similar first, with similarity from 0 to 1.
+        """
+        indices = [self._ids[name] for name in target if name in self._ids]
+        if not indices or limit <= 0:
+            return []
+        scales = [self._scales[index] for index in indices]
+        wanted = [target[self.specs[index].name] * self._scales[index] for index in indices]
+
+        with self._lock:
+            names = list(self._names)
+            if not names:
+                return []
+            if np is not None:
+                distances = self._distances_numpy(indices, scales, wanted)
+            else:
+                distances = self._distances(indices, scales, wanted)
+            if exclude in self._names:
+                distances[self._names[exclude]] = math.inf
+
+        best = heapq.nsmallest(limit, range(len(names)), key=distances.__getitem__)
+        return [
+            (names[index], round(1.0 - float(distances[index]) / len(indices), 4))
+            for index in best
+            if distances[index] != math.inf
+        ]
+
+    def _distances_numpy(self, indices: list[int], scales: list[float], wanted: list[float]) -> Any:
+        """Distance of every record to the target, over the whole mapping at once. Called with the lock held."""
+        stride = self._record_size // 2
+        columns = [NAME_SIZE // 2 + index for index in indices]
+        records = np.frombuffer(self._map, '<u2', self._count * stride, _HEADER.size).reshape(self._count, stride)  # type: ignore[union-attr]
+        # Fancy indexing copies the compared columns, so no view of the mapping outlives the lock
+        values = records[:, columns] * np.array(scales)  # type: ignore[union-attr]
+        del records
+        # Differences as fractions of the range; unknown values (0xFFFF) saturate at 1
+        return np.minimum(np.abs(values - np.array(wanted)), 1.0).sum(axis=1).tolist()  # type: ignore[union-attr]
+
+    def _distances(self, indices: list[int], scales: list[float], wanted: list[float]) -> list[float]:
+        """Distance of every record to the target, one record at a time. Called with the lock held."""
+        select = operator.itemgetter(*indices) if len(indices) > 1 else lambda row: (row[indices[0]],)
+        ones = (1.0,) * len(indices)
+        mul, sub = operator.mul, operator.sub
+        stride = self._record_size // 2
+        words = self._words()
+        distances = []
+        for start in range(NAME_SIZE // 2, self._count * stride, stride):
+            values = select(words[start : start + len(self.specs)])
+            distances.append(sum(map(min, map(abs, map(sub, map(mul, values, scales), wanted)), ones)))
+        return distances
+
+    def close(self) -> None:
+        """Unmap the file."""
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+
+    def _header(self, count: int) -> bytes:
+        return _HEADER.pack(_MAGIC, _VERSION, len(self.specs), count, self._layout_crc)
+
+    def _remap(self) -> None:
+        """Map the file again after it changed. Called with the lock held."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        with open(self.path, 'rb') as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, parameters, count, layout_crc = _HEADER.unpack_from(data)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f'{self.path} is not a preset library')
+            if parameters != len(self.specs) or layout_crc != self._layout_crc:
+                raise ValueError(f'{self.path} was created with other parameters')
+            if len(data) < _HEADER.size + count * self._record_size:
+                raise ValueError(f'{self.path} is truncated')
+        except (struct.error, ValueError):
+            data.close()
+            raise
+
+        self._map = data
+        self._count = count
+
+    def _words(self) -> Any:
+        """The records as 16-bit words, in place when the host is little-endian. Called with the lock held."""
+        data = memoryview(self._map)[_HEADER.size : _HEADER.size + self._count * self._record_size]  # type: ignore[arg-type]
+        if sys.byteorder == 'little':
+            return data.cast('H')
+        words = array('H', data)
+        words.byteswap()
+        return words
+
+    def _row(self, index: int) -> Any:
+        start = index * self._record_size // 2 + NAME_SIZE // 2
+        return self._words()[start : start + len(self.specs)]
@@ -0,0 +1,142 @@
+"""
+MIDI Rate Limiter
+
+This module paces MIDI output with token buckets so message groups reach the
+synth no faster than its MIDI input can parse them.
+"""
+
+import threading
+import time
+from typing import Any, Optional
+
+# DIN MIDI runs at 31.25 kbaud with 10 bits per byte on the wire (start, 8 data, stop)
+DIN_BAUD_RATE = 31250
+DIN_BYTES_PER_SECOND = DIN_BAUD_RATE // 10
+
+
+class TokenBucket:
+    """Token bucket refilled at a constant rate."""
+
+    __slots__ = ('_stamp', '_tokens', 'capacity', 'rate')
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum number of tokens held, i.e. the largest burst sent without waiting.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._stamp = time.monotonic()
+
+    def delay(self, tokens: float, now: float) -> float:
+        """Seconds to wait at `now` before `tokens` are available."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+        # Groups larger than the bucket wait for a full bucket and then drive it negative
+        missing = min(tokens, self.capacity) - self._tokens
+        return missing / self.rate if missing > 0 else 0.0
+
+    def consume(self, tokens: float) -> None:
+        """Take tokens from the bucket, possibly leaving it in debt."""
+        self._tokens -= tokens
+
+
+class RateLimiter:
+    """Bytes-per-second and messages-per-second limit for a MIDI output."""
+
+    def __init__(
+        self,
+        bytes_per_second: Optional[float] = DIN_BYTES_PER_SECOND,
+        messages_per_second: Optional[float] = None,
+        burst_bytes: int = 12,
+        burst_messages: int = 4,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            bytes_per_second: Byte rate limit, None for no limit. Defaults to DIN MIDI
+                (3125 bytes/s); raise it or pass None for USB MIDI.
+            messages_per_second: Message rate limit, None for no limit.
+            burst_bytes: Bytes that may go out back to back after an idle period.
+            burst_messages: Messages that may go out back to back after an idle period.
+
+        Raises:
+            ValueError: If a rate or burst size is not positive.
+        """
+        for label, limit in (('bytes_per_second', bytes_per_second), ('messages_per_second', messages_per_second)):
+            if limit is not None and limit <= 0:
+                raise ValueError(f'Invalid {label}: {limit}. Must be positive or None.')
+        if burst_bytes < 1 or burst_messages < 1:
+            raise ValueError(f'Invalid burst size: {burst_bytes} bytes, {burst_messages} messages. Must be at least 1.')
+
+        self.bytes_per_second = bytes_per_second
+        self.messages_per_second = messages_per_second
+        self._bytes = TokenBucket(bytes_per_second, burst_bytes) if bytes_per_second else None
+        self._messages = TokenBucket(messages_per_second, burst_messages) if messages_per_second else None
+        self._lock = threading.Lock()
+
+        self.groups = 0
+        self.paced = 0
+        self.total_delay = 0.0
+        self.last_delay = 0.0
+        self.max_delay = 0.0
+
+    def acquire(self, nbytes: int, nmessages: int) -> float:
+        """
+        Wait until a group of messages may be sent, then account for it.
+
+        The group is admitted as a whole so it goes out back to back, e.g. the four
+        messages of an NRPN are never split by pacing.
+
+        Args:
+            nbytes: Size of the group in bytes.
+            nmessages: Number of messages in the group.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        with self._lock:
+            now = time.monotonic()
+            delay = 0.0
+            if self._bytes is not None:
+                delay = self._bytes.delay(nbytes, now)
+            if self._messages is not None:
+                delay = max(delay, self._messages.delay(nmessages, now))
+            # Reserve the tokens now; the refill on the next call covers the time slept
+            if self._bytes is not None:
+                self._bytes.consume(nbytes)
+            if self._messages is not None:
+                self._messages.consume(nmessages)
+            self.groups += 1
+            self.last_delay = delay
+            if delay > 0:
+                self.paced += 1
+                self.total_delay += delay
+                self.max_delay = max(self.max_delay, delay)
+
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the limiter settings and pacing counters.
+
+        Returns:
+            dict: Configured rates, number of groups sent and paced, and pacing delays in seconds.
+        """
+        with self._lock:
+            return {
+                'bytes_per_second': self.bytes_per_second,
+                'messages_per_second': self.messages_per_second,
+                'groups': self.groups,
+                'paced': self.paced,
+                'total_delay': self.total_delay,
+                'last_delay': self.last_delay,
+                'max_delay': self.max_delay,
+            }
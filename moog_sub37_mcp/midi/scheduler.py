@@ -0,0 +1,227 @@
+"""
+MIDI Event Scheduler
+
+This module runs timestamped events from a heap-ordered timeline on a dedicated
+thread, using time.monotonic_ns. The thread sleeps until shortly before the next
+event is due and spins for the rest, so events start within a fraction of a
+millisecond of their time.
+"""
+
+import heapq
+import itertools
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Time before an event spent spinning instead of sleeping (OS sleeps overshoot by up to ~1 ms)
+DEFAULT_SPIN_NS = 1_000_000
+
+# Events started later than this count as late
+LATE_NS = 1_000_000
+
+# Number of recent lateness samples kept for percentiles
+_SAMPLES = 1024
+
+
+class ScheduledEvent:
+    """Handle of a scheduled event."""
+
+    __slots__ = ('args', 'callback', 'cancelled', 'due_ns')
+
+    def __init__(self, due_ns: int, callback: Callable[..., Any], args: tuple[Any, ...]):
+        self.due_ns = due_ns
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Prevent the event from running if it has not started yet."""
+        self.cancelled = True
+
+
+class Scheduler:
+    """Timeline of events run at their due time by a dedicated thread."""
+
+    def __init__(self, spin_ns: int = DEFAULT_SPIN_NS, name: str = 'midi-scheduler', realtime: bool = False):
+        """
+        Initialize the scheduler. Its thread starts with the first event.
+
+        Args:
+            spin_ns: Nanoseconds before an event during which the thread spins instead of sleeping.
+                Higher values lower the jitter and cost more CPU.
+            name: Name of the scheduler thread.
+            realtime: Run the thread with real-time (SCHED_FIFO) priority where the OS allows it.
+        """
+        self.spin_ns = spin_ns
+        self.name = name
+        self.realtime = realtime
+        self._heap: list[tuple[int, int, ScheduledEvent]] = []
+        self._seq = itertools.count()
+        self._wakeup = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        # Lateness metrics: count, Welford running mean and variance, maximum and recent samples
+        self.executed = 0
+        self.late = 0
+        self.errors = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._max_ns = 0
+        self._samples: deque[int] = deque(maxlen=_SAMPLES)
+
+    @staticmethod
+    def now_ns() -> int:
+        """Current time on the scheduler's clock."""
+        return time.monotonic_ns()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule_at(self, due_ns: int, callback: Callable[..., Any], *args: Any) -> ScheduledEvent:
+        """
+        Schedule a call at a time on the scheduler's clock.
+
+        Args:
+            due_ns: time.monotonic_ns() at which to call. Past times run as soon as possible.
+            callback: Called on the scheduler thread with `args`. It must not block.
+            args: Positional arguments of the call.
+
+        Returns:
+            ScheduledEvent: Handle to cancel the event.
+
+        Raises:
+            RuntimeError: If the scheduler is closed.
+        """
+        event = ScheduledEvent(due_ns, callback, args)
+        with self._wakeup:
+            if self._closed:
+                raise RuntimeError('Scheduler is closed')
+            heapq.heappush(self._heap, (due_ns, next(self._seq), event))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            elif self._heap[0][2] is event:
+                # The new event is the earliest: wake the thread to shorten its sleep
+                self._wakeup.notify()
+        return event
+
+    def schedule_in(self, delay: float, callback: Callable[..., Any], *args: Any) -> ScheduledEvent:
+        """
+        Schedule a call after a delay.
+
+        Args:
+            delay: Seconds from now.
+            callback: Called on the scheduler thread with `args`. It must not block.
+            args: Positional arguments of the call.
+
+        Returns:
+            ScheduledEvent: Handle to cancel the event.
+        """
+        return self.schedule_at(self.now_ns() + round(delay * 1e9), callback, *args)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the timing metrics.
+
+        Returns:
+            dict: Events pending and executed, late events (over 1 ms) and callback errors, and the
+                lateness mean, standard deviation (jitter), 99th percentile and maximum in microseconds.
+        """
+        with self._wakeup:
+            samples = sorted(self._samples)
+            variance = self._m2 / (self.executed - 1) if self.executed > 1 else 0.0
+            return {
+                'scheduled': len(self._heap),
+                'executed': self.executed,
+                'late': self.late,
+                'errors': self.errors,
+                'lateness_mean_us': self._mean / 1000,
+                'jitter_us': math.sqrt(variance) / 1000,
+                'lateness_p99_us': samples[int(len(samples) * 0.99)] / 1000 if samples else 0.0,
+                'lateness_max_us': self._max_ns / 1000,
+            }
+
+    def close(self, timeout: Optional[float] = 1.0) -> None:
+        """
+        Drop the pending events and stop the scheduler thread.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish.
+        """
+        with self._wakeup:
+            self._closed = True
+            self._heap.clear()
+            self._wakeup.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _next_event(self) -> Optional[ScheduledEvent]:
+        """Wait for the next event to be due, or for the scheduler to close."""
+        with self._wakeup:
+            while True:
+                if self._closed:
+                    return None
+                if not self._heap:
+                    self._wakeup.wait()
+                    continue
+                due_ns, _, event = self._heap[0]
+                if event.cancelled:
+                    heapq.heappop(self._heap)
+                    continue
+                remaining = due_ns - time.monotonic_ns() - self.spin_ns
+                if remaining > 0:
+                    # Sleep until the spin window; an earlier event or close() wakes the thread
+                    self._wakeup.wait(remaining / 1e9)
+                    continue
+                heapq.heappop(self._heap)
+                return event
+
+    def _raise_priority(self) -> None:
+        """Move the calling thread to the lowest real-time priority, keeping normal priority if not permitted."""
+        try:
+            policy = os.SCHED_FIFO  # type: ignore[attr-defined]
+            # On Linux, pid 0 is the calling thread
+            os.sched_setscheduler(0, policy, os.sched_param(os.sched_get_priority_min(policy)))  # type: ignore[attr-defined]
+        except (AttributeError, OSError) as e:
+            logger.debug(f'Could not raise the priority of {self.name}: {e}')
+
+    def _run(self) -> None:
+        if self.realtime:
+            self._raise_priority()
+        while True:
+            event = self._next_event()
+            if event is None:
+                return
+
+            # Spin for the last stretch, yielding the GIL on each turn
+            while time.monotonic_ns() < event.due_ns:
+                time.sleep(0)
+            if event.cancelled:
+                continue
+
+            self._record(time.monotonic_ns() - event.due_ns)
+            try:
+                event.callback(*event.args)
+            except Exception as e:
+                self.errors += 1
+                logger.error(f'Error in scheduled MIDI event: {e}')
+
+    def _record(self, lateness_ns: int) -> None:
+        with self._wakeup:
+            self.executed += 1
+            delta = lateness_ns - self._mean
+            self._mean += delta / self.executed
+            self._m2 += delta * (lateness_ns - self._mean)
+            self._max_ns = max(self._max_ns, lateness_ns)
+            self._samples.append(lateness_ns)
+            if lateness_ns > LATE_NS:
+                self.late += 1
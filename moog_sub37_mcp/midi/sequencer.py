@@ -0,0 +1,493 @@
+"""
+Note Sequencer
+
+This module plays notes through the MIDI event scheduler. Note lists, looping
+patterns and MIDI files are expanded lazily into a time-ordered stream of Note
+On/Off events, so playback of any length only holds the notes currently sounding.
+"""
+
+import heapq
+import itertools
+import logging
+import math
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, Union, cast
+
+import mido
+
+from moog_sub37_mcp.midi.midi_manager import MIDIManager
+from moog_sub37_mcp.midi.scheduler import ScheduledEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BPM = 120.0
+DEFAULT_VELOCITY = 100
+
+# Playback ids, shared by the sequencers of every MIDI interface so an id names one playback
+_playback_ids = itertools.count(1)
+
+# Semitones of the natural note names above C
+_NOTE_OFFSETS = {'C': 0, 'D': 2, 'E': 4, 'F': 5, 'G': 7, 'A': 9, 'B': 11}
+
+# Extensions of the Standard MIDI Files play_sequence() may open
+_MIDI_FILE_SUFFIXES = ('.mid', '.midi')
+
+# A note event: (seconds from the start, note number, velocity), velocity 0 for Note Off
+NoteEvent = tuple[float, int, int]
+
+
+class Note(NamedTuple):
+    """A note of a sequence, timed in beats."""
+
+    pitch: int  # note number (0-127)
+    velocity: int  # 1-127
+    start: float  # beats from the start of the sequence
+    duration: float  # beats
+
+
+def parse_pitch(pitch: object) -> int:
+    """
+    Convert a note number or name to a note number.
+
+    Args:
+        pitch: Note number (0-127, a whole float is accepted) or name with octave, e.g. 'C4'
+            (60, middle C), 'F#2' or 'Bb3'.
+
+    Returns:
+        int: The note number.
+
+    Raises:
+        ValueError: If the pitch is not a valid note.
+    """
+    if isinstance(pitch, str):
+        name = pitch.strip()
+        if name.lstrip('-').isdigit():
+            number = int(name)
+        else:
+            letter, rest = name[:1].upper(), name[1:]
+            accidental = 0
+            while rest[:1] in ('#', 'b'):
+                accidental += 1 if rest[0] == '#' else -1
+                rest = rest[1:]
+            if letter not in _NOTE_OFFSETS or not rest.lstrip('-').isdigit():
+                raise ValueError(f'Invalid note: {pitch}. Use a note number or a name such as C4, F#2 or Bb3.')
+            number = (int(rest) + 1) * 12 + _NOTE_OFFSETS[letter] + accidental
+    elif isinstance(pitch, float) and pitch.is_integer():
+        number = int(pitch)
+    elif isinstance(pitch, int):
+        number = pitch
+    else:
+        raise ValueError(f'Invalid note: {pitch}. Use a note number or a name such as C4, F#2 or Bb3.')
+    if not 0 <= number <= 127:
+        raise ValueError(f'Invalid note: {pitch}. Must be between 0-127 (C-1 to G9).')
+    return number
+
+
+def parse_notes(notes: Iterable[object]) -> list[Note]:
+    """
+    Read a compact note list.
+
+    Args:
+        notes: Notes as [pitch, velocity, start, duration] lists or as dicts with those keys
+            (velocity defaults to 100). Pitches are note numbers or names, times are in beats.
+
+    Returns:
+        list: The notes sorted by start.
+
+    Raises:
+        ValueError: If a note is malformed or out of range.
+    """
+    result = [_parse_note(item) for item in notes]
+    result.sort(key=lambda note: note.start)
+    return result
+
+
+def _parse_note(item: object) -> Note:
+    """Read one note of a note list, see parse_notes()."""
+    fields: Sequence[object] = ()
+    if isinstance(item, dict):
+        values = cast('dict[str, object]', item)
+        try:
+            fields = (values['pitch'], values.get('velocity', DEFAULT_VELOCITY), values['start'], values['duration'])
+        except KeyError as e:
+            raise ValueError(f'Note {item} is missing {e}') from None
+    elif isinstance(item, (list, tuple)):
+        fields = cast('Sequence[object]', item)
+    if len(fields) != 4:
+        raise ValueError(f'Invalid note: {item}. Use [pitch, velocity, start, duration].')
+    pitch, velocity, start, duration = fields
+
+    try:
+        note_velocity, note_start, note_duration = int(_number(velocity)), _number(start), _number(duration)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f'Invalid note: {item}. Velocity, start and duration must be numbers.') from None
+    if not 1 <= note_velocity <= 127:
+        raise ValueError(f'Invalid velocity: {note_velocity}. Must be between 1-127.')
+    if not (math.isfinite(note_start + note_duration) and note_start >= 0 and note_duration > 0):
+        raise ValueError(f'Invalid timing in {item}: start must be at least 0 and duration positive.')
+    return Note(parse_pitch(pitch), note_velocity, note_start, note_duration)
+
+
+def _number(value: object) -> float:
+    """Convert a JSON number, or a string holding one, to a float. Raises TypeError or ValueError."""
+    if isinstance(value, (int, float, str)):
+        return float(value)
+    raise TypeError(f'Not a number: {value!r}')
+
+
+def single_note_events(pitch: Union[int, str], velocity: int, duration: float) -> Iterator[NoteEvent]:
+    """
+    Get the Note On and Off of one note.
+
+    Args:
+        pitch: Note number or name, see parse_pitch().
+        velocity: Velocity (1-127).
+        duration: Length of the note in seconds.
+
+    Returns:
+        Iterator: The note events.
+
+    Raises:
+        ValueError: If the note, velocity or duration is out of range.
+    """
+    number = parse_pitch(pitch)
+    if not 1 <= velocity <= 127:
+        raise ValueError(f'Invalid velocity: {velocity}. Must be between 1-127.')
+    if not duration > 0:
+        raise ValueError(f'Invalid duration: {duration}. Must be positive.')
+    return iter(((0.0, number, velocity), (duration, number, 0)))
+
+
+def sequence_events(
+    notes: Optional[Iterable[object]],
+    midi_file: Optional[str],
+    bpm: float = DEFAULT_BPM,
+    midi_dir: Optional[Path] = None,
+) -> tuple[Iterator[NoteEvent], str]:
+    """
+    Get the events of a sequence played once, from a note list or a MIDI file.
+
+    Args:
+        notes: Notes as accepted by parse_notes(), or None to play midi_file.
+        midi_file: Path of a Standard MIDI File, or None to play notes.
+        bpm: Tempo of the notes in beats per minute (a MIDI file uses its own).
+        midi_dir: Directory the MIDI file must be in, relative paths being read from it. None
+            allows any .mid file.
+
+    Returns:
+        tuple: The note events and a description of the sequence.
+
+    Raises:
+        ValueError: If not exactly one of notes and midi_file is given, or they are invalid.
+        OSError: If the MIDI file cannot be read.
+    """
+    if (notes is None) == (midi_file is None):
+        raise ValueError('Pass either notes or midi_file.')
+    _check_tempo(bpm)
+    if midi_file is not None:
+        return midi_file_events(midi_file_path(midi_file, midi_dir)), midi_file
+    parsed = parse_notes(notes)  # type: ignore[arg-type]
+    return note_events(parsed, bpm), f'{len(parsed)} notes'
+
+
+def pattern_events(
+    notes: Iterable[object], bpm: float = DEFAULT_BPM, length: Optional[float] = None, loops: int = 0
+) -> tuple[Iterator[NoteEvent], str]:
+    """
+    Get the events of a looping pattern.
+
+    Args:
+        notes: Notes as accepted by parse_notes().
+        bpm: Tempo in beats per minute.
+        length: Length of the pattern in beats, None for the end of the last note rounded up to a whole beat.
+        loops: Number of repeats, 0 to repeat forever.
+
+    Returns:
+        tuple: The note events and a description of the pattern.
+
+    Raises:
+        ValueError: If the notes, tempo, length or number of loops is invalid.
+    """
+    _check_tempo(bpm)
+    if loops < 0:
+        raise ValueError(f'Invalid loops: {loops}. Must be 0 (forever) or more.')
+    parsed = parse_notes(notes)
+    if not parsed:
+        raise ValueError('The pattern has no notes.')
+    if length is None:
+        length = float(math.ceil(max(note.start + note.duration for note in parsed)))
+    if not length > 0:
+        raise ValueError(f'Invalid length: {length}. Must be positive.')
+    return note_events(parsed, bpm, loops or None, length), f'pattern of {len(parsed)} notes'
+
+
+def _check_tempo(bpm: float) -> None:
+    if not bpm > 0:
+        raise ValueError(f'Invalid tempo: {bpm}. Must be positive.')
+
+
+def note_events(
+    notes: list[Note],
+    bpm: float = DEFAULT_BPM,
+    loops: Optional[int] = 1,
+    length: Optional[float] = None,
+) -> Iterator[NoteEvent]:
+    """
+    Expand notes into Note On/Off events in time order, one loop at a time.
+
+    Args:
+        notes: Notes sorted by start.
+        bpm: Tempo in beats per minute.
+        loops: Number of times to play the notes, None to repeat forever.
+        length: Length of one loop in beats (default is the end of the last note).
+
+    Yields:
+        NoteEvent: The next event. Note Offs come before Note Ons at the same time.
+    """
+    if not notes:
+        return
+    seconds_per_beat = 60.0 / bpm
+    if length is None:
+        length = max(note.start + note.duration for note in notes)
+
+    # Pending Note Offs (time, note); only sounding notes are held
+    offs: list[tuple[float, int]] = []
+    for loop in itertools.count() if loops is None else range(loops):
+        offset = loop * length
+        for note in notes:
+            time = (offset + note.start) * seconds_per_beat
+            while offs and offs[0][0] <= time:
+                off_time, pitch = heapq.heappop(offs)
+                yield off_time, pitch, 0
+            yield time, note.pitch, note.velocity
+            heapq.heappush(offs, ((offset + note.start + note.duration) * seconds_per_beat, note.pitch))
+    while offs:
+        off_time, pitch = heapq.heappop(offs)
+        yield off_time, pitch, 0
+
+
+def midi_file_path(path: str, directory: Optional[Path] = None) -> Path:
+    """
+    Check that a path names a Standard MIDI File that may be played.
+
+    Args:
+        path: Path of the file, relative to directory if given.
+        directory: Directory the file must be in (after resolving links), None for anywhere.
+
+    Returns:
+        Path: The resolved path of the file.
+
+    Raises:
+        ValueError: If the path is outside directory, not a .mid file, or no such file exists.
+    """
+    base = directory.expanduser().resolve() if directory is not None else Path.cwd()
+    resolved = (base / Path(path).expanduser()).resolve()
+    if directory is not None and not resolved.is_relative_to(base):
+        raise ValueError(f'Invalid MIDI file: {path}. Must be in {base}.')
+    if resolved.suffix.lower() not in _MIDI_FILE_SUFFIXES:
+        raise ValueError(f'Invalid MIDI file: {path}. Must be a .mid or .midi file.')
+    if not resolved.is_file():
+        raise ValueError(f'MIDI file not found: {path}')
+    return resolved
+
+
+def midi_file_events(path: Union[str, Path], loops: Optional[int] = 1) -> Iterator[NoteEvent]:
+    """
+    Stream the notes of a Standard MIDI File in time order, following its tempo changes.
+
+    The tracks are merged on the fly instead of through mido's merged message list, so
+    long files play without expanding all their messages at once. Notes of every MIDI
+    channel are returned.
+
+    Args:
+        path: Path of the .mid file.
+        loops: Number of times to play the file, None to repeat forever.
+
+    Returns:
+        Iterator: The note events.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a valid MIDI file.
+    """
+    # Read the file before returning, so a bad file fails here rather than during playback
+    return _file_events(mido.MidiFile(path), loops)
+
+
+def _file_events(midi_file: Any, loops: Optional[int]) -> Iterator[NoteEvent]:
+    ticks_per_beat: int = midi_file.ticks_per_beat
+    offset = 0.0
+    for _ in itertools.count() if loops is None else range(loops):
+        tempo: int = 500000  # microseconds per beat until the first Set Tempo (120 BPM)
+        tick = 0
+        seconds = 0.0
+        for event_tick, _, _, message in heapq.merge(
+            *(_absolute(track, i) for i, track in enumerate(midi_file.tracks))
+        ):
+            # As mido.tick2second(), which is untyped
+            seconds += (event_tick - tick) * tempo * 1e-6 / ticks_per_beat
+            tick = event_tick
+            if message.type == 'set_tempo':
+                tempo = message.tempo
+            elif message.type == 'note_on':
+                yield offset + seconds, message.note, message.velocity
+            elif message.type == 'note_off':
+                yield offset + seconds, message.note, 0
+        # The next loop starts at the end of the longest track
+        offset += seconds
+
+
+def _absolute(track: Iterable[Any], index: int) -> Iterator[tuple[int, int, int, Any]]:
+    """Messages of a track with absolute tick times, keyed by track and position so merging stays stable."""
+    tick = 0
+    for position, message in enumerate(track):
+        tick += message.time
+        yield tick, index, position, message
+
+
+class Playback:
+    """A stream of notes being played on one channel."""
+
+    def __init__(self, playback_id: int, channel: int, source: str, events: Iterator[NoteEvent], started_ns: int):
+        self.id = playback_id
+        self.channel = channel
+        self.source = source
+        self.events = events
+        self.started_ns = started_ns
+        self.pending: Optional[NoteEvent] = None  # next event to play
+        self.position = 0.0  # seconds of the last event played
+        self.notes = 0  # Note Ons played
+        self.sounding: dict[int, int] = {}  # overlapping Note Ons not yet ended, by note
+        self.event: Optional[ScheduledEvent] = None  # next scheduled step
+
+    def to_dict(self) -> dict[str, Any]:
+        """Playback as a JSON-friendly dict."""
+        return {
+            'id': self.id,
+            'channel': self.channel,
+            'source': self.source,
+            'position': round(self.position, 3),
+            'notes_played': self.notes,
+            'sounding': sorted(self.sounding),
+        }
+
+
+class Sequencer:
+    """Player of any number of simultaneous note streams on the MIDI interface's scheduler."""
+
+    def __init__(self, midi: MIDIManager):
+        """
+        Initialize the sequencer.
+
+        Args:
+            midi: The MIDI interface the notes are sent to.
+        """
+        self.midi = midi
+        self._playbacks: dict[int, Playback] = {}
+        self._lock = threading.Lock()
+
+    def play(self, events: Iterator[NoteEvent], channel: int = 3, source: str = '') -> Playback:
+        """
+        Start playing a stream of note events. The stream is consumed as playback advances.
+
+        Args:
+            events: Note events in time order, timed from now.
+            channel: MIDI channel (1-16)
+            source: Description of what is played, for listings.
+
+        Returns:
+            Playback: The started playback.
+
+        Raises:
+            ValueError: If the channel is out of range.
+        """
+        if not 1 <= channel <= 16:
+            raise ValueError(f'Invalid channel: {channel}. Must be between 1-16.')
+
+        scheduler = self.midi.scheduler
+        playback = Playback(next(_playback_ids), channel, source, events, scheduler.now_ns())
+        with self._lock:
+            self._playbacks[playback.id] = playback
+            playback.event = scheduler.schedule_at(playback.started_ns, self._step, playback)
+        return playback
+
+    def stop(self, playback_id: Optional[int] = None, channel: Optional[int] = None) -> list[Playback]:
+        """
+        Stop playbacks and release their sounding notes.
+
+        Args:
+            playback_id: Only stop this playback (default is all).
+            channel: Only stop playbacks on this MIDI channel (1-16).
+
+        Returns:
+            list: The stopped playbacks.
+        """
+        with self._lock:
+            stopped = [
+                p
+                for p in self._playbacks.values()
+                if (playback_id is None or p.id == playback_id) and (channel is None or p.channel == channel)
+            ]
+            for playback in stopped:
+                self._finish(playback)
+        return stopped
+
+    def active(self) -> list[Playback]:
+        """List the running playbacks."""
+        with self._lock:
+            return list(self._playbacks.values())
+
+    def _step(self, playback: Playback) -> None:
+        """Play every event that is due and schedule the next one. Runs on the scheduler thread."""
+        scheduler = self.midi.scheduler
+        with self._lock:
+            if self._playbacks.get(playback.id) is not playback:
+                return  # stopped meanwhile
+
+            now_ns = scheduler.now_ns()
+            try:
+                while True:
+                    if playback.pending is None:
+                        playback.pending = next(playback.events, None)
+                        if playback.pending is None:
+                            self._finish(playback)
+                            return
+                    time, note, velocity = playback.pending
+                    due_ns = playback.started_ns + math.floor(time * 1e9)
+                    if due_ns > now_ns:
+                        break
+                    self._send(playback, note, velocity)
+                    playback.position = time
+                    playback.pending = None
+            except Exception as e:
+                logger.error(f'Error reading notes of playback {playback.id}: {e}')
+                self._finish(playback)
+                return
+            playback.event = scheduler.schedule_at(due_ns, self._step, playback)
+
+    def _send(self, playback: Playback, note: int, velocity: int) -> None:
+        count = playback.sounding.get(note, 0)
+        if velocity:
+            if count:
+                # Retrigger: release the sounding note so the new one is articulated
+                self.midi.send_note_off(playback.channel, note)
+            self.midi.send_note_on(playback.channel, note, velocity)
+            playback.sounding[note] = count + 1
+            playback.notes += 1
+        elif count > 1:
+            # An earlier overlapping note ended; the retriggered one keeps sounding
+            playback.sounding[note] = count - 1
+        elif count:
+            self.midi.send_note_off(playback.channel, note)
+            del playback.sounding[note]
+
+    def _finish(self, playback: Playback) -> None:
+        """Remove a playback and release its notes. Called with the lock held."""
+        self._playbacks.pop(playback.id, None)
+        if playback.event is not None:
+            playback.event.cancel()
+        for note in sorted(playback.sounding):
+            self.midi.send_note_off(playback.channel, note)
+        playback.sounding.clear()
@@ -0,0 +1,135 @@
+"""
+MIDI Port Supervisor
+
+This module watches the MIDI port of a MIDIManager from a background thread and
+reconnects it when the device comes back after being unplugged or power-cycled.
+While connected, the port list is checked periodically, and immediately after a
+failed write. Once the port is gone, the manager buffers outgoing writes and the
+port list is polled with exponential backoff until the port reappears; the
+manager then reconnects and replays the buffered writes and its state mirror.
+
+rtmidi has no portable port-change notification, so the port list is polled.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, Optional
+
+import mido
+
+from moog_sub37_mcp.midi.midi_manager import MIDIManager
+
+logger = logging.getLogger(__name__)
+
+
+class PortSupervisor:
+    """Background thread keeping a MIDI interface connected across unplugs and power cycles."""
+
+    def __init__(
+        self,
+        midi: MIDIManager,
+        poll_interval: float = 0.5,
+        min_backoff: float = 0.05,
+        max_backoff: float = 0.5,
+        list_ports: Optional[Callable[[], list[str]]] = None,
+    ):
+        """
+        Initialize the supervisor. Call start() to run it.
+
+        Args:
+            midi: The MIDI interface to supervise.
+            poll_interval: Seconds between checks that the port is still there while connected.
+            min_backoff: Seconds before the first check for the port after it disappeared.
+            max_backoff: Longest wait between checks, reached by doubling, so a returning device is
+                picked up within this many seconds.
+            list_ports: Returns the available output port names (default is mido.get_output_names).
+
+        Raises:
+            ValueError: If an interval is not positive or min_backoff exceeds max_backoff.
+        """
+        if poll_interval <= 0 or min_backoff <= 0 or min_backoff > max_backoff:
+            raise ValueError(
+                f'Invalid supervisor intervals: poll {poll_interval}, backoff {min_backoff}-{max_backoff}. '
+                'Must be positive, with min_backoff not above max_backoff.'
+            )
+        self.midi = midi
+        self.poll_interval = poll_interval
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self._list_ports = list_ports or mido.get_output_names  # type: ignore[attr-defined]
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.losses = 0
+        self.last_outage: Optional[float] = None  # seconds from loss to reconnect
+        self._lost_at: Optional[float] = None
+
+    def start(self) -> None:
+        """Start watching the port, unless already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='midi-supervisor', daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop watching the port."""
+        self._stop.set()
+        self.midi.port_error.set()  # wake the thread
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the supervision counters.
+
+        Returns:
+            dict: Whether the port is currently lost, the number of losses and the length of the last
+                outage in seconds.
+        """
+        return {
+            'port_lost': self._lost_at is not None,
+            'losses': self.losses,
+            'last_outage': round(self.last_outage, 3) if self.last_outage is not None else None,
+        }
+
+    def _port_present(self) -> bool:
+        try:
+            return self.midi.find_port(self._list_ports()) is not None
+        except Exception as e:
+            logger.debug(f'Could not list MIDI ports: {str(e)}')
+            return False
+
+    def _run(self) -> None:
+        self.midi.ensure_connected()  # a connection deferred with lazy_connect
+        backoff = self.min_backoff
+        while not self._stop.is_set():
+            if self.midi.connected:
+                # Woken early by a failed write
+                self.midi.port_error.wait(self.poll_interval)
+                self.midi.port_error.clear()
+                if not self._stop.is_set() and not self._port_present():
+                    self._lost()
+                continue
+
+            if self._port_present() and self.midi.reconnect():
+                if self._lost_at is not None:
+                    self.last_outage = time.monotonic() - self._lost_at
+                    logger.info(f'MIDI port {self.midi.port_name} back after {self.last_outage:.3f} seconds')
+                self._lost_at = None
+                backoff = self.min_backoff
+                continue
+
+            if self._lost_at is None:
+                self._lost()
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def _lost(self) -> None:
+        """Switch the interface to buffering until the port is back."""
+        self.losses += 1
+        self._lost_at = time.monotonic()
+        self.midi.port_lost()
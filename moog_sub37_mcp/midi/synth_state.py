@@ -0,0 +1,223 @@
+"""
+Synth State Mirror
+
+This module keeps an in-memory copy of the last known value of every parameter,
+updated from the messages sent to the synth and the messages received from it.
+"""
+
+import threading
+from array import array
+from typing import TYPE_CHECKING, Optional
+
+from moog_sub37_mcp.midi.parameters import CC14, NRPN, PROGRAM_CHANGE, ParameterRegistry, ParameterSpec
+
+if TYPE_CHECKING:
+    from moog_sub37_mcp.midi.input_listener import ParameterEvent
+
+# Marker for a value that has not been written or received yet
+UNKNOWN = -1
+
+
+class _ChannelState:
+    """Known values for one MIDI channel."""
+
+    __slots__ = ('controllers', 'values')
+
+    def __init__(self, size: int):
+        self.values = array('i', [UNKNOWN]) * size  # by parameter id
+        self.controllers = array('h', [UNKNOWN]) * 128  # raw 7-bit CC values
+
+
+class SynthState:
+    """Last known parameter values per channel, indexed by parameter id."""
+
+    def __init__(self, registry: ParameterRegistry):
+        """
+        Initialize an empty state.
+
+        Args:
+            registry: The parameters to track.
+        """
+        self.registry = registry
+        self._channels: dict[int, _ChannelState] = {}
+        self._lock = threading.Lock()
+
+        # (parameter id, CC MSB, CC LSB or -1, min, max) of the parameters on each CC controller,
+        # and the parameter ids per NRPN number
+        self._cc_index: list[list[tuple[int, int, int, int, int]]] = [[] for _ in range(128)]
+        self._nrpn_index: dict[int, list[int]] = {}
+        for parameter_id, spec in enumerate(registry):
+            if spec.kind == NRPN:
+                self._nrpn_index.setdefault(spec.number, []).append(parameter_id)
+            else:
+                entry = (parameter_id, spec.number, spec.lsb_number, spec.min_value, spec.max_value)
+                self._cc_index[spec.number].append(entry)
+                if spec.kind == CC14:
+                    self._cc_index[spec.lsb_number].append(entry)
+
+    def _channel(self, channel: int) -> _ChannelState:
+        state = self._channels.get(channel)
+        if state is None:
+            state = self._channels[channel] = _ChannelState(len(self.registry))
+        return state
+
+    def record_cc(self, channel: int, cc: int, value: int) -> None:
+        """
+        Record a Control Change value.
+
+        Args:
+            channel: MIDI channel (1-16)
+            cc: Control Change number (0-127)
+            value: Control Change value (0-127)
+        """
+        with self._lock:
+            self._record_cc(self._channel(channel), cc, value)
+
+    def _record_cc(self, state: _ChannelState, cc: int, value: int) -> None:
+        controllers = state.controllers
+        controllers[cc] = value
+        values = state.values
+        for parameter_id, cc_msb, cc_lsb, min_value, max_value in self._cc_index[cc]:
+            if cc_lsb >= 0:
+                msb, lsb = controllers[cc_msb], controllers[cc_lsb]
+                value = msb << 7 | lsb if msb != UNKNOWN and lsb != UNKNOWN else UNKNOWN
+            else:
+                value = controllers[cc]
+            # Parameters covering part of a controller's range (e.g. clock divider ranges) only
+            # hold values inside that range
+            values[parameter_id] = value if min_value <= value <= max_value else UNKNOWN
+
+    def record_high_res_cc(self, channel: int, cc_msb: int, cc_lsb: int, value: int) -> None:
+        """
+        Record a 14-bit Control Change value.
+
+        Args:
+            channel: MIDI channel (1-16)
+            cc_msb: Control Change number for MSB (0-127)
+            cc_lsb: Control Change number for LSB (0-127)
+            value: High-resolution value (0-16383)
+        """
+        with self._lock:
+            state = self._channel(channel)
+            self._record_cc(state, cc_lsb, value & 0x7F)
+            self._record_cc(state, cc_msb, value >> 7)
+
+    def record_nrpn(self, channel: int, number: int, value: int) -> None:
+        """
+        Record an NRPN value.
+
+        Args:
+            channel: MIDI channel (1-16)
+            number: 14-bit NRPN number (0-16383)
+            value: NRPN value (0-16383)
+        """
+        parameter_ids = self._nrpn_index.get(number)
+        if parameter_ids:
+            with self._lock:
+                values = self._channel(channel).values
+                for parameter_id in parameter_ids:
+                    values[parameter_id] = value
+
+    def apply(self, event: 'ParameterEvent') -> None:
+        """
+        Merge a parameter change received from the synth.
+
+        A Program Change forgets every value of its channel.
+
+        Args:
+            event: The decoded event, as delivered by InputListener
+        """
+        if event.kind == PROGRAM_CHANGE:
+            self.clear(event.channel)
+        elif event.kind == NRPN:
+            self.record_nrpn(event.channel, event.number, event.value)
+        elif event.kind == CC14:
+            self.record_high_res_cc(event.channel, event.number, event.lsb_number, event.value)
+        else:
+            self.record_cc(event.channel, event.number, event.value)
+
+    def get(self, channel: int, name: str) -> Optional[int]:
+        """
+        Get the last known value of a parameter.
+
+        Args:
+            channel: MIDI channel (1-16)
+            name: Parameter name
+
+        Returns:
+            Optional[int]: The value, or None if unknown.
+
+        Raises:
+            KeyError: If the parameter does not exist.
+        """
+        parameter_id = self.registry.parameter_id(name)
+        state = self._channels.get(channel)
+        if state is None or state.values[parameter_id] == UNKNOWN:
+            return None
+        return state.values[parameter_id]
+
+    def value_at(self, channel: int, kind: str, number: int, lsb_number: int = -1) -> Optional[int]:
+        """
+        Get the last known value at a MIDI address.
+
+        Args:
+            channel: MIDI channel (1-16)
+            kind: 'cc', 'cc14' or 'nrpn'
+            number: CC number, CC MSB number of a 14-bit pair, or 14-bit NRPN number
+            lsb_number: CC LSB number of a 14-bit pair
+
+        Returns:
+            Optional[int]: The value, or None if unknown (NRPNs are only tracked for registered parameters).
+        """
+        state = self._channels.get(channel)
+        if state is None:
+            return None
+        if kind == NRPN:
+            parameter_ids = self._nrpn_index.get(number)
+            value = state.values[parameter_ids[0]] if parameter_ids else UNKNOWN
+        elif kind == CC14:
+            msb, lsb = state.controllers[number], state.controllers[lsb_number]
+            value = msb << 7 | lsb if msb != UNKNOWN and lsb != UNKNOWN else UNKNOWN
+        else:
+            value = state.controllers[number]
+        return None if value == UNKNOWN else value
+
+    def snapshot(self, channel: int, specs: Optional[list[ParameterSpec]] = None) -> dict[str, int]:
+        """
+        Get every known parameter value of a channel.
+
+        Args:
+            channel: MIDI channel (1-16)
+            specs: Parameters to include, None for all.
+
+        Returns:
+            dict: Parameter name to value, for known values only, in registry order.
+        """
+        state = self._channels.get(channel)
+        if state is None:
+            return {}
+        with self._lock:
+            values = state.values.tolist()
+        if specs is None:
+            return {spec.name: value for spec, value in zip(self.registry, values) if value != UNKNOWN}
+        parameter_id = self.registry.parameter_id
+        known = ((spec.name, values[parameter_id(spec.name)]) for spec in specs)
+        return {name: value for name, value in known if value != UNKNOWN}
+
+    def channels(self) -> list[int]:
+        """List the MIDI channels (1-16) with known values."""
+        with self._lock:
+            return sorted(self._channels)
+
+    def clear(self, channel: Optional[int] = None) -> None:
+        """
+        Forget known values.
+
+        Args:
+            channel: MIDI channel (1-16) to clear, or None for all channels.
+        """
+        with self._lock:
+            if channel is None:
+                self._channels.clear()
+            else:
+                self._channels.pop(channel, None)
@@ -0,0 +1,119 @@
+"""
+Automation tools for ramping parameters on the Moog Sub 37 over time.
+"""
+
+from typing import Any, Optional, Union
+
+from mcp.server.fastmcp import FastMCP
+
+from moog_sub37_mcp.midi.automation import DEFAULT_RATE, AutomationEngine
+from moog_sub37_mcp.midi.device_pool import DevicePool
+from moog_sub37_mcp.tools.registry import PARAMETERS
+
+
+def register_automation_tools(mcp: FastMCP, devices: DevicePool):
+    """
+    Register the automation tools with the MCP server.
+
+    Args:
+        mcp: The MCP server instance
+        devices: The instruments
+    """
+    # One engine per MIDI interface, shared by the instruments chained on it
+    engines = {midi: AutomationEngine(midi) for midi in devices.interfaces()}
+
+    @mcp.tool()
+    def ramp_parameter(
+        name: str,
+        end: int,
+        duration: float,
+        start: Optional[int] = None,
+        curve: str = 'linear',
+        rate: float = DEFAULT_RATE,
+        channel: Optional[int] = None,
+        device: Optional[str] = None,
+    ) -> dict[str, Any]:  # type: ignore
+        """
+        Sweep a parameter from one value to another over time, e.g. a filter sweep, in a single call.
+
+        The server streams the intermediate values in the background and returns immediately.
+        Several ramps can run at once; a new ramp on the same parameter replaces the running one.
+        Parameter names are the names of the per-parameter tools without the `set_` prefix.
+
+        Args:
+            name (str): Parameter name (e.g. `filter_cutoff`).
+            end (int): Value at the end of the ramp.
+            duration (float): Length of the ramp in seconds.
+            start (int): Value at the start of the ramp (default is the current value).
+            curve (str): 'linear', 'exponential', 'logarithmic' or 's_curve' (default is 'linear').
+            rate (float): Updates per second (default is 50).
+            channel (int): MIDI channel (default is the device's channel).
+            device (str): Instrument id (default is the first instrument).
+
+        Returns:
+            dict: The started ramp, or an error.
+        """
+        spec = PARAMETERS.get(name)
+        if spec is None:
+            return {'error': f'Unknown parameter: {name}'}
+        try:
+            midi, channel = devices.select(device, channel)
+        except KeyError as e:
+            return {'error': e.args[0]}
+        engine = engines[midi]
+
+        if start is None:
+            running = [ramp for ramp in engine.active() if ramp.spec == spec and ramp.channel == channel]
+            if running and running[0].value is not None:
+                start = running[0].value
+            elif midi.state is not None:
+                start = midi.state.get(channel, spec.name)
+            if start is None:
+                return {'error': f'The current value of {spec.name} is unknown; pass a start value.'}
+
+        try:
+            ramp = engine.start(spec, channel, start, end, duration, curve, rate)
+        except ValueError as e:
+            return {'error': str(e)}
+        return devices.tag(midi, ramp.to_dict())
+
+    @mcp.tool()
+    def stop_ramps(
+        name: Optional[str] = None, channel: Optional[int] = None, device: Optional[str] = None
+    ) -> Union[list[dict[str, Any]], dict[str, Any]]:  # type: ignore
+        """
+        Stop running ramps, leaving their parameters where they are.
+
+        Args:
+            name (str): Only stop the ramp of this parameter (default is all parameters).
+            channel (int): Only stop ramps on this MIDI channel (default is all channels, or the
+                device's channel when a device is given).
+            device (str): Only stop ramps of this instrument (default is all instruments).
+
+        Returns:
+            list: The stopped ramps, or an error.
+        """
+        interfaces = list(engines)
+        if device is not None:
+            try:
+                midi, channel = devices.select(device, channel)
+            except KeyError as e:
+                return {'error': e.args[0]}
+            interfaces = [midi]
+        spec = PARAMETERS.get(name) if name is not None else None
+        return [
+            devices.tag(midi, ramp.to_dict())
+            for midi in interfaces
+            for ramp in engines[midi].stop(spec.name if spec else name, channel)
+        ]
+
+    @mcp.tool()
+    def list_ramps() -> list[dict[str, Any]]:  # type: ignore
+        """
+        List the running ramps of every instrument.
+
+        Returns:
+            list: Each ramp with its parameter, range, curve, rate and last value sent, and its
+                instrument when there are several.
+        """
+        return [devices.tag(midi, ramp.to_dict()) for midi, engine in engines.items() for ramp in engine.active()]
@@ -0,0 +1,157 @@
+"""
+Batch tools for setting many parameters on the Moog Sub 37 in a single call.
+"""
+
+from typing import Any, Optional, Union
+
+from mcp.server.fastmcp import FastMCP
+from pydantic import BaseModel
+
+from moog_sub37_mcp.midi.device_pool import DevicePool
+from moog_sub37_mcp.midi.midi_manager import MIDIManager
+from moog_sub37_mcp.midi.parameters import ParameterSpec
+from moog_sub37_mcp.midi.patch import apply_patch, diff_patch
+from moog_sub37_mcp.tools.registry import PARAMETERS
+
+
+class ParameterValue(BaseModel):
+    """A single parameter assignment."""
+
+    name: str
+    value: int
+
+
+def validate_parameters(
+    parameters: Union[dict[str, int], list[ParameterValue]],
+) -> list[tuple[str, int, Optional[ParameterSpec], Optional[str]]]:
+    """
+    Resolve and validate a set of parameter assignments against the parameter tables.
+
+    Args:
+        parameters: Map of parameter name to value, or a list of assignments
+
+    Returns:
+        list: One (name, value, spec, error) entry per assignment, in order. `spec` is None
+            for unknown parameters and `error` is None for valid assignments.
+    """
+    items = parameters.items() if isinstance(parameters, dict) else [(p.name, p.value) for p in parameters]
+    entries: list[tuple[str, int, Optional[ParameterSpec], Optional[str]]] = []
+    for name, value in items:
+        spec = PARAMETERS.get(name)
+        if spec is None:
+            entries.append((name, value, None, f'Unknown parameter: {name}'))
+        else:
+            entries.append((spec.name, value, spec, spec.validate(value)))
+    return entries
+
+
+def send_parameters(
+    midi: MIDIManager,
+    entries: list[tuple[str, int, Optional[ParameterSpec], Optional[str]]],
+    channel: int = 3,
+    force: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Send validated parameter assignments as a single MIDI burst, or nothing if any is invalid.
+
+    Args:
+        midi: The MIDI interface
+        entries: Assignments as returned by validate_parameters
+        channel: MIDI channel (1-16)
+        force: Re-send values the synth is known to have already
+
+    Returns:
+        list: One result per parameter with its status ('ok', 'failed', 'invalid' or 'skipped').
+    """
+    if any(error for _, _, _, error in entries):
+        return [
+            {'parameter': name, 'value': value, 'status': 'invalid', 'error': error}
+            if error
+            else {'parameter': name, 'value': value, 'status': 'skipped'}
+            for name, value, _, error in entries
+        ]
+
+    with midi.burst() as burst:
+        queued = [spec.send(midi, channel, value, force) for _, value, spec, _ in entries if spec]
+
+    return [
+        {'parameter': name, 'value': value, 'status': 'ok' if ok and burst.sent else 'failed'}
+        for (name, value, _, _), ok in zip(entries, queued)
+    ]
+
+
+def register_batch_tools(mcp: FastMCP, devices: DevicePool):
+    """
+    Register the batch tools with the MCP server.
+
+    Args:
+        mcp: The MCP server instance
+        devices: The instruments
+    """
+
+    @mcp.tool()
+    def set_parameters(
+        parameters: Union[dict[str, int], list[ParameterValue]],
+        channel: Optional[int] = None,
+        force: bool = False,
+        device: Optional[str] = None,
+    ) -> Union[list[dict[str, Any]], dict[str, Any]]:  # type: ignore
+        """
+        Set several parameters at once and send them to the synth as a single MIDI burst.
+
+        Parameter names are the names of the per-parameter tools without the `set_` prefix
+        (e.g. `filter_cutoff`, `amp_eg_attack_time`, `lfo2_rate`), with the same value ranges.
+        The whole set is validated first; if any entry is invalid nothing is sent.
+        Values the synth is known to have already are not re-sent unless `force` is set.
+
+        Args:
+            parameters: Map of parameter name to value, or a list of {name, value} entries applied in order.
+            channel (int): MIDI channel (default is the device's channel).
+            force (bool): Re-send values the synth is known to have already (default is False).
+            device (str): Instrument id (default is the first instrument).
+
+        Returns:
+            list: One result per parameter with its status ('ok', 'failed', 'invalid' or 'skipped'),
+                or an error.
+        """
+        try:
+            midi, channel = devices.select(device, channel)
+        except KeyError as e:
+            return {'error': e.args[0]}
+        return send_parameters(midi, validate_parameters(parameters), channel, force)
+
+    @mcp.tool()
+    def set_patch(
+        parameters: dict[str, int], channel: Optional[int] = None, dry_run: bool = False, device: Optional[str] = None
+    ) -> dict[str, Any]:  # type: ignore
+        """
+        Switch to a patch by sending only the parameters that differ from the current sound.
+
+        The current sound is the values known to get_patch; unknown values are always sent.
+        Changes go out as one burst, lowering amp levels first and raising them last so the
+        switch does not pop. Use this instead of set_parameters to move between whole patches.
+
+        Args:
+            parameters: Map of parameter name to value describing the patch.
+            channel (int): MIDI channel (default is the device's channel).
+            dry_run (bool): Only return the changes without sending them (default is False).
+            device (str): Instrument id (default is the first instrument).
+
+        Returns:
+            dict: The changes in sending order, with old (None if unknown) and new values, and
+                whether they were sent, or an error.
+        """
+        try:
+            midi, channel = devices.select(device, channel)
+        except KeyError as e:
+            return {'error': e.args[0]}
+        try:
+            if dry_run:
+                changes, sent = diff_patch(PARAMETERS, midi.state, channel, parameters), False
+            else:
+                changes, sent = apply_patch(midi, PARAMETERS, channel, parameters)
+        except KeyError as e:
+            return {'error': f'Unknown parameter: {e.args[0]}'}
+        except ValueError as e:
+            return {'error': str(e)}
+        return {'changes': [change.to_dict() for change in changes], 'sent': sent}
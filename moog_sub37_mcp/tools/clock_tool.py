@@ -0,0 +1,136 @@
+"""
+Clock tools for driving the tempo-synced LFOs and arpeggiator of the Moog Sub 37
+with MIDI clock generated by the server.
+"""
+
+from typing import Any, Optional
+
+from mcp.server.fastmcp import FastMCP
+
+from moog_sub37_mcp.midi.clock import MIDIClock
+from moog_sub37_mcp.midi.device_pool import DevicePool
+from moog_sub37_mcp.midi.midi_manager import MIDIManager
+
+
+def _select_clock(clocks: dict[MIDIManager, MIDIClock], devices: DevicePool, device: Optional[str]) -> MIDIClock:
+    """
+    Get the clock of an instrument's MIDI interface.
+
+    Raises:
+        ValueError: If there is no instrument with this id.
+    """
+    try:
+        return clocks[devices.get(device).midi]
+    except KeyError as e:
+        raise ValueError(e.args[0]) from None
+
+
+def register_clock_tools(mcp: FastMCP, devices: DevicePool):
+    """
+    Register the clock tools with the MCP server.
+
+    Args:
+        mcp: The MCP server instance
+        devices: The instruments
+    """
+    # MIDI clock has no channel: one clock per MIDI interface, followed by every instrument on it
+    clocks = {midi: MIDIClock(midi) for midi in devices.interfaces()}
+
+    @mcp.tool()
+    def start_clock(bpm: Optional[float] = None, device: Optional[str] = None) -> dict[str, Any]:  # type: ignore
+        """
+        Send MIDI Start and run the MIDI clock (24 pulses per quarter note) from the beginning.
+
+        The synth follows the clock when its clock source is set to MIDI; synced LFOs and the
+        arpeggiator then run at the clock's tempo.
+
+        Args:
+            bpm (float): Tempo in beats per minute, 20-300 (default is the current tempo, initially 120).
+            device (str): Instrument id (default is the first instrument).
+
+        Returns:
+            dict: The clock status, or an error.
+        """
+        try:
+            clock = _select_clock(clocks, devices, device)
+            if not clock.start(bpm):
+                return {'error': 'Failed to send MIDI Start'}
+        except ValueError as e:
+            return {'error': str(e)}
+        return clock.status()
+
+    @mcp.tool()
+    def stop_clock(device: Optional[str] = None) -> dict[str, Any]:  # type: ignore
+        """
+        Stop the MIDI clock and send MIDI Stop. The song position is kept for continue_clock.
+
+        Args:
+            device (str): Instrument id (default is the first instrument).
+
+        Returns:
+            dict: The clock status, or an error.
+        """
+        try:
+            clock = _select_clock(clocks, devices, device)
+        except ValueError as e:
+            return {'error': str(e)}
+        clock.stop()
+        return clock.status()
+
+    @mcp.tool()
+    def continue_clock(bpm: Optional[float] = None, device: Optional[str] = None) -> dict[str, Any]:  # type: ignore
+        """
+        Send MIDI Continue and run the MIDI clock from where it was stopped.
+
+        Args:
+            bpm (float): Tempo in beats per minute, 20-300 (default is the current tempo).
+            device (str): Instrument id (default is the first instrument).
+
+        Returns:
+            dict: The clock status, or an error.
+        """
+        try:
+            clock = _select_clock(clocks, devices, device)
+            if not clock.resume(bpm):
+                return {'error': 'Failed to send MIDI Continue'}
+        except ValueError as e:
+            return {'error': str(e)}
+        return clock.status()
+
+    @mcp.tool()
+    def set_tempo(bpm: float, device: Optional[str] = None) -> dict[str, Any]:  # type: ignore
+        """
+        Change the tempo of the MIDI clock, taking effect on the next pulse if it is running.
+
+        Args:
+            bpm (float): Tempo in beats per minute, 20-300.
+            device (str): Instrument id (default is the first instrument).
+
+        Returns:
+            dict: The clock status, or an error.
+        """
+        try:
+            clock = _select_clock(clocks, devices, device)
+            clock.set_tempo(bpm)
+        except ValueError as e:
+            return {'error': str(e)}
+        return clock.status()
+
+    @mcp.tool()
+    def get_clock_status(device: Optional[str] = None) -> dict[str, Any]:  # type: ignore
+        """
+        Get the MIDI clock state and its measured timing.
+
+        Args:
+            device (str): Instrument id (default is the first instrument).
+
+        Returns:
+            dict: Whether the clock runs, the set and measured tempo, the song position in pulses
+                and beats, the pulse jitter and lateness in microseconds, and missed and failed pulses,
+                or an error.
+        """
+        try:
+            clock = _select_clock(clocks, devices, device)
+        except ValueError as e:
+            return {'error': str(e)}
+        return clock.status()
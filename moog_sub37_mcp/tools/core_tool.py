@@ -0,0 +1,180 @@
+"""
+Core tools for the compact tool mode: one setter per synth section, parameter
+lookup, and loading the other tool groups on request.
+"""
+
+import logging
+from collections.abc import Callable
+from typing import Any, Optional, Union
+
+from mcp.server.fastmcp import Context, FastMCP
+
+from moog_sub37_mcp.midi.device_pool import DevicePool
+from moog_sub37_mcp.midi.midi_manager import MIDIManager
+from moog_sub37_mcp.tools.batch_tool import send_parameters, validate_parameters
+from moog_sub37_mcp.tools.parameter_tools import describe_parameter as parameter_description
+from moog_sub37_mcp.tools.registry import PARAMETERS
+from moog_sub37_mcp.tools.state_tool import value_label
+
+logger = logging.getLogger(__name__)
+
+
+def _make_section_setter(devices: DevicePool, section: str) -> Callable[..., Any]:
+    def send(parameters: dict[str, int], midi: MIDIManager, channel: int) -> list[dict[str, Any]]:
+        entries = [
+            (name, value, spec, f'Not a {section} parameter: {name}')
+            if spec is not None and spec.section != section
+            else (name, value, spec, error)
+            for name, value, spec, error in validate_parameters(parameters)
+        ]
+        return send_parameters(midi, entries, channel)
+
+    # A device argument only where there is a choice, as for the per-parameter setters
+    if len(devices) == 1:
+        default = devices.default
+
+        def set_section_parameters(parameters: dict[str, int], channel: int = default.channel) -> list[dict[str, Any]]:  # type: ignore
+            return send(parameters, default.midi, channel)
+
+        return set_section_parameters  # type: ignore
+
+    def set_device_section_parameters(
+        parameters: dict[str, int], channel: Optional[int] = None, device: Optional[str] = None
+    ) -> Union[list[dict[str, Any]], dict[str, Any]]:  # type: ignore
+        try:
+            midi, channel = devices.select(device, channel)
+        except KeyError as e:
+            return {'error': e.args[0]}
+        return send(parameters, midi, channel)
+
+    return set_device_section_parameters  # type: ignore
+
+
+def _device_arguments(devices: DevicePool) -> str:
+    """Describe the channel and device arguments of the section setters."""
+    if len(devices) > 1:
+        return (
+            "    channel (int): MIDI channel (default is the device's channel).\n"
+            '    device (str): Instrument id (default is the first instrument).'
+        )
+    return f'    channel (int): MIDI channel (default is {devices.default.channel}).'
+
+
+def register_core_tools(mcp: FastMCP, devices: DevicePool, groups: dict[str, Callable[[FastMCP, DevicePool], Any]]):
+    """
+    Register the core tools with the MCP server.
+
+    Args:
+        mcp: The MCP server instance
+        devices: The instruments
+        groups: Registration function of each tool group enable_tools can load, by group name
+    """
+    loaded: set[str] = set()
+
+    device_arguments = _device_arguments(devices)
+    for section in PARAMETERS.sections():
+        mcp.add_tool(
+            _make_section_setter(devices, section),
+            name=f'set_{section}_parameters',
+            description=(
+                f'Set one or more {section} parameters in a single MIDI burst.\n'
+                f'Args:\n'
+                f'    parameters (dict): Map of parameter name to value; see list_parameters("{section}").\n'
+                f'{device_arguments}'
+            ),
+        )
+
+    @mcp.tool()
+    def list_parameters(section: Optional[str] = None) -> dict[str, Any]:  # type: ignore
+        """
+        List the synth parameters settable with the set_<section>_parameters tools.
+
+        Args:
+            section (str): amp, arp, filter, fx, glide, global, lfo, mod or osc (default is the
+                sections and their parameter names).
+
+        Returns:
+            dict: The parameters of the section with their range or value labels, or the parameter
+                names of every section.
+        """
+        sections = PARAMETERS.sections()
+        if section is None:
+            return {name: [spec.name for spec in PARAMETERS.in_section(name)] for name in sections}
+        if section not in sections:
+            return {'error': f'Unknown section: {section}. Must be one of {", ".join(sorted(sections))}.'}
+
+        parameters = {}
+        for spec in PARAMETERS.in_section(section):
+            if spec.labels:
+                parameters[spec.name] = {value: label for value, label in spec.labels}
+            else:
+                parameters[spec.name] = f'{spec.min_value}-{spec.max_value}'
+        return {'section': section, 'parameters': parameters}
+
+    @mcp.tool()
+    def describe_parameter(name: str, channel: Optional[int] = None, device: Optional[str] = None) -> dict[str, Any]:  # type: ignore
+        """
+        Describe a synth parameter: its MIDI address, range and last known value.
+
+        Args:
+            name (str): Parameter name (e.g. `filter_cutoff`).
+            channel (int): MIDI channel (default is the device's channel).
+            device (str): Instrument id (default is the first instrument).
+
+        Returns:
+            dict: The parameter's section, description, range and value (None if unknown), or an error.
+        """
+        spec = PARAMETERS.get(name)
+        if spec is None:
+            return {'error': f'Unknown parameter: {name}'}
+        try:
+            midi, channel = devices.select(device, channel)
+        except KeyError as e:
+            return {'error': e.args[0]}
+
+        value = midi.state.get(channel, spec.name) if midi.state is not None else None
+        result: dict[str, Any] = {
+            'parameter': spec.name,
+            'section': spec.section,
+            'description': parameter_description(spec, devices),
+            'min_value': spec.min_value,
+            'max_value': spec.max_value,
+            'value': value,
+        }
+        if value is not None and spec.labels:
+            result['label'] = value_label(spec, value)
+        return result
+
+    @mcp.tool()
+    async def enable_tools(group: str, ctx: Context) -> dict[str, Any]:  # type: ignore
+        """
+        Load a group of additional tools.
+
+        Groups: amp, arp, filter, fx, glide, global, lfo, mod, osc (one set_<parameter> tool per
+        parameter, plus all_notes_off, program_change, get_midi_status and list_devices with
+        global), batch (set_parameters, set_patch), state (get_parameter, get_patch), automation
+        (parameter ramps), clock (MIDI clock), sequencer (notes and sequences) and preset (preset
+        library and morphing).
+
+        Args:
+            group (str): Name of the group to load.
+
+        Returns:
+            dict: The group and the names of the tools it added, or an error.
+        """
+        register = groups.get(group)
+        if register is None:
+            return {'error': f'Unknown tool group: {group}. Must be one of {", ".join(groups)}.'}
+        if group in loaded:
+            return {'group': group, 'tools': []}
+
+        before = {tool.name for tool in await mcp.list_tools()}
+        register(mcp, devices)
+        loaded.add(group)
+        added = [tool.name for tool in await mcp.list_tools() if tool.name not in before]
+
+        try:
+            await ctx.session.send_tool_list_changed()
+        except Exception as e:
+            logger.debug(f'Could not notify the client of the new tools: {str(e)}')
+        return {'group': group, 'tools': added}
@@ -4,80 +4,27 @@ FX and Misc tools for controlling FX, arpeggiator, and other parameters on the M
 
 from mcp.server.fastmcp import FastMCP
 
-from moog_sub37_mcp.midi.midi_manager import MIDIManager
-
-
-def register_fx_tools(mcp: FastMCP, midi: MIDIManager):
+from moog_sub37_mcp.midi.device_pool import DevicePool
+from moog_sub37_mcp.midi.parameters import ON_OFF, OSC_SELECT, cc, section_parameters
+from moog_sub37_mcp.tools.parameter_tools import register_parameter_tools
+
+FX_PARAMETERS = section_parameters(
+    'fx',
+    cc('hold_pedal', 64, 'Hold Pedal/Sustain', labels=ON_OFF),
+    cc('glide', 65, 'Glide On/Off', labels=ON_OFF),
+    cc('arpeggiator_latch', 69, 'Arpeggiator Latch', labels=ON_OFF),
+    cc('arp_on_off', 73, 'Arpeggiator On/Off', labels=ON_OFF),
+    cc('glide_dest_osc', 102, 'Glide Destination OSC 1/2/BOTH', labels=OSC_SELECT),
+    cc('filter_eg_multi_trig', 112, 'Filter EG Multi Trig', labels=ON_OFF),
+)
+
+
+def register_fx_tools(mcp: FastMCP, devices: DevicePool):
     """
     Register all FX, arpeggiator, and misc tools with the MCP server.
 
     Args:
         mcp: The MCP server instance
-        midi: The MIDI interface
+        devices: The instruments
     """
-
-    @mcp.tool()
-    def set_hold_pedal(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the Hold Pedal/Sustain.
-
-        Args:
-            value (int): Value for Hold Pedal (0 = OFF, 64 = ON).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 64, value)
-
-    @mcp.tool()
-    def set_glide(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the Glide On/Off.
-
-        Args:
-            value (int): Value for Glide (0 = OFF, 64 = ON).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 65, value)
-
-    @mcp.tool()
-    def set_arpeggiator_latch(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the Arpeggiator Latch.
-
-        Args:
-            value (int): Value for Arpeggiator Latch (0 = OFF, 64 = ON).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 69, value)
-
-    @mcp.tool()
-    def set_arp_on_off(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the Arpeggiator On/Off.
-
-        Args:
-            value (int): Value for Arpeggiator (0 = OFF, 64 = ON).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 73, value)
-
-    @mcp.tool()
-    def set_glide_dest_osc(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the Glide Destination OSC 1/2/BOTH.
-
-        Args:
-            value (int): Value for Glide Destination (0 = OSC1 + OSC2, 43 = OSC1, 85 = OSC2).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 102, value)
-
-    @mcp.tool()
-    def set_filter_eg_multi_trig(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the Filter EG Multi Trig.
-
-        Args:
-            value (int): Value for Filter EG Multi Trig (0 = OFF, 64 = ON).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 112, value)
+    register_parameter_tools(mcp, devices, FX_PARAMETERS)
@@ -2,125 +2,100 @@
 Global and utility tools for controlling global parameters on the Moog Sub 37.
 """
 
-from mcp.server.fastmcp import FastMCP
-
-from moog_sub37_mcp.midi.midi_manager import MIDIManager
+from typing import Any, Optional
 
+from mcp.server.fastmcp import FastMCP
 
-def register_global_tools(mcp: FastMCP, midi: MIDIManager):
+from moog_sub37_mcp.midi.device_pool import DevicePool
+from moog_sub37_mcp.midi.parameters import cc, cc14, section_parameters
+from moog_sub37_mcp.tools.parameter_tools import register_parameter_tools
+
+GLOBAL_PARAMETERS = section_parameters(
+    'global',
+    cc('mod_wheel', 1, 'Mod Wheel'),
+    cc14('mod_wheel_high_res', 1, 33, 'Mod Wheel'),
+    cc('bank_select', 0, 'Bank Select (MSB)', note='should always be 0'),
+    cc('bank_select_lsb', 32, 'Bank Select (LSB)', max_value=1, labels=((0, 'Banks 1–8'), (1, 'Banks 9–16'))),
+    cc(
+        'kb_octave',
+        89,
+        'Keyboard Octave',
+        labels=((0, '-2 Oct'), (26, '-1 Oct'), (51, '+0 Oct'), (77, '+1 Oct'), (102, '+2 Oct')),
+    ),
+    cc('local_control', 122, 'Local Control', labels=((0, 'OFF'), (127, 'ON'))),
+    cc('master_volume', 7, 'Master Volume'),
+    cc14('master_volume_high_res', 7, 39, 'Master Volume'),
+    cc('kb_transpose', 119, 'Keyboard Transpose', note='-12 to +13 semitones, receive only'),
+)
+
+
+def register_global_tools(mcp: FastMCP, devices: DevicePool):
     """
     Register all global and utility tools with the MCP server.
 
     Args:
         mcp: The MCP server instance
-        midi: The MIDI interface
+        devices: The instruments
     """
+    register_parameter_tools(mcp, devices, GLOBAL_PARAMETERS)
 
     @mcp.tool()
-    def set_mod_wheel(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the Mod Wheel (normal resolution).
-
-        Args:
-            value (int): Value for Mod Wheel (0-127).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 1, value)
-
-    @mcp.tool()
-    def set_mod_wheel_high_res(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the Mod Wheel (high resolution).
-
-        Args:
-            value (int): High-resolution value for Mod Wheel (0-16383).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_high_res_cc(channel, 1, 33, value)
-
-    @mcp.tool()
-    def set_bank_select(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the Bank Select (MSB).
-
-        Args:
-            value (int): Value for Bank Select (should always be 0).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 0, value)
-
-    @mcp.tool()
-    def set_bank_select_lsb(value: int, channel: int = 3):  # type: ignore
+    def all_notes_off(channel: Optional[int] = None, device: Optional[str] = None):  # type: ignore
         """
-        Set the Bank Select (LSB).
+        Send All Notes Off message.
 
         Args:
-            value (int): Value for Bank Select LSB (0 = Banks 1–8, 1 = Banks 9–16).
-            channel (int): MIDI channel (default is 3 if not specified).
+            channel (int): MIDI channel (default is the device's channel).
+            device (str): Instrument id (default is the first instrument).
         """
-        midi.send_cc(channel, 32, value)
+        try:
+            midi, channel = devices.select(device, channel)
+        except KeyError as e:
+            return {'error': e.args[0]}
+        midi.send_cc(channel, 123, 0)
 
     @mcp.tool()
-    def set_kb_octave(value: int, channel: int = 3):  # type: ignore
+    def program_change(program: int, channel: Optional[int] = None, device: Optional[str] = None):  # type: ignore
         """
-        Set the Keyboard Octave.
+        Send a Program Change to load a preset. Use set_bank_select_lsb first to choose banks 1–8 or 9–16.
 
         Args:
-            value (int): Value for Keyboard Octave (0 = -2 Oct, 26 = -1 Oct, 51 = +0 Oct, 77 = +1 Oct, 102 = +2 Oct).
-            channel (int): MIDI channel (default is 3 if not specified).
+            program (int): Program number (0-127).
+            channel (int): MIDI channel (default is the device's channel).
+            device (str): Instrument id (default is the first instrument).
         """
-        midi.send_cc(channel, 89, value)
+        try:
+            midi, channel = devices.select(device, channel)
+        except KeyError as e:
+            return {'error': e.args[0]}
+        midi.send_program_change(channel, program)
 
     @mcp.tool()
-    def set_local_control(value: int, channel: int = 3):  # type: ignore
+    def get_midi_status(device: Optional[str] = None) -> dict[str, Any]:  # type: ignore
         """
-        Set Local Control On/Off.
+        Get the MIDI connection status and output statistics of an instrument.
 
-        Args:
-            value (int): Value for Local Control (0 = OFF, 127 = ON).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 122, value)
-
-    @mcp.tool()
-    def set_master_volume(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the Master Volume (normal resolution).
+        Reports the output queue depth and the number of coalesced and dropped updates, and the
+        rate limit with the number of paced message groups and pacing delays (in seconds).
 
         Args:
-            value (int): Value for Master Volume (0-127).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 7, value)
+            device (str): Instrument id (default is the first instrument).
 
-    @mcp.tool()
-    def set_master_volume_high_res(value: int, channel: int = 3):  # type: ignore
+        Returns:
+            dict: Port name, connection state and output statistics.
         """
-        Set the Master Volume (high resolution).
-
-        Args:
-            value (int): High-resolution value for Master Volume (0-16383).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_high_res_cc(channel, 7, 39, value)
-
-    @mcp.tool()
-    def set_kb_transpose(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the Keyboard Transpose.
-
-        Args:
-            value (int): Value for Keyboard Transpose (-12 to +13 semitones, receive only).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 119, value)
+        try:
+            midi = devices.get(device).midi
+        except KeyError as e:
+            return {'error': e.args[0]}
+        return {'port': midi.port_name, 'connected': midi.connected, **midi.output_stats()}
 
     @mcp.tool()
-    def all_notes_off(channel: int = 3):  # type: ignore
+    def list_devices() -> list[dict[str, Any]]:  # type: ignore
         """
-        Send All Notes Off message.
+        List the instruments this server controls, to pass as the `device` of the other tools.
 
-        Args:
-            channel (int): MIDI channel (default is 3 if not specified).
+        Returns:
+            list: Each instrument's id, MIDI port, channel and connection state, the default one first.
         """
-        midi.send_cc(channel, 123, 0)
+        return [device.to_dict() for device in devices]
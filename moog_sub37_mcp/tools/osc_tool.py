@@ -4,359 +4,69 @@ Oscillator and Mod 2 tools for controlling oscillator and Mod 2 parameters on th
 
 from mcp.server.fastmcp import FastMCP
 
-from moog_sub37_mcp.midi.midi_manager import MIDIManager
-
-
-def register_osc_tools(mcp: FastMCP, midi: MIDIManager):  # noqa: C901
+from moog_sub37_mcp.midi.device_pool import DevicePool
+from moog_sub37_mcp.midi.parameters import ON_OFF, OSC_SELECT, cc, cc14, nrpn, section_parameters
+from moog_sub37_mcp.tools.parameter_tools import register_parameter_tools
+
+OSC_PARAMETERS = section_parameters(
+    'osc',
+    cc14('osc1_wave', 9, 41, 'OSC 1 Wave'),
+    cc14('osc2_freq', 12, 44, 'OSC 2 Frequency'),
+    cc14('osc2_beat_freq', 13, 45, 'OSC 2 Beat Frequency'),
+    cc14('osc2_wave', 14, 46, 'OSC 2 Wave'),
+    cc14('mod2_pitch_amt_cc', 15, 47, 'MOD 2 Pitch Amount'),
+    cc14('mod2_filter_amt_cc', 16, 48, 'MOD 2 Filter Amount'),
+    cc14('mod2_pgm_dest_amt_cc', 17, 49, 'MOD 2 Programmable Destination Amount'),
+    nrpn('osc1_octave', 479, 'OSC 1 OCTAVE', max_value=3),
+    nrpn('osc2_octave', 483, 'OSC 2 OCTAVE', max_value=3),
+    nrpn('osc2_hard_sync', 481, 'OSC 2 HARD SYNC', max_value=1),
+    nrpn('osc_kb_reset', 482, 'OSC KB RESET', max_value=1),
+    cc('mod2_osc_1_2_sel', 88, 'MOD 2 Oscillator 1/2 Selection', labels=OSC_SELECT),
+    cc(
+        'mod2_dest_cc',
+        92,
+        'MOD 2 Destination',
+        labels=(
+            (0, 'LF01 Rate'),
+            (18, 'VCA Level'),
+            (37, 'OSC1 Wave'),
+            (55, 'OSC1 + OSC2 Wave'),
+            (73, 'OSC2 Wave'),
+            (91, 'Noise Level'),
+            (110, 'EG Time/PGM'),
+        ),
+    ),
+    cc('pitch_bend_up_amount', 107, 'Pitch Bend Up Amount', max_value=24, note='in semitones'),
+    cc('pitch_bend_down_amount', 108, 'Pitch Bend Down Amount', max_value=24, note='in semitones'),
+    cc(
+        'filter_slopes', 109, 'Filter Slopes (Poles)', labels=((0, '-6dB'), (32, '-12dB'), (64, '-18dB'), (96, '-24dB'))
+    ),
+    cc('osc_duo_mode', 110, 'OSC Duo Mode', labels=ON_OFF),
+    cc('kb_ctrl_lo_hi', 111, 'Keyboard Control LO/HI', labels=((0, 'NEITHER'), (32, 'LO'), (64, 'HI'))),
+    nrpn('osc1_level', 489, 'OSC 1 LEVEL'),
+    cc('osc1_sub_level', 115, 'OSC 1 Sub Level'),
+    nrpn('osc2_level', 493, 'OSC 2 LEVEL'),
+    nrpn('noise_level', 496, 'NOISE LEVEL'),
+    nrpn('feedback_ext_level', 497, 'FB EXT LEVEL'),
+    nrpn('osc2_kb_ctrl', 485, 'OSC 2 KB CTRL', max_value=2),
+    nrpn('osc2_duo_mode', 486, 'OSC 2 DUO MODE'),
+    nrpn('osc2_frequency', 487, 'OSC 2 FREQUENCY'),
+    nrpn('osc2_beat', 488, 'OSC 2 BEAT', max_value=1),
+    nrpn('osc1_on', 490, 'OSC 1 ON', max_value=20),
+    nrpn('sub_osc_on', 491, 'SUB OSC ON', max_value=1),
+    nrpn('sub_osc_level', 492, 'SUB OSC LEVEL'),
+    nrpn('osc2_on', 494, 'OSC 2 ON', max_value=1),
+    nrpn('noise_on', 495, 'NOISE ON', max_value=1),
+    nrpn('fb_ext_on', 498, 'FB EXT ON', max_value=1),
+)
+
+
+def register_osc_tools(mcp: FastMCP, devices: DevicePool):
     """
     Register all oscillator and Mod 2 tools with the MCP server.
 
     Args:
         mcp: The MCP server instance
-        midi: The MIDI interface
+        devices: The instruments
     """
-
-    @mcp.tool()
-    def set_osc1_wave(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the OSC 1 Wave with high resolution.
-
-        Args:
-            value (int): High-resolution value for OSC 1 Wave (0-16383).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_high_res_cc(channel, 9, 41, value)
-
-    @mcp.tool()
-    def set_osc2_freq(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the OSC 2 Frequency with high resolution.
-
-        Args:
-            value (int): High-resolution value for OSC 2 Frequency (0-16383).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_high_res_cc(channel, 12, 44, value)
-
-    @mcp.tool()
-    def set_osc2_beat_freq(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the OSC 2 Beat Frequency with high resolution.
-
-        Args:
-            value (int): High-resolution value for OSC 2 Beat Frequency (0-16383).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_high_res_cc(channel, 13, 45, value)
-
-    @mcp.tool()
-    def set_osc2_wave(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the OSC 2 Wave with high resolution.
-
-        Args:
-            value (int): High-resolution value for OSC 2 Wave (0-16383).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_high_res_cc(channel, 14, 46, value)
-
-    @mcp.tool()
-    def set_mod2_pitch_amt_cc(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the MOD 2 Pitch Amount using high-res CC method (CC #15 [MSB], CC #47 [LSB]).
-
-        Args:
-            value (int): High-resolution value for MOD 2 Pitch Amount (0-16383).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_high_res_cc(channel, 15, 47, value)
-
-    @mcp.tool()
-    def set_mod2_filter_amt_cc(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the MOD 2 Filter Amount using high-res CC method (CC #16 [MSB], CC #48 [LSB]).
-
-        Args:
-            value (int): High-resolution value for MOD 2 Filter Amount (0-16383).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_high_res_cc(channel, 16, 48, value)
-
-    @mcp.tool()
-    def set_mod2_pgm_dest_amt_cc(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the MOD 2 Programmable Destination Amount using high-res CC method (CC #17 [MSB], CC #49 [LSB]).
-
-        Args:
-            value (int): High-resolution value for MOD 2 Programmable Destination Amount (0-16383).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_high_res_cc(channel, 17, 49, value)
-
-    @mcp.tool()
-    def set_osc1_octave(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the OSC 1 OCTAVE (NRPN 479, MSB 3, LSB 95).
-        Args:
-            value (int): Value for OSC 1 OCTAVE (0-3).
-            channel (int): MIDI channel (default is 3).
-        """
-        midi.send_nrpn(channel, 3, 95, value)
-
-    @mcp.tool()
-    def set_osc2_octave(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the OSC 2 OCTAVE (NRPN 483, MSB 3, LSB 99).
-        Args:
-            value (int): Value for OSC 2 OCTAVE (0-3).
-            channel (int): MIDI channel (default is 3).
-        """
-        midi.send_nrpn(channel, 3, 99, value)
-
-    @mcp.tool()
-    def set_osc2_hard_sync(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the OSC 2 HARD SYNC (NRPN 481, MSB 3, LSB 97).
-        Args:
-            value (int): Value for OSC 2 HARD SYNC (0-1).
-            channel (int): MIDI channel (default is 3).
-        """
-        midi.send_nrpn(channel, 3, 97, value)
-
-    @mcp.tool()
-    def set_osc_kb_reset(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the OSC KB RESET (NRPN 482, MSB 3, LSB 98).
-        Args:
-            value (int): Value for OSC KB RESET (0-1).
-            channel (int): MIDI channel (default is 3).
-        """
-        midi.send_nrpn(channel, 3, 98, value)
-
-    @mcp.tool()
-    def set_mod2_osc_1_2_sel(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the MOD 2 Oscillator 1/2 Selection.
-
-        Args:
-            value (int): Value for oscillator selection (0 = OSC1 + OSC2, 43 = OSC1, 85 = OSC2).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 88, value)
-
-    @mcp.tool()
-    def set_mod2_dest_cc(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the MOD 2 Destination selection using CC method (CC #92).
-
-        Args:
-            value (int): Value for destination selection (0 = LF01 Rate, 18 = VCA Level, 37 = OSC1 Wave, 55 = OSC1 + OSC2 Wave, 73 = OSC2 Wave, 91 = Noise Level, 110 = EG Time/PGM).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 92, value)
-
-    @mcp.tool()
-    def set_pitch_bend_up_amount(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the Pitch Bend Up Amount.
-
-        Args:
-            value (int): Value for Pitch Bend Up Amount (0-24, in semitones).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 107, value)
-
-    @mcp.tool()
-    def set_pitch_bend_down_amount(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the Pitch Bend Down Amount.
-
-        Args:
-            value (int): Value for Pitch Bend Down Amount (0-24, in semitones).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 108, value)
-
-    @mcp.tool()
-    def set_filter_slopes(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the Filter Slopes (Poles).
-
-        Args:
-            value (int): Value for Filter Slopes (0 = -6dB, 32 = -12dB, 64 = -18dB, 96 = -24dB).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 109, value)
-
-    @mcp.tool()
-    def set_osc_duo_mode(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the OSC Duo Mode On/Off.
-
-        Args:
-            value (int): Value for OSC Duo Mode (0 = OFF, 64 = ON).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 110, value)
-
-    @mcp.tool()
-    def set_kb_ctrl_lo_hi(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the Keyboard Control LO/HI.
-
-        Args:
-            value (int): Value for Keyboard Control (0 = NEITHER, 32 = LO, 64 = HI).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 111, value)
-
-    @mcp.tool()
-    def set_osc1_level(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the OSC 1 LEVEL (NRPN 489, MSB 3, LSB 105).
-        Args:
-            value (int): Value for OSC 1 LEVEL (0-1).
-            channel (int): MIDI channel (default is 3).
-        """
-        midi.send_nrpn(channel, 3, 105, value)
-
-    @mcp.tool()
-    def set_osc1_sub_level(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the OSC 1 Sub Level.
-
-        Args:
-            value (int): Value for OSC 1 Sub Level (0-127).
-            channel (int): MIDI channel (default is 3 if not specified).
-        """
-        midi.send_cc(channel, 115, value)
-
-    @mcp.tool()
-    def set_osc2_level(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the OSC 2 LEVEL (NRPN 493, MSB 3, LSB 109).
-        Args:
-            value (int): Value for OSC 2 LEVEL (0-16383).
-            channel (int): MIDI channel (default is 3).
-        """
-        midi.send_nrpn(channel, 3, 109, value)
-
-    @mcp.tool()
-    def set_noise_level(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the NOISE LEVEL (NRPN 496, MSB 3, LSB 112).
-        Args:
-            value (int): Value for NOISE LEVEL (0-16383).
-            channel (int): MIDI channel (default is 3).
-        """
-        midi.send_nrpn(channel, 3, 112, value)
-
-    @mcp.tool()
-    def set_feedback_ext_level(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the FB EXT LEVEL (NRPN 497, MSB 3, LSB 113).
-        Args:
-            value (int): Value for FB EXT LEVEL (0-16383).
-            channel (int): MIDI channel (default is 3).
-        """
-        midi.send_nrpn(channel, 3, 113, value)
-
-    @mcp.tool()
-    def set_osc2_kb_ctrl(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the OSC 2 KB CTRL (NRPN 485, MSB 3, LSB 101).
-        Args:
-            value (int): Value for OSC 2 KB CTRL (0-2).
-            channel (int): MIDI channel (default is 3).
-        """
-        midi.send_nrpn(channel, 3, 101, value)
-
-    @mcp.tool()
-    def set_osc2_duo_mode(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the OSC 2 DUO MODE (NRPN 486, MSB 3, LSB 102).
-        Args:
-            value (int): Value for OSC 2 DUO MODE (0-16383).
-            channel (int): MIDI channel (default is 3).
-        """
-        midi.send_nrpn(channel, 3, 102, value)
-
-    @mcp.tool()
-    def set_osc2_frequency(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the OSC 2 FREQUENCY (NRPN 487, MSB 3, LSB 103).
-        Args:
-            value (int): Value for OSC 2 FREQUENCY (0-2).
-            channel (int): MIDI channel (default is 3).
-        """
-        midi.send_nrpn(channel, 3, 103, value)
-
-    @mcp.tool()
-    def set_osc2_beat(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the OSC 2 BEAT (NRPN 488, MSB 3, LSB 104).
-        Args:
-            value (int): Value for OSC 2 BEAT (0-1).
-            channel (int): MIDI channel (default is 3).
-        """
-        midi.send_nrpn(channel, 3, 104, value)
-
-    @mcp.tool()
-    def set_osc1_on(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the OSC 1 ON (NRPN 490, MSB 3, LSB 106).
-        Args:
-            value (int): Value for OSC 1 ON (0-20).
-            channel (int): MIDI channel (default is 3).
-        """
-        midi.send_nrpn(channel, 3, 106, value)
-
-    @mcp.tool()
-    def set_sub_osc_on(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the SUB OSC ON (NRPN 491, MSB 3, LSB 107).
-        Args:
-            value (int): Value for SUB OSC ON (0-1).
-            channel (int): MIDI channel (default is 3).
-        """
-        midi.send_nrpn(channel, 3, 107, value)
-
-    @mcp.tool()
-    def set_sub_osc_level(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the SUB OSC LEVEL (NRPN 492, MSB 3, LSB 108).
-        Args:
-            value (int): Value for SUB OSC LEVEL (0-16383).
-            channel (int): MIDI channel (default is 3).
-        """
-        midi.send_nrpn(channel, 3, 108, value)
-
-    @mcp.tool()
-    def set_osc2_on(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the OSC 2 ON (NRPN 494, MSB 3, LSB 110).
-        Args:
-            value (int): Value for OSC 2 ON (0-1).
-            channel (int): MIDI channel (default is 3).
-        """
-        midi.send_nrpn(channel, 3, 110, value)
-
-    @mcp.tool()
-    def set_noise_on(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the NOISE ON (NRPN 495, MSB 3, LSB 111).
-        Args:
-            value (int): Value for NOISE ON (0-1).
-            channel (int): MIDI channel (default is 3).
-        """
-        midi.send_nrpn(channel, 3, 111, value)
-
-    @mcp.tool()
-    def set_fb_ext_on(value: int, channel: int = 3):  # type: ignore
-        """
-        Set the FB EXT ON (NRPN 498, MSB 3, LSB 114).
-        Args:
-            value (int): Value for FB EXT ON (0-1).
-            channel (int): MIDI channel (default is 3).
-        """
-        midi.send_nrpn(channel, 3, 114, value)
+    register_parameter_tools(mcp, devices, OSC_PARAMETERS)
@@ -0,0 +1,73 @@
+"""
+Generic tool generation from the parameter tables of the tool modules.
+"""
+
+from collections.abc import Callable, Iterable
+from typing import Any, Optional
+
+from mcp.server.fastmcp import FastMCP
+
+from moog_sub37_mcp.midi.device_pool import DEFAULT_CHANNEL, DevicePool
+from moog_sub37_mcp.midi.parameters import ParameterSpec
+
+
+def describe_parameter(spec: ParameterSpec, devices: Optional[DevicePool] = None) -> str:
+    """
+    Build the tool description of a parameter setter.
+
+    Args:
+        spec: The parameter spec
+        devices: The instruments the setter addresses (default is one instrument on channel 3)
+
+    Returns:
+        str: Description in the same format as the hand-written tool docstrings.
+    """
+    if spec.labels:
+        values = ', '.join(f'{value} = {label}' for value, label in spec.labels)
+    else:
+        values = f'{spec.min_value}-{spec.max_value}'
+    if spec.note:
+        values = f'{values}, {spec.note}'
+    description = (
+        f'Set the {spec.label} ({spec.address_text}).\nArgs:\n    value (int): Value for {spec.label} ({values}).\n'
+    )
+    if devices is not None and len(devices) > 1:
+        return (
+            f"{description}    channel (int): MIDI channel (default is the device's channel).\n"
+            f'    device (str): Instrument id (default is the first instrument).'
+        )
+    channel = devices.default.channel if devices is not None else DEFAULT_CHANNEL
+    return f'{description}    channel (int): MIDI channel (default is {channel}).'
+
+
+def _make_setter(devices: DevicePool, spec: ParameterSpec) -> Callable[..., Optional[dict[str, Any]]]:
+    # A device argument only where there is a choice, keeping the tool schemas small
+    if len(devices) == 1:
+        midi, default_channel = devices.default.midi, devices.default.channel
+
+        def set_parameter(value: int, channel: int = default_channel):  # type: ignore
+            spec.send(midi, channel, value)
+
+        return set_parameter  # type: ignore
+
+    def set_device_parameter(value: int, channel: Optional[int] = None, device: Optional[str] = None):  # type: ignore
+        try:
+            midi, channel = devices.select(device, channel)
+        except KeyError as e:
+            return {'error': e.args[0]}
+        spec.send(midi, channel, value)
+
+    return set_device_parameter  # type: ignore
+
+
+def register_parameter_tools(mcp: FastMCP, devices: DevicePool, parameters: Iterable[ParameterSpec]):
+    """
+    Register one setter tool per parameter spec with the MCP server.
+
+    Args:
+        mcp: The MCP server instance
+        devices: The instruments; the setters take a device argument if there are several
+        parameters: The parameter specs
+    """
+    for spec in parameters:
+        mcp.add_tool(_make_setter(devices, spec), name=spec.tool_name, description=describe_parameter(spec, devices))
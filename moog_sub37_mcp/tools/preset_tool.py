@@ -0,0 +1,339 @@
+"""
+Preset tools for keeping a local library of Moog Sub 37 presets and morphing between them.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from mcp.server.fastmcp import FastMCP
+
+from moog_sub37_mcp.midi.automation import DEFAULT_RATE
+from moog_sub37_mcp.midi.device_pool import DevicePool
+from moog_sub37_mcp.midi.midi_manager import MIDIManager
+from moog_sub37_mcp.midi.morph import PatchMorpher
+from moog_sub37_mcp.midi.patch import apply_patch, diff_patch
+from moog_sub37_mcp.midi.preset_library import PresetLibrary, preset_parameters
+from moog_sub37_mcp.tools.registry import PARAMETERS
+
+# Parameters stored per preset
+PRESET_PARAMETERS = preset_parameters(PARAMETERS)
+
+# Library file, overridable with the MOOG_SUB37_PRESETS environment variable
+DEFAULT_LIBRARY_PATH = Path.home() / '.moog_sub37_mcp' / 'presets.s37'
+
+# Libraries opened so far, by path
+_libraries: dict[str, PresetLibrary] = {}
+
+
+def _library() -> PresetLibrary:
+    """Open the library file on first use."""
+    path = os.environ.get('MOOG_SUB37_PRESETS', str(DEFAULT_LIBRARY_PATH))
+    library = _libraries.get(path)
+    if library is None:
+        library = _libraries[path] = PresetLibrary(path, PRESET_PARAMETERS)
+    return library
+
+
+def _select(devices: DevicePool, device: Optional[str], channel: Optional[int]) -> tuple[MIDIManager, int]:
+    """
+    Get the MIDI interface and channel a tool call addresses.
+
+    Raises:
+        ValueError: If there is no instrument with this id.
+    """
+    try:
+        return devices.select(device, channel)
+    except KeyError as e:
+        raise ValueError(e.args[0]) from None
+
+
+def _current_values(midi: MIDIManager, channel: int) -> dict[str, int]:
+    """Get the values of the current sound known to the state mirror."""
+    return midi.state.snapshot(channel, list(PRESET_PARAMETERS)) if midi.state is not None else {}
+
+
+def _sound_values(midi: MIDIManager, channel: int) -> dict[str, int]:
+    """
+    Get the values of the current sound known to the state mirror.
+
+    Raises:
+        ValueError: If no value is known.
+    """
+    values = _current_values(midi, channel)
+    if not values:
+        raise ValueError('No parameter values are known for the current sound; set some first.')
+    return values
+
+
+def _load_preset(name: str) -> dict[str, int]:
+    """
+    Get the values of a library preset.
+
+    Raises:
+        OSError: If the library cannot be read.
+        ValueError: If there is no preset with this name.
+    """
+    values = _library().load(name)
+    if values is None:
+        raise ValueError(f'Unknown preset: {name}')
+    return values
+
+
+def _morph_endpoints(
+    midi: MIDIManager, from_preset: Optional[str], to_preset: str, channel: int
+) -> tuple[dict[str, int], dict[str, int]]:
+    """
+    Get the values a morph starts from (a library preset or the current sound) and ends at.
+
+    Raises:
+        OSError: If the library cannot be read.
+        ValueError: If a preset is unknown.
+    """
+    target = _load_preset(to_preset)
+    source = _load_preset(from_preset) if from_preset is not None else _current_values(midi, channel)
+    return source, target
+
+
+def _similarity_target(
+    midi: MIDIManager,
+    name: Optional[str],
+    parameters: Optional[dict[str, int]],
+    section: Optional[str],
+    channel: int,
+) -> dict[str, int]:
+    """
+    Get the values find_similar_presets compares the library presets with.
+
+    Raises:
+        OSError: If the library cannot be read.
+        ValueError: If the preset, a parameter or the section is unknown, or a value is invalid.
+    """
+    target = _load_preset(name) if name is not None else _current_values(midi, channel)
+
+    for parameter, value in (parameters or {}).items():
+        spec = PARAMETERS.get(parameter)
+        if spec is None:
+            raise ValueError(f'Unknown parameter: {parameter}')
+        error = spec.validate(value)
+        if error:
+            raise ValueError(error)
+        target[spec.name] = value
+
+    if section is not None:
+        names = {spec.name for spec in PARAMETERS.in_section(section)}
+        if not names:
+            raise ValueError(f'Unknown section: {section}')
+        target = {parameter: value for parameter, value in target.items() if parameter in names}
+    if not target:
+        raise ValueError('No parameter values to compare with.')
+    return target
+
+
+def register_preset_tools(mcp: FastMCP, devices: DevicePool):
+    """
+    Register the preset tools with the MCP server.
+
+    Args:
+        mcp: The MCP server instance
+        devices: The instruments
+    """
+    _register_library_tools(mcp, devices)
+    _register_morph_tools(mcp, devices)
+
+
+def _register_library_tools(mcp: FastMCP, devices: DevicePool):
+    """Register the tools saving, loading, listing and searching the presets of the local library."""
+
+    @mcp.tool()
+    def save_preset(name: str, channel: Optional[int] = None, device: Optional[str] = None) -> dict[str, Any]:  # type: ignore
+        """
+        Save the current sound, as known to get_patch, in the local preset library, replacing a
+        preset of the same name.
+
+        Args:
+            name (str): Preset name (up to 32 characters).
+            channel (int): MIDI channel (default is the device's channel).
+            device (str): Instrument id (default is the first instrument).
+
+        Returns:
+            dict: The preset name, whether it is new, and the number of parameters saved, or an error.
+        """
+        try:
+            midi, channel = _select(devices, device, channel)
+            values = _sound_values(midi, channel)
+            new = _library().save(name, values)
+        except (OSError, ValueError) as e:
+            return {'error': str(e)}
+        return {'name': name, 'new': new, 'parameters': len(values)}
+
+    @mcp.tool()
+    def load_preset(
+        name: str, channel: Optional[int] = None, dry_run: bool = False, device: Optional[str] = None
+    ) -> dict[str, Any]:  # type: ignore
+        """
+        Switch the synth to a preset from the local library.
+
+        Only the parameters that differ from the current sound (as known to get_patch) are sent,
+        as one burst, so switching between similar presets takes a few milliseconds.
+
+        Args:
+            name (str): Preset name.
+            channel (int): MIDI channel (default is the device's channel).
+            dry_run (bool): Only return the changes without sending them (default is False).
+            device (str): Instrument id (default is the first instrument).
+
+        Returns:
+            dict: The preset name, the changes in sending order and whether they were sent, or an error.
+        """
+        try:
+            midi, channel = _select(devices, device, channel)
+            values = _library().load(name)
+        except (OSError, ValueError) as e:
+            return {'error': str(e)}
+        if values is None:
+            return {'error': f'Unknown preset: {name}'}
+
+        if dry_run:
+            changes, sent = diff_patch(PARAMETERS, midi.state, channel, values), False
+        else:
+            changes, sent = apply_patch(midi, PARAMETERS, channel, values)
+        return {'name': name, 'changes': [change.to_dict() for change in changes], 'sent': sent}
+
+    @mcp.tool()
+    def list_presets(match: Optional[str] = None) -> dict[str, Any]:  # type: ignore
+        """
+        List the presets of the local library.
+
+        Args:
+            match (str): Only list names containing this text, ignoring case (default is all).
+
+        Returns:
+            dict: The preset names in the order they were saved, and their count.
+        """
+        try:
+            names = _library().names()
+        except (OSError, ValueError) as e:
+            return {'error': str(e)}
+        if match is not None:
+            names = [name for name in names if match.lower() in name.lower()]
+        return {'presets': names, 'count': len(names)}
+
+    @mcp.tool()
+    def find_similar_presets(
+        name: Optional[str] = None,
+        parameters: Optional[dict[str, int]] = None,
+        section: Optional[str] = None,
+        limit: int = 5,
+        channel: Optional[int] = None,
+        device: Optional[str] = None,
+    ) -> dict[str, Any]:  # type: ignore
+        """
+        Find the library presets that sound most like a preset or the current sound.
+
+        Adjust the reference with `parameters` to search for variations, e.g. a brighter version
+        of a bass with a higher filter_cutoff.
+
+        Args:
+            name (str): Library preset to compare with (default is the current sound).
+            parameters (dict): Parameter values overriding those of the reference.
+            section (str): Only compare one section: amp, arp, filter, fx, glide, lfo, mod or osc.
+            limit (int): Number of presets to return (default is 5).
+            channel (int): MIDI channel of the current sound (default is the device's channel).
+            device (str): Instrument playing the current sound (default is the first instrument).
+
+        Returns:
+            dict: The matching presets with their similarity from 0 to 1, most similar first, or an error.
+        """
+        try:
+            midi, channel = _select(devices, device, channel)
+            target = _similarity_target(midi, name, parameters, section, channel)
+            matches = _library().nearest(target, limit, exclude=name)
+        except (OSError, ValueError) as e:
+            return {'error': str(e)}
+        return {'matches': [{'name': match, 'similarity': similarity} for match, similarity in matches]}
+
+
+def _register_morph_tools(mcp: FastMCP, devices: DevicePool):
+    """Register the tools morphing between library presets."""
+    # One morpher per MIDI interface, shared by the instruments chained on it
+    morphers = {midi: PatchMorpher(midi, PARAMETERS) for midi in devices.interfaces()}
+
+    @mcp.tool()
+    def morph_patches(
+        to_preset: str,
+        duration: float,
+        from_preset: Optional[str] = None,
+        crossover: float = 0.5,
+        curve: str = 'linear',
+        rate: float = DEFAULT_RATE,
+        channel: Optional[int] = None,
+        device: Optional[str] = None,
+    ) -> dict[str, Any]:  # type: ignore
+        """
+        Morph the sound from one library preset to another over time.
+
+        Continuous parameters (filter cutoff and resonance, envelope times, oscillator levels,
+        LFO rates...) glide between the two presets; selectors and switches (waveshape selects,
+        sync, octave...) change at the crossover point. The server streams the morph in the
+        background and returns immediately; a new morph on the channel replaces the running one.
+
+        Args:
+            to_preset (str): Library preset to morph to.
+            duration (float): Length of the morph in seconds.
+            from_preset (str): Library preset to start from (default is the current sound).
+            crossover (float): Progress from 0 to 1 at which selectors and switches change (default is 0.5).
+            curve (str): 'linear', 'exponential', 'logarithmic' or 's_curve' (default is 'linear').
+            rate (float): Updates per second (default is 50), lowered to fit the MIDI bandwidth
+                when many parameters change.
+            channel (int): MIDI channel (default is the device's channel).
+            device (str): Instrument id (default is the first instrument).
+
+        Returns:
+            dict: The started morph, with its effective rate and the number of parameters
+                interpolated and switched, or an error.
+        """
+        try:
+            midi, channel = _select(devices, device, channel)
+            source, target = _morph_endpoints(midi, from_preset, to_preset, channel)
+            morph = morphers[midi].start(
+                channel, source, target, duration, crossover, curve, rate, from_preset, to_preset
+            )
+        except (OSError, ValueError) as e:
+            return {'error': str(e)}
+        return devices.tag(midi, morph.to_dict())
+
+    @mcp.tool()
+    def stop_morph(
+        channel: Optional[int] = None, device: Optional[str] = None
+    ) -> Union[list[dict[str, Any]], dict[str, Any]]:  # type: ignore
+        """
+        Stop running morphs, leaving the sound where it is.
+
+        Args:
+            channel (int): Only stop the morph on this MIDI channel (default is all channels, or the
+                device's channel when a device is given).
+            device (str): Only stop the morph of this instrument (default is all instruments).
+
+        Returns:
+            list: The stopped morphs, or an error.
+        """
+        interfaces = list(morphers)
+        if device is not None:
+            try:
+                midi, channel = devices.select(device, channel)
+            except KeyError as e:
+                return {'error': e.args[0]}
+            interfaces = [midi]
+        return [devices.tag(midi, morph.to_dict()) for midi in interfaces for morph in morphers[midi].stop(channel)]
+
+    @mcp.tool()
+    def list_morphs() -> list[dict[str, Any]]:  # type: ignore
+        """
+        List the running morphs of every instrument.
+
+        Returns:
+            list: Each morph with its presets, progress and number of values sent, and its instrument
+                when there are several.
+        """
+        return [devices.tag(midi, morph.to_dict()) for midi, morpher in morphers.items() for morph in morpher.active()]
@@ -0,0 +1,28 @@
+"""
+Registry of every parameter exposed by the tool modules.
+"""
+
+from moog_sub37_mcp.midi.parameters import ParameterRegistry
+from moog_sub37_mcp.tools.amp_tool import AMP_PARAMETERS
+from moog_sub37_mcp.tools.arp_tool import ARP_PARAMETERS
+from moog_sub37_mcp.tools.filter_tool import FILTER_PARAMETERS
+from moog_sub37_mcp.tools.fx_tool import FX_PARAMETERS
+from moog_sub37_mcp.tools.glide_tool import GLIDE_PARAMETERS
+from moog_sub37_mcp.tools.global_tool import GLOBAL_PARAMETERS
+from moog_sub37_mcp.tools.lfo_tool import LFO_PARAMETERS
+from moog_sub37_mcp.tools.mod_tool import MOD_PARAMETERS
+from moog_sub37_mcp.tools.osc_tool import OSC_PARAMETERS
+
+PARAMETERS = ParameterRegistry(
+    (
+        *ARP_PARAMETERS,
+        *GLOBAL_PARAMETERS,
+        *MOD_PARAMETERS,
+        *OSC_PARAMETERS,
+        *LFO_PARAMETERS,
+        *FX_PARAMETERS,
+        *AMP_PARAMETERS,
+        *FILTER_PARAMETERS,
+        *GLIDE_PARAMETERS,
+    )
+)
@@ -0,0 +1,185 @@
+"""
+Sequencer tools for playing notes, note sequences, looping patterns and MIDI files
+on the Moog Sub 37, e.g. to audition a patch.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from mcp.server.fastmcp import FastMCP
+
+from moog_sub37_mcp.midi.device_pool import DevicePool
+from moog_sub37_mcp.midi.sequencer import (
+    DEFAULT_BPM,
+    DEFAULT_VELOCITY,
+    Sequencer,
+    pattern_events,
+    sequence_events,
+    single_note_events,
+)
+
+
+def _midi_dir() -> Optional[Path]:
+    """The directory MIDI files are played from, set with the MOOG_SUB37_MIDI_DIR environment variable."""
+    path = os.environ.get('MOOG_SUB37_MIDI_DIR', '')
+    return Path(path) if path else None
+
+
+def register_sequencer_tools(mcp: FastMCP, devices: DevicePool):
+    """
+    Register the sequencer tools with the MCP server.
+
+    Args:
+        mcp: The MCP server instance
+        devices: The instruments
+    """
+    # One sequencer per MIDI interface, shared by the instruments chained on it
+    sequencers = {midi: Sequencer(midi) for midi in devices.interfaces()}
+
+    @mcp.tool()
+    def play_note(
+        note: Union[int, str],
+        velocity: int = DEFAULT_VELOCITY,
+        duration: float = 0.5,
+        channel: Optional[int] = None,
+        device: Optional[str] = None,
+    ) -> dict[str, Any]:  # type: ignore
+        """
+        Play a single note, e.g. to hear the current patch.
+
+        Args:
+            note (int | str): Note number (0-127) or name such as C4 (middle C, 60), F#2 or Bb3.
+            velocity (int): Velocity (1-127, default is 100).
+            duration (float): Length of the note in seconds (default is 0.5).
+            channel (int): MIDI channel (default is the device's channel).
+            device (str): Instrument id (default is the first instrument).
+
+        Returns:
+            dict: The started playback, or an error.
+        """
+        try:
+            midi, channel = devices.select(device, channel)
+        except KeyError as e:
+            return {'error': e.args[0]}
+        try:
+            events = single_note_events(note, velocity, duration)
+            return devices.tag(midi, sequencers[midi].play(events, channel, f'note {note}').to_dict())
+        except ValueError as e:
+            return {'error': str(e)}
+
+    @mcp.tool()
+    def play_sequence(
+        notes: Optional[list[Any]] = None,
+        midi_file: Optional[str] = None,
+        bpm: float = DEFAULT_BPM,
+        channel: Optional[int] = None,
+        device: Optional[str] = None,
+    ) -> dict[str, Any]:  # type: ignore
+        """
+        Play a sequence of notes once, from a compact note list or a MIDI file.
+
+        The server streams the notes in the background and returns immediately.
+
+        Args:
+            notes (list): Notes as [pitch, velocity, start, duration] with start and duration in beats,
+                e.g. [["C3", 100, 0, 1], ["E3", 90, 1, 1], ["G3", 90, 2, 2]]. Pitches are note numbers
+                or names (C4 is middle C).
+            midi_file (str): Path of a Standard MIDI File (.mid) to play instead of `notes`. Its own tempo
+                is used. Relative to the server's MIDI file folder, when one is configured.
+            bpm (float): Tempo of `notes` in beats per minute (default is 120).
+            channel (int): MIDI channel (default is the device's channel). Notes of a MIDI file are all
+                played on it.
+            device (str): Instrument id (default is the first instrument).
+
+        Returns:
+            dict: The started playback, or an error.
+        """
+        try:
+            midi, channel = devices.select(device, channel)
+        except KeyError as e:
+            return {'error': e.args[0]}
+        try:
+            events, source = sequence_events(notes, midi_file, bpm, _midi_dir())
+            return devices.tag(midi, sequencers[midi].play(events, channel, source).to_dict())
+        except (OSError, ValueError, EOFError) as e:
+            return {'error': str(e)}
+
+    @mcp.tool()
+    def play_pattern(
+        notes: list[Any],
+        bpm: float = DEFAULT_BPM,
+        length: Optional[float] = None,
+        loops: int = 0,
+        channel: Optional[int] = None,
+        device: Optional[str] = None,
+    ) -> dict[str, Any]:  # type: ignore
+        """
+        Loop a pattern of notes, e.g. a bass line to hear while tweaking the patch.
+
+        The pattern is expanded one loop at a time, so it can run for as long as needed.
+
+        Args:
+            notes (list): Notes as [pitch, velocity, start, duration] with start and duration in beats,
+                e.g. [["C2", 110, 0, 0.5], ["C3", 80, 0.5, 0.5], ["Eb2", 100, 1, 0.5]].
+            bpm (float): Tempo in beats per minute (default is 120).
+            length (float): Length of the pattern in beats (default is the end of the last note,
+                rounded up to a whole beat).
+            loops (int): Number of repeats (default is 0, repeat until stop_playback).
+            channel (int): MIDI channel (default is the device's channel).
+            device (str): Instrument id (default is the first instrument).
+
+        Returns:
+            dict: The started playback, or an error.
+        """
+        try:
+            midi, channel = devices.select(device, channel)
+        except KeyError as e:
+            return {'error': e.args[0]}
+        try:
+            events, source = pattern_events(notes, bpm, length, loops)
+            return devices.tag(midi, sequencers[midi].play(events, channel, source).to_dict())
+        except ValueError as e:
+            return {'error': str(e)}
+
+    @mcp.tool()
+    def stop_playback(
+        playback_id: Optional[int] = None, device: Optional[str] = None
+    ) -> Union[list[dict[str, Any]], dict[str, Any]]:  # type: ignore
+        """
+        Stop playing notes, releasing any note still sounding.
+
+        Args:
+            playback_id (int): Only stop this playback (default is all).
+            device (str): Only stop playbacks of this instrument (default is all instruments).
+
+        Returns:
+            list: The stopped playbacks, or an error.
+        """
+        interfaces, channel = list(sequencers), None
+        if device is not None:
+            try:
+                midi, channel = devices.select(device, None)
+            except KeyError as e:
+                return {'error': e.args[0]}
+            interfaces = [midi]
+        return [
+            devices.tag(midi, playback.to_dict())
+            for midi in interfaces
+            for playback in sequencers[midi].stop(playback_id, channel)
+        ]
+
+    @mcp.tool()
+    def list_playbacks() -> list[dict[str, Any]]:  # type: ignore
+        """
+        List the notes, sequences and patterns playing on every instrument.
+
+        Returns:
+            list: Each playback with its source, position in seconds, notes played and sounding notes,
+                and its instrument when there are several.
+        """
+        return [
+            devices.tag(midi, playback.to_dict())
+            for midi, sequencer in sequencers.items()
+            for playback in sequencer.active()
+        ]
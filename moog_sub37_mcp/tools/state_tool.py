@@ -0,0 +1,126 @@
+"""
+State tools for reading back the parameter values known for the Moog Sub 37
+and the changes received from it.
+"""
+
+from typing import Any, Optional
+
+from mcp.server.fastmcp import FastMCP
+
+from moog_sub37_mcp.midi.device_pool import DevicePool
+from moog_sub37_mcp.midi.parameters import ParameterSpec
+from moog_sub37_mcp.midi.synth_state import SynthState
+
+
+def value_label(spec: ParameterSpec, value: int) -> Optional[str]:
+    """Name of the labelled range a value falls in, or None if the parameter has no labels."""
+    label = None
+    for start, text in spec.labels:
+        if start <= value:
+            label = text
+    return label
+
+
+def register_state_tools(mcp: FastMCP, devices: DevicePool):
+    """
+    Register the state tools with the MCP server, for the state mirrors and input listeners of the instruments.
+
+    Args:
+        mcp: The MCP server instance
+        devices: The instruments, whose MIDI interfaces all have a state mirror and listener or none
+    """
+    default = devices.default.midi
+
+    if default.listener is not None:
+
+        @mcp.tool()
+        def get_recent_changes(
+            since_id: int = 0, channel: Optional[int] = None, device: Optional[str] = None
+        ) -> dict[str, Any]:  # type: ignore
+            """
+            Get the parameter changes received from the synth, e.g. knob moves and program changes on its panel.
+
+            Call repeatedly with the returned `last_id` as `since_id` to follow changes as they happen.
+
+            Args:
+                since_id (int): Only return changes after this id (default is 0, all recent changes).
+                channel (int): Only return changes on this MIDI channel (default is all channels).
+                device (str): Instrument id (default is the first instrument).
+
+            Returns:
+                dict: The changes in arrival order (id, time, channel, kind, MIDI address, value and
+                    parameter name if known) and the last id to pass as `since_id` next time.
+            """
+            try:
+                listener = devices.get(device).midi.listener
+            except KeyError as e:
+                return {'error': e.args[0]}
+            events = listener.recent(since_id, channel)  # type: ignore[union-attr]
+            last_id = events[-1].id if events else since_id
+            return {'changes': [event.to_dict() for event in events], 'last_id': last_id}
+
+    if default.state is None:
+        return
+
+    @mcp.tool()
+    def get_parameter(name: str, channel: Optional[int] = None, device: Optional[str] = None) -> dict[str, Any]:  # type: ignore
+        """
+        Get the last known value of a parameter without querying the synth.
+
+        Values are known once set through this server or changed on the synth's panel.
+        Parameter names are the names of the per-parameter tools without the `set_` prefix.
+
+        Args:
+            name (str): Parameter name (e.g. `filter_cutoff`).
+            channel (int): MIDI channel (default is the device's channel).
+            device (str): Instrument id (default is the first instrument).
+
+        Returns:
+            dict: The parameter, its value (None if unknown), its range and the value's label if any.
+        """
+        try:
+            midi, channel = devices.select(device, channel)
+        except KeyError as e:
+            return {'parameter': name, 'error': e.args[0]}
+        state: SynthState = midi.state  # type: ignore[assignment]
+        spec = state.registry.get(name)
+        if spec is None:
+            return {'parameter': name, 'error': f'Unknown parameter: {name}'}
+
+        value = state.get(channel, spec.name)
+        result: dict[str, Any] = {
+            'parameter': spec.name,
+            'value': value,
+            'min_value': spec.min_value,
+            'max_value': spec.max_value,
+        }
+        if value is not None and spec.labels:
+            result['label'] = value_label(spec, value)
+        return result
+
+    @mcp.tool()
+    def get_patch(
+        channel: Optional[int] = None, section: Optional[str] = None, device: Optional[str] = None
+    ) -> dict[str, Any]:  # type: ignore
+        """
+        Get every known parameter value without querying the synth.
+
+        Args:
+            channel (int): MIDI channel (default is the device's channel).
+            section (str): Only include one section: amp, arp, filter, fx, glide, global, lfo, mod or osc.
+            device (str): Instrument id (default is the first instrument).
+
+        Returns:
+            dict: The channel and a map of parameter name to value for every known value.
+        """
+        try:
+            midi, channel = devices.select(device, channel)
+        except KeyError as e:
+            return {'error': e.args[0]}
+        state: SynthState = midi.state  # type: ignore[assignment]
+        sections = state.registry.sections()
+        if section is not None and section not in sections:
+            return {'error': f'Unknown section: {section}. Must be one of {", ".join(sorted(sections))}.'}
+
+        specs = state.registry.in_section(section) if section is not None else None
+        return {'channel': channel, 'parameters': state.snapshot(channel, specs)}
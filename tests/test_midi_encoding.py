@@ -0,0 +1,162 @@
+"""
+Tests of the MIDIManager encoders that skip redundant bytes: the NRPN running-status cache
+and the 14-bit CC delta.
+"""
+
+from typing import Any
+
+import mido
+import pytest
+
+from moog_sub37_mcp.midi.midi_manager import MIDIManager
+
+CHANNEL = 3
+STATUS = 0xB0 | (CHANNEL - 1)
+
+
+class FakeRtMidiOut:
+    """Stand-in for rtmidi.MidiOut recording the messages sent."""
+
+    def __init__(self):
+        self.sent: list[tuple[int, ...]] = []
+        self.fail = False
+
+    def send_message(self, message: Any) -> None:
+        if self.fail:
+            raise OSError('Port gone')
+        self.sent.append(tuple(message))
+
+
+class FakeOutput:
+    """mido output port exposing a recording rtmidi handle, like the rtmidi backend."""
+
+    def __init__(self):
+        self._rt = FakeRtMidiOut()
+
+    def close(self) -> None:
+        pass
+
+
+def _no_input(*args: Any, **kwargs: Any) -> Any:
+    raise OSError('No input port')
+
+
+@pytest.fixture
+def output(monkeypatch: pytest.MonkeyPatch) -> FakeRtMidiOut:
+    port = FakeOutput()
+    monkeypatch.setattr(mido, 'open_output', lambda name: port)
+    monkeypatch.setattr(mido, 'open_input', _no_input)
+    return port._rt
+
+
+def connect(**kwargs: Any) -> MIDIManager:
+    midi = MIDIManager('Test', bytes_per_second=None, **kwargs)
+    assert midi.connect('Test')
+    return midi
+
+
+def controllers(output: FakeRtMidiOut) -> list[tuple[int, int]]:
+    """Take the (controller, value) pairs sent on the test channel."""
+    assert all(message[0] == STATUS for message in output.sent)
+    pairs = [(message[1], message[2]) for message in output.sent]
+    output.sent.clear()
+    return pairs
+
+
+def test_nrpn_selects_the_parameter_once(output: FakeRtMidiOut):
+    midi = connect()
+    midi.send_nrpn(CHANNEL, 3, 109, 200)
+    assert controllers(output) == [(99, 3), (98, 109), (6, 1), (38, 72)]
+    midi.send_nrpn(CHANNEL, 3, 109, 201)
+    assert controllers(output) == [(6, 1), (38, 73)]
+
+
+def test_nrpn_selects_again_for_another_parameter(output: FakeRtMidiOut):
+    midi = connect()
+    midi.send_nrpn(CHANNEL, 3, 109, 0)
+    midi.send_nrpn(CHANNEL, 3, 110, 0)
+    midi.send_nrpn(CHANNEL, 3, 109, 0)
+    selections = [pair for pair in controllers(output) if pair[0] in (99, 98)]
+    assert selections == [(99, 3), (98, 109), (99, 3), (98, 110), (99, 3), (98, 109)]
+
+
+def test_nrpn_selection_is_per_channel(output: FakeRtMidiOut):
+    midi = connect()
+    midi.send_nrpn(CHANNEL, 3, 109, 0)
+    midi.send_nrpn(CHANNEL + 1, 3, 109, 0)
+    assert [message[1] for message in output.sent] == [99, 98, 6, 38, 99, 98, 6, 38]
+
+
+def test_nrpn_selects_again_after_invalidation(output: FakeRtMidiOut):
+    midi = connect()
+    midi.send_nrpn(CHANNEL, 3, 109, 0)
+    midi.invalidate_nrpn_selection(CHANNEL)
+    midi.send_nrpn(CHANNEL, 3, 109, 0)
+    assert [pair[0] for pair in controllers(output)] == [99, 98, 6, 38, 99, 98, 6, 38]
+
+
+def test_nrpn_selects_again_after_a_failed_write(output: FakeRtMidiOut):
+    midi = connect()
+    output.fail = True
+    assert not midi.send_nrpn(CHANNEL, 3, 109, 0)
+    output.fail = False
+    midi.send_nrpn(CHANNEL, 3, 109, 0)
+    assert [pair[0] for pair in controllers(output)] == [99, 98, 6, 38]
+
+
+def test_nrpn_running_status_can_be_disabled(output: FakeRtMidiOut):
+    midi = connect(nrpn_running_status=False)
+    midi.send_nrpn(CHANNEL, 3, 109, 0)
+    midi.send_nrpn(CHANNEL, 3, 109, 1)
+    assert [pair[0] for pair in controllers(output)] == [99, 98, 6, 38, 99, 98, 6, 38]
+
+
+def test_high_res_cc_sends_the_msb_first(output: FakeRtMidiOut):
+    midi = connect()
+    midi.send_high_res_cc(CHANNEL, 19, 51, 300)
+    assert controllers(output) == [(19, 2), (51, 44)]
+
+
+def test_high_res_cc_sends_the_lsb_alone_when_the_msb_is_unchanged(output: FakeRtMidiOut):
+    midi = connect()
+    midi.send_high_res_cc(CHANNEL, 19, 51, 300)
+    midi.send_high_res_cc(CHANNEL, 19, 51, 301)
+    assert controllers(output) == [(19, 2), (51, 44), (51, 45)]
+
+
+def test_high_res_cc_sends_both_halves_when_the_msb_changes(output: FakeRtMidiOut):
+    midi = connect()
+    midi.send_high_res_cc(CHANNEL, 19, 51, 300)
+    midi.send_high_res_cc(CHANNEL, 19, 51, 300 + 128)
+    midi.send_high_res_cc(CHANNEL, 19, 51, 128)
+    assert controllers(output) == [(19, 2), (51, 44), (19, 3), (51, 44), (19, 1), (51, 0)]
+
+
+def test_high_res_cc_sends_both_halves_of_a_repeated_value(output: FakeRtMidiOut):
+    midi = connect()
+    midi.send_high_res_cc(CHANNEL, 19, 51, 300)
+    midi.send_high_res_cc(CHANNEL, 19, 51, 300)
+    assert controllers(output) == [(19, 2), (51, 44), (19, 2), (51, 44)]
+
+
+def test_high_res_cc_values_are_per_channel_and_controller(output: FakeRtMidiOut):
+    midi = connect()
+    midi.send_high_res_cc(CHANNEL, 19, 51, 300)
+    midi.send_high_res_cc(CHANNEL, 20, 52, 301)
+    midi.send_high_res_cc(CHANNEL + 1, 19, 51, 301)
+    assert [message[1] for message in output.sent] == [19, 51, 20, 52, 19, 51]
+
+
+def test_high_res_cc_sends_both_halves_after_invalidation(output: FakeRtMidiOut):
+    midi = connect()
+    midi.send_high_res_cc(CHANNEL, 19, 51, 300)
+    midi.invalidate_high_res_values(CHANNEL)
+    midi.send_high_res_cc(CHANNEL, 19, 51, 301)
+    assert controllers(output) == [(19, 2), (51, 44), (19, 2), (51, 45)]
+
+
+def test_high_res_delta_can_be_disabled(output: FakeRtMidiOut):
+    midi = connect(high_res_delta=False)
+    midi.send_high_res_cc(CHANNEL, 19, 51, 300)
+    midi.send_high_res_cc(CHANNEL, 19, 51, 301)
+    assert controllers(output) == [(19, 2), (51, 44), (19, 2), (51, 45)]